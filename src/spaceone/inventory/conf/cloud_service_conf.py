@@ -1,4 +1,16 @@
 MAX_WORKER = 20
+REGION_MAX_WORKER = 5
+STREAM_QUEUE_SIZE = 100
+STREAM_PUT_TIMEOUT = 1
+TASK_DURATION_ALPHA = 0.3
+BUCKET_MAX_WORKER = 10
+IAM_MAX_WORKER = 8
+ELB_MAX_WORKER = 8
+VPC_ATTRIBUTE_MAX_WORKER = 5
+DESCRIBE_MAX_WORKER = 4
+DESCRIBE_PAGE_SIZE = 1000
+FILTER_VALUES_MAX = 200
+TAG_INDEX_PAGE_SIZE = 100
 SUPPORTED_FEATURES = ["garbage_collection"]
 SUPPORTED_SCHEDULES = ["hours"]
 SUPPORTED_RESOURCE_TYPE = [
@@ -9,6 +21,36 @@ SUPPORTED_RESOURCE_TYPE = [
 DEFAULT_REGION = "us-east-1"
 FILTER_FORMAT = []
 BOTO3_HTTPS_VERIFIED = None
+SESSION_POOL_TTL = 3600
+CACHE_DIR = None
+POLICY_DOCUMENT_CACHE_SIZE = 10000
+CLIENT_CONFIG = {
+    "retry_mode": "adaptive",
+    "max_attempts": 10,
+    "max_pool_connections": MAX_WORKER,
+    "connect_timeout": 10,
+    "read_timeout": 60,
+    "tcp_keepalive": True,
+}
+
+RATE_LIMIT_INITIAL = 20
+RATE_LIMIT_MIN = 0.5
+RATE_LIMIT_MAX = 100
+RATE_LIMIT_INCREASE = 0.5
+RATE_LIMIT_DECREASE = 0.5
+MAX_METRIC_DATA_QUERIES = 500
+
+THROTTLING_ERROR_CODES = [
+    "Throttling",
+    "ThrottlingException",
+    "ThrottledException",
+    "RequestThrottledException",
+    "TooManyRequestsException",
+    "RequestLimitExceeded",
+    "RequestThrottled",
+    "SlowDown",
+    "EC2ThrottledException",
+]
 
 CLOUD_SERVICE_GROUP_MAP = {
     "IAM": "IAMConnectorManager",
@@ -19,10 +19,9 @@ class ACMConnector(SchematicAWSConnector):
 
     def get_resources(self):
         _LOGGER.debug(f"[get_resources][account_id: {self.account_id}] START: Certificate Manager")
-        resources = []
         start_time = time.time()
 
-        resources.extend(self.set_cloud_service_types())
+        yield from self.set_cloud_service_types()
 
         collect_resources = [
             {
@@ -32,18 +31,9 @@ class ACMConnector(SchematicAWSConnector):
             }
         ]
 
-        for region_name in self.region_names:
-            try:
-                self.reset_region(region_name)
-
-                for collect_resource in collect_resources:
-                    resources.extend(self.collect_data_by_region(self.service_name, region_name, collect_resource))
-            except Exception as e:
-                error_resource_response = self.generate_error(region_name, '', e)
-                resources.append(error_resource_response)
+        yield from self.collect_data_by_regions(collect_resources)
 
         _LOGGER.debug(f'[get_resources][account_id: {self.account_id}] FINISHED: Certificate Manager ({time.time() - start_time} sec)')
-        return resources
 
     def request_data(self, region_name) -> List[Certificate]:
         cloudwatch_namespace = 'AWS/CertificateManager'
@@ -92,6 +82,11 @@ class ACMConnector(SchematicAWSConnector):
                     yield {'data': error_resource_response}
                     
     def get_tags(self, arn):
+        tags = self.get_indexed_tags('acm', arn)
+
+        if tags is not None:
+            return tags
+
         tag_response = self.client.list_tags_for_certificate(CertificateArn=arn)
         return self.convert_tags_to_dict_type(tag_response.get('Tags', []))
 
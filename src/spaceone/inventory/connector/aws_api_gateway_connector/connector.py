@@ -43,10 +43,9 @@ class APIGatewayConnector(SchematicAWSConnector):
         _LOGGER.debug(
             f"[get_resources][account_id: {self.account_id}] START: API Gateway"
         )
-        resources = []
         start_time = time.time()
 
-        resources.extend(self.set_cloud_service_types())
+        yield from self.set_cloud_service_types()
 
         collect_resources = [
             {
@@ -63,33 +62,26 @@ class APIGatewayConnector(SchematicAWSConnector):
             },
         ]
 
-        for region_name in self.region_names:
-            try:
-                self.reset_region(region_name)
-
-                for collect_resource in collect_resources:
-                    # check available apigatewayv2 region
-                    if (
-                        collect_resource["service_name"] == "apigatewayv2"
-                        and region_name in EXCLUDE_REGION
-                    ):
-                        continue
-
-                    resources.extend(
-                        self.collect_data_by_region(
-                            collect_resource["service_name"],
-                            region_name,
-                            collect_resource,
-                        )
-                    )
-            except Exception as e:
-                error_resource_response = self.generate_error(region_name, "", e)
-                resources.append(error_resource_response)
+        yield from self.collect_data_by_regions(collect_resources)
 
         _LOGGER.debug(
             f"[get_resources][account_id: {self.account_id}] FINISHED: API Gateway ({time.time() - start_time} sec)"
         )
-        return resources
+
+    def collect_region(self, region_name, collect_resources):
+        for collect_resource in collect_resources:
+            # check available apigatewayv2 region
+            if (
+                collect_resource["service_name"] == "apigatewayv2"
+                and region_name in EXCLUDE_REGION
+            ):
+                continue
+
+            yield from self.collect_data_by_region(
+                collect_resource["service_name"],
+                region_name,
+                collect_resource,
+            )
 
     def request_rest_api_data(self, region_name) -> List[RestAPI]:
         # Get REST API
@@ -110,8 +102,6 @@ class APIGatewayConnector(SchematicAWSConnector):
             for raw in data.get("items", []):
                 try:
                     _res = self.client.get_resources(restApiId=raw.get("id"), limit=500)
-                    # for avoid to API Rate limitation.
-                    time.sleep(0.5)
 
                     raw.update(
                         {
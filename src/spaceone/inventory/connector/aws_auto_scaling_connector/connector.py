@@ -27,7 +27,6 @@ from spaceone.inventory.connector.aws_auto_scaling_connector.schema.service_type
 from spaceone.inventory.libs.connector import SchematicAWSConnector
 from spaceone.inventory.conf.cloud_service_conf import *
 
-
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -43,10 +42,9 @@ class AutoScalingConnector(SchematicAWSConnector):
         _LOGGER.debug(
             f"[get_resources][account_id: {self.account_id}] START: Auto Scaling"
         )
-        resources = []
         start_time = time.time()
 
-        resources.extend(self.set_cloud_service_types())
+        yield from self.set_cloud_service_types()
 
         collect_resources = [
             {
@@ -66,26 +64,16 @@ class AutoScalingConnector(SchematicAWSConnector):
             },
         ]
 
-        for region_name in self.region_names:
-            try:
-                self._launch_configurations = []
-                self._launch_templates = []
-                self.reset_region(region_name)
-
-                for collect_resource in collect_resources:
-                    resources.extend(
-                        self.collect_data_by_region(
-                            self.service_name, region_name, collect_resource
-                        )
-                    )
-            except Exception as e:
-                error_resource_response = self.generate_error(region_name, "", e)
-                resources.append(error_resource_response)
+        yield from self.collect_data_by_regions(collect_resources)
 
         _LOGGER.debug(
             f"[get_resources][account_id: {self.account_id}] FINISHED: Auto Scaling ({time.time() - start_time} sec)"
         )
-        return resources
+
+    def collect_region(self, region_name, collect_resources):
+        self._launch_configurations = []
+        self._launch_templates = []
+        return super().collect_region(region_name, collect_resources)
 
     def request_auto_scaling_group_data(self, region_name) -> List[AutoScalingGroup]:
         self.cloud_service_type = "AutoScalingGroup"
@@ -332,7 +320,7 @@ class AutoScalingConnector(SchematicAWSConnector):
         self.cloud_service_type = "LaunchTemplate"
         cloudtrail_resource_type = "AWS::EC2::LaunchTemplate"
 
-        ec2_client = self.session.client("ec2", verify=BOTO3_HTTPS_VERIFIED)
+        ec2_client = self.get_client("ec2")
         paginator = ec2_client.get_paginator("describe_launch_templates")
         response_iterator = paginator.paginate(
             PaginationConfig={
@@ -395,43 +383,43 @@ class AutoScalingConnector(SchematicAWSConnector):
                     yield {"data": error_resource_response}
 
     def get_asg_instances(self, instances):
-        ec2_client = self.session.client("ec2", verify=BOTO3_HTTPS_VERIFIED)
+        ec2_client = self.get_client("ec2")
         max_count = 20
-        instances_from_ec2 = []
-        split_instances = [
-            instances[i : i + max_count] for i in range(0, len(instances), max_count)
+        lifecycles = self.ec2_snapshot.get_instance_lifecycles(ec2_client)
+        missing_lifecycles = {}
+
+        # terminated instances are not in the snapshot
+        missing_instance_ids = [
+            _instance.get("InstanceId")
+            for _instance in instances
+            if _instance.get("InstanceId")
+            and _instance.get("InstanceId") not in lifecycles
         ]
 
-        for instances in split_instances:
+        for instance_ids in self.divide_to_chunks(missing_instance_ids, max_count):
             try:
-                instance_ids = [
-                    _instance.get("InstanceId")
-                    for _instance in instances
-                    if _instance.get("InstanceId")
-                ]
                 response = ec2_client.describe_instances(InstanceIds=instance_ids)
 
                 for reservation in response.get("Reservations", []):
-                    instances_from_ec2.extend(reservation.get("Instances", []))
+                    for instance_from_ec2 in reservation.get("Instances", []):
+                        missing_lifecycles[instance_from_ec2.get("InstanceId")] = (
+                            instance_from_ec2.get("InstanceLifecycle", "scheduled")
+                        )
             except Exception as e:
                 _LOGGER.debug(f"[autoscaling] instance not found: {instance_ids}")
 
         for instance in instances:
-            for instance_from_ec2 in instances_from_ec2:
-                if instance_from_ec2.get("InstanceId") == instance.get("InstanceId"):
-                    instance.update(
-                        {
-                            "lifecycle": instance_from_ec2.get(
-                                "InstanceLifecycle", "scheduled"
-                            )
-                        }
-                    )
-                    break
+            instance_id = instance.get("InstanceId")
+
+            if instance_id in lifecycles:
+                instance.update({"lifecycle": lifecycles[instance_id]})
+            elif instance_id in missing_lifecycles:
+                instance.update({"lifecycle": missing_lifecycles[instance_id]})
 
         return instances
 
     def get_load_balancer_arns(self, target_group_arns):
-        elb_client = self.session.client("elbv2", verify=BOTO3_HTTPS_VERIFIED)
+        elb_client = self.get_client("elbv2")
         lb_arns = []
         max_count = 20
 
@@ -452,7 +440,7 @@ class AutoScalingConnector(SchematicAWSConnector):
         return lb_arns
 
     def get_load_balancer_info(self, lb_arns):
-        elb_client = self.session.client("elbv2", verify=BOTO3_HTTPS_VERIFIED)
+        elb_client = self.get_client("elbv2")
         max_count = 20
 
         split_lb_arns = [
@@ -475,9 +463,6 @@ class AutoScalingConnector(SchematicAWSConnector):
                     lb.update({"listeners": listeners})
                     load_balancer_data_list.append(self.get_load_balancer_data(lb))
 
-                    # avoid to API Rate limitation.
-                    time.sleep(0.5)
-
             except Exception as e:
                 _LOGGER.debug(f"[autoscaling] ELB not found: {lb_arns}")
 
@@ -504,7 +489,7 @@ class AutoScalingConnector(SchematicAWSConnector):
         }
 
     def _match_launch_template_version(self, lt):
-        ec2_client = self.session.client("ec2", verify=BOTO3_HTTPS_VERIFIED)
+        ec2_client = self.get_client("ec2")
         lt_versions = ec2_client.describe_launch_template_versions(LaunchTemplateId=lt)
         res = lt_versions.get("LaunchTemplateVersions", [])[0]
         return res
@@ -21,21 +21,20 @@ class CFConnector(SchematicAWSConnector):
 
     def get_resources(self):
         _LOGGER.debug(f"[get_resources][account_id: {self.account_id}] START: Cloudfront")
-        resources = []
         start_time = time.time()
 
-        resources.extend(self.set_cloud_service_types())
+        yield from self.set_cloud_service_types()
 
         try:
             for data in self.request_data():
                 if getattr(data, 'resource_type', None) and data.resource_type == 'inventory.ErrorResource':
                     # Error Resource
-                    resources.append(data)
+                    yield data
                 else:
                     if getattr(data, 'set_cloudwatch', None):
                         data.cloudwatch = CloudWatchModel(data.set_cloudwatch())
     
-                    resources.append(self.response_schema(
+                    yield self.response_schema(
                         {'resource': DistributionResource({
                             'name': data.domain_name,
                             'data': data,
@@ -43,13 +42,12 @@ class CFConnector(SchematicAWSConnector):
                             'tags': self.list_tags_for_resource(data.arn),
                             'reference': ReferenceModel(data.reference()),
                             'region_code': 'global'})
-                        }))
+                        })
         except Exception as e:
             resource_id = ''
-            resources.append(self.generate_error('global', resource_id, e))
+            yield self.generate_error('global', resource_id, e)
 
         _LOGGER.debug(f'[get_resources][account_id: {self.account_id}] Cloud Front Finished {time.time() - start_time} Seconds')
-        return resources
 
     def request_data(self) -> List[DistributionData]:
         cloudwatch_namespace = 'AWS/CloudFront'
@@ -80,6 +78,11 @@ class CFConnector(SchematicAWSConnector):
                     yield error_resource_response
 
     def list_tags_for_resource(self, arn):
+        tags = self.get_indexed_tags('cloudfront', arn, 'us-east-1')
+
+        if tags is not None:
+            return tags
+
         response = self.client.list_tags_for_resource(Resource=arn)
         return self.convert_tags_to_dict_type(response.get('Tags', {}).get('Items', []))
 
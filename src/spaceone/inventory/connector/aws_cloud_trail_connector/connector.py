@@ -31,11 +31,10 @@ class CloudTrailConnector(SchematicAWSConnector):
         _LOGGER.debug(
             f"[get_resources][account_id: {self.account_id}] START: CloudTrail"
         )
-        resources = []
         start_time = time.time()
 
         try:
-            resources.extend(self.set_cloud_service_types())
+            yield from self.set_cloud_service_types()
 
             # merge data
             for data in self.request_data():
@@ -44,33 +43,30 @@ class CloudTrailConnector(SchematicAWSConnector):
                     and data.resource_type == "inventory.ErrorResource"
                 ):
                     # Error Resource
-                    resources.append(data)
+                    yield data
                 else:
-                    resources.append(
-                        self.response_schema(
-                            {
-                                "resource": TrailResource(
-                                    {
-                                        "name": data.name,
-                                        "data": data,
-                                        "account": self.account_id,
-                                        "reference": ReferenceModel(data.reference()),
-                                        "region_code": data.home_region,
-                                        # 'tags': tags
-                                    }
-                                )
-                            }
-                        )
+                    yield self.response_schema(
+                        {
+                            "resource": TrailResource(
+                                {
+                                    "name": data.name,
+                                    "data": data,
+                                    "account": self.account_id,
+                                    "reference": ReferenceModel(data.reference()),
+                                    "region_code": data.home_region,
+                                    # 'tags': tags
+                                }
+                            )
+                        }
                     )
 
         except Exception as e:
             resource_id = ""
-            resources.append(self.generate_error("global", resource_id, e))
+            yield self.generate_error("global", resource_id, e)
 
         _LOGGER.debug(
             f"[get_resources][account_id: {self.account_id}] FINISHED: CloudTrail ({time.time() - start_time} sec)"
         )
-        return resources
 
     def request_data(self) -> List[Trail]:
         cloudwatch_namespace = "CloudTrailMetrics"
@@ -133,13 +129,20 @@ class CloudTrailConnector(SchematicAWSConnector):
         return {}
 
     def _list_tags(self, trails):
-        tags = []
+        """
+        Returns {ResourceId: tags} of trails, read with a list_tags call per home region.
+        """
+        tags = {}
         trails_from_region = self._sort_trail_from_region(trails)
 
         for _region in trails_from_region:
             self.reset_region(_region)
             response = self.client.list_tags(ResourceIdList=trails_from_region[_region])
-            tags.extend(response.get("ResourceTagList", []))
+
+            for _resource_tag in response.get("ResourceTagList", []):
+                tags.setdefault(_resource_tag.get("ResourceId"), {}).update(
+                    self.convert_tags_to_dict_type(_resource_tag.get("TagsList", []))
+                )
 
         return tags
 
@@ -152,17 +155,9 @@ class CloudTrailConnector(SchematicAWSConnector):
         else:
             return insight_selectors[0]
 
-    def _match_tags(self, trail_arn, tags):
-        tag_dict = {}
-
-        try:
-            for tag in tags:
-                if tag["ResourceId"] == trail_arn:
-                    tag_dict.update(self.convert_tags_to_dict_type(tag["TagsList"]))
-        except Exception as e:
-            _LOGGER.error(e)
-
-        return tag_dict
+    @staticmethod
+    def _match_tags(trail_arn, tags):
+        return dict(tags.get(trail_arn, {}))
 
     @staticmethod
     def _sort_trail_from_region(trails):
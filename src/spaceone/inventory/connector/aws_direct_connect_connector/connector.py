@@ -20,10 +20,9 @@ class DirectConnectConnector(SchematicAWSConnector):
 
     def get_resources(self):
         _LOGGER.debug(f"[get_resources][account_id: {self.account_id}] START: Direct Connect")
-        resources = []
         start_time = time.time()
 
-        resources.extend(self.set_cloud_service_types())
+        yield from self.set_cloud_service_types()
 
         collect_resources = [
             {
@@ -49,18 +48,9 @@ class DirectConnectConnector(SchematicAWSConnector):
         ]
 
         # merge data
-        for region_name in self.region_names:
-            try:
-                self.reset_region(region_name)
-
-                for collect_resource in collect_resources:
-                    resources.extend(self.collect_data_by_region(self.service_name, region_name, collect_resource))
-            except Exception as e:
-                error_resource_response = self.generate_error(region_name, '', e)
-                resources.append(error_resource_response)
+        yield from self.collect_data_by_regions(collect_resources)
 
         _LOGGER.debug(f'[get_resources][account_id: {self.account_id}] FINISHED: Direct Connect ({time.time() - start_time} sec)')
-        return resources
 
     def connection_request_data(self, region_name) -> List[Connection]:
         self.cloudservice_type = 'Connection'
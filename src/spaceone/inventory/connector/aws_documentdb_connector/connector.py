@@ -47,53 +47,54 @@ class DocumentDBConnector(SchematicAWSConnector):
         _LOGGER.debug(
             f"[get_resources][account_id: {self.account_id}] START: DocumentDB"
         )
-        resources = []
         start_time = time.time()
 
-        resources.extend(self.set_cloud_service_types())
-        for region_name in self.region_names:
-            try:
-                if region_name in EXCLUDE_REGION:
-                    continue
-
-                self.reset_region(region_name)
+        yield from self.set_cloud_service_types()
 
-                collect_resources = [
-                    {
-                        "request_method": self.request_parameter_group_data,
-                        "resource": ParameterGroupResource,
-                        "response_schema": ParameterGroupResponse,
-                    },
-                    {
-                        "request_method": self.request_subnet_group_data,
-                        "resource": SubnetGroupResource,
-                        "response_schema": SubnetGroupResponse,
-                    },
-                    {
-                        "request_method": self.request_cluster_data,
-                        "resource": ClusterResource,
-                        "response_schema": ClusterResponse,
-                        "kwargs": {
-                            "raw_instances": self._describe_instances(),
-                            "raw_snapshots": self._describe_snapshots(),
-                        },
-                    },
-                ]
+        collect_resources = [
+            {
+                "request_method": self.request_parameter_group_data,
+                "resource": ParameterGroupResource,
+                "response_schema": ParameterGroupResponse,
+            },
+            {
+                "request_method": self.request_subnet_group_data,
+                "resource": SubnetGroupResource,
+                "response_schema": SubnetGroupResponse,
+            },
+            {
+                "request_method": self.request_cluster_data,
+                "resource": ClusterResource,
+                "response_schema": ClusterResponse,
+            },
+        ]
 
-                for collect_resource in collect_resources:
-                    resources.extend(
-                        self.collect_data_by_region(
-                            self.service_name, region_name, collect_resource
-                        )
-                    )
-            except Exception as e:
-                error_resource_response = self.generate_error(region_name, "", e)
-                resources.append(error_resource_response)
+        region_names = [
+            region_name
+            for region_name in self.region_names
+            if region_name not in EXCLUDE_REGION
+        ]
+        yield from self.collect_data_by_regions(collect_resources, region_names)
 
         _LOGGER.debug(
             f"[get_resources][account_id: {self.account_id}] FINISHED: DocumentDB ({time.time() - start_time} sec)"
         )
-        return resources
+
+    def collect_region(self, region_name, collect_resources):
+        collect_resources = [
+            dict(
+                collect_resource,
+                kwargs={
+                    "raw_instances": self._describe_instances(),
+                    "raw_snapshots": self._describe_snapshots(),
+                },
+            )
+            if collect_resource["request_method"] == self.request_cluster_data
+            else collect_resource
+            for collect_resource in collect_resources
+        ]
+
+        return super().collect_region(region_name, collect_resources)
 
     def request_cluster_data(self, region_name, **kwargs) -> List[Cluster]:
         self.cloud_service_type = "Cluster"
@@ -260,6 +261,11 @@ class DocumentDBConnector(SchematicAWSConnector):
         )
 
     def request_tags(self, resource_arn):
+        tags = self.get_indexed_tags("rds", resource_arn)
+
+        if tags is not None:
+            return tags
+
         response = self.client.list_tags_for_resource(ResourceName=resource_arn)
         return self.convert_tags_to_dict_type(response.get("TagList", []))
 
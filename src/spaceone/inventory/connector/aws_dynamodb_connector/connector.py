@@ -20,7 +20,6 @@ class DynamoDBConnector(SchematicAWSConnector):
     cloud_service_types = CLOUD_SERVICE_TYPES
 
     def get_resources(self) -> List[TableResource]:
-        resources = []
         _LOGGER.debug(f"[get_resources][account_id: {self.account_id}] START: DynamoDB")
         start_time = time.time()
 
@@ -30,18 +29,11 @@ class DynamoDBConnector(SchematicAWSConnector):
             'response_schema': TableResponse
         }
 
-        resources.extend(self.set_cloud_service_types())
+        yield from self.set_cloud_service_types()
 
-        for region_name in self.region_names:
-            try:
-                self.reset_region(region_name)
-                resources.extend(self.collect_data_by_region(self.service_name, region_name, collect_resource))
-            except Exception as e:
-                error_resource_response = self.generate_error(region_name, '', e)
-                resources.append(error_resource_response)
+        yield from self.collect_data_by_regions([collect_resource])
 
         _LOGGER.debug(f'[get_resources][account_id: {self.account_id}] FINISHED: DynamoDB ({time.time() - start_time} sec)')
-        return resources
 
     def request_data(self, region_name) -> List[Table]:
         _auto_scaling_policies = None
@@ -117,7 +109,7 @@ class DynamoDBConnector(SchematicAWSConnector):
         return TimeToLive(response.get('TimeToLiveDescription'), strict=False)
 
     def describe_scaling_policies(self):
-        auto_scaling_client = self.session.client('application-autoscaling', verify=BOTO3_HTTPS_VERIFIED)
+        auto_scaling_client = self.get_client('application-autoscaling')
         response = auto_scaling_client.describe_scaling_policies(ServiceNamespace='dynamodb')
         return response.get('ScalingPolicies', [])
 
@@ -186,6 +178,11 @@ class DynamoDBConnector(SchematicAWSConnector):
                         return f'{key_name} ({match_key_attr.get(attr.get("AttributeType"))})'
 
     def request_tags(self, resource_arn):
+        tags = self.get_indexed_tags('dynamodb', resource_arn)
+
+        if tags is not None:
+            return tags
+
         response = self.client.list_tags_of_resource(ResourceArn=resource_arn)
         return self.convert_tags_to_dict_type(response.get('Tags', []))
 
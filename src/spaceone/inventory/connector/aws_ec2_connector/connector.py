@@ -32,10 +32,9 @@ class EC2Connector(SchematicAWSConnector):
 
     def get_resources(self) -> List[SecurityGroupResource]:
         _LOGGER.debug(f"[get_resources][account_id: {self.account_id}] START: EC2")
-        resources = []
         start_time = time.time()
 
-        resources.extend(self.set_cloud_service_types())
+        yield from self.set_cloud_service_types()
 
         collect_resources = [
             {
@@ -50,24 +49,11 @@ class EC2Connector(SchematicAWSConnector):
             },
         ]
 
-        for region_name in self.region_names:
-            try:
-                self.reset_region(region_name)
-
-                for collect_resource in collect_resources:
-                    resources.extend(
-                        self.collect_data_by_region(
-                            self.service_name, region_name, collect_resource
-                        )
-                    )
-            except Exception as e:
-                error_resource_response = self.generate_error(region_name, "", e)
-                resources.append(error_resource_response)
+        yield from self.collect_data_by_regions(collect_resources)
 
         _LOGGER.debug(
             f"[get_resources][account_id: {self.account_id}] FINISHED: EC2 ({time.time() - start_time} sec)"
         )
-        return resources
 
     def request_ami_data(self, region_name) -> List[Image]:
         self.cloud_service_type = "AMI"
@@ -129,7 +115,9 @@ class EC2Connector(SchematicAWSConnector):
         default_vpcs = self._get_default_vpc()
 
         # Get EC2 Instances
-        instances = self.list_instances()
+        instances_by_security_group = self.index_instances_by_security_group(
+            self.list_instances()
+        )
 
         # Get Security Group
         paginator = self.client.get_paginator("describe_security_groups")
@@ -224,7 +212,7 @@ class EC2Connector(SchematicAWSConnector):
                             "ip_permissions": inbound_rules,
                             "ip_permissions_egress": outbound_rules,
                             "instances": self.get_security_group_map_instances(
-                                raw, instances
+                                raw, instances_by_security_group
                             ),
                             "cloudtrail": self.set_cloudtrail(
                                 region_name, cloudtrail_resource_type, raw["GroupId"]
@@ -262,57 +250,37 @@ class EC2Connector(SchematicAWSConnector):
         return raw_rule
 
     def list_instances(self):
-        instances = []
-        paginator = self.client.get_paginator("describe_instances")
-        response_iterator = paginator.paginate(
-            PaginationConfig={
-                "MaxItems": 10000,
-                "PageSize": 50,
-            },
-            Filters=[
-                {
-                    "Name": "instance-state-name",
-                    "Values": [
-                        "pending",
-                        "running",
-                        "shutting-down",
-                        "stopping",
-                        "stopped",
-                    ],
-                }
-            ],
-        )
-
-        for data in response_iterator:
-            for _reservation in data.get("Reservations", []):
-                instances.extend(_reservation.get("Instances", []))
-
-        return instances
+        return self.ec2_snapshot.get_instances(self.client)
 
     def _get_default_vpc(self):
         default_vpcs = []
-        vpc_response = self.client.describe_vpcs()
-        for _vpc in vpc_response["Vpcs"]:
+        for _vpc in self.ec2_snapshot.get_vpcs(self.client):
             if _vpc.get("IsDefault", False):
                 default_vpcs.append(_vpc["VpcId"])
 
         return default_vpcs
 
-    def get_security_group_map_instances(self, security_group, instances):
-        sg_map_instances = []
+    def index_instances_by_security_group(self, instances):
+        """
+        Returns {GroupId: [Instance]} of instances.
+        Each Instance model is built once and shared by every security group of the instance.
+        """
+        instances_by_security_group = {}
 
         for instance in instances:
+            instance["instance_name"] = self.get_instance_name_from_tags(instance)
+            instance_vo = Instance(instance, strict=False)
+
             for instance_sg in instance.get("SecurityGroups", []):
-                if security_group.get("GroupId") == instance_sg.get("GroupId"):
-                    instance["instance_name"] = self.get_instance_name_from_tags(
-                        instance
-                    )
-                    sg_map_instances.append(instance)
+                instances_by_security_group.setdefault(
+                    instance_sg.get("GroupId"), []
+                ).append(instance_vo)
 
-        return [
-            Instance(sg_map_instance, strict=False)
-            for sg_map_instance in sg_map_instances
-        ]
+        return instances_by_security_group
+
+    @staticmethod
+    def get_security_group_map_instances(security_group, instances_by_security_group):
+        return list(instances_by_security_group.get(security_group.get("GroupId"), []))
 
     @staticmethod
     def _get_protocol_display(raw_protocol):
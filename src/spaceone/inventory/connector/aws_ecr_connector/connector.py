@@ -27,10 +27,9 @@ class ECRConnector(SchematicAWSConnector):
 
     def get_resources(self) -> List[ECRRepositoryResource]:
         _LOGGER.debug(f"[get_resources][account_id: {self.account_id}] START: ECR")
-        resources = []
         start_time = time.time()
 
-        resources.extend(self.set_cloud_service_types())
+        yield from self.set_cloud_service_types()
 
         collect_resource = {
             'request_method': self.request_data,
@@ -39,16 +38,9 @@ class ECRConnector(SchematicAWSConnector):
         }
 
         # merge data
-        for region_name in self.region_names:
-            try:
-                self.reset_region(region_name)
-                resources.extend(self.collect_data_by_region(self.service_name, region_name, collect_resource))
-            except Exception as e:
-                error_resource_response = self.generate_error(region_name, '', e)
-                resources.append(error_resource_response)
+        yield from self.collect_data_by_regions([collect_resource])
 
         _LOGGER.debug(f'[get_resources][account_id: {self.account_id}] FINISHED: ECR ({time.time() - start_time} sec)')
-        return resources
 
     def request_data(self, region_name) -> List[Repository]:
         cloudtrail_resource_type = 'AWS::ECR::Repository'
@@ -102,6 +94,11 @@ class ECRConnector(SchematicAWSConnector):
                 yield res
 
     def request_tags(self, resource_arn):
+        tags = self.get_indexed_tags('ecr', resource_arn)
+
+        if tags is not None:
+            return tags
+
         response = self.client.list_tags_for_resource(resourceArn=resource_arn)
         return self.convert_tags_to_dict_type(response.get('tags', []))
 
@@ -23,10 +23,9 @@ class ECSConnector(SchematicAWSConnector):
 
     def get_resources(self) -> List[ClusterResource]:
         _LOGGER.debug(f"[get_resources][account_id: {self.account_id}] START: ECS")
-        resources = []
         start_time = time.time()
 
-        resources.extend(self.set_cloud_service_types())
+        yield from self.set_cloud_service_types()
 
         collect_resource = {
             'request_method': self.request_data,
@@ -35,16 +34,9 @@ class ECSConnector(SchematicAWSConnector):
         }
 
         # merge data
-        for region_name in self.region_names:
-            try:
-                self.reset_region(region_name)
-                resources.extend(self.collect_data_by_region(self.service_name, region_name, collect_resource))
-            except Exception as e:
-                error_resource_response = self.generate_error(region_name, '', e)
-                resources.append(error_resource_response)
+        yield from self.collect_data_by_regions([collect_resource])
 
         _LOGGER.debug(f'[get_resources][account_id: {self.account_id}] FINISHED: ECS ({time.time() - start_time} sec)')
-        return resources
 
     def request_data(self, region_name) -> List[Cluster]:
         cloudtrail_resource_type = 'AWS::ECS::Cluster'
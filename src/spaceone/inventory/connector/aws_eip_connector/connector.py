@@ -18,10 +18,9 @@ class EIPConnector(SchematicAWSConnector):
 
     def get_resources(self) -> List[EIPResource]:
         _LOGGER.debug(f"[get_resources][account_id: {self.account_id}] START: EIP")
-        resources = []
         start_time = time.time()
 
-        resources.extend(self.set_cloud_service_types())
+        yield from self.set_cloud_service_types()
 
         collect_resource = {
             'request_method': self.request_data,
@@ -31,18 +30,11 @@ class EIPConnector(SchematicAWSConnector):
 
         # init cloud service type
         for cst in CLOUD_SERVICE_TYPES:
-            resources.append(cst)
+            yield cst
 
-        for region_name in self.region_names:
-            try:
-                self.reset_region(region_name)
-                resources.extend(self.collect_data_by_region(self.service_name, region_name, collect_resource))
-            except Exception as e:
-                error_resource_response = self.generate_error(region_name, '', e)
-                resources.append(error_resource_response)
+        yield from self.collect_data_by_regions([collect_resource])
 
         _LOGGER.debug(f'[get_resources][account_id: {self.account_id}] FINISHED: EIP ({time.time() - start_time} sec)')
-        return resources
 
     def request_data(self, region_name) -> List[ElasticIPAddress]:
         nat_gateways = None
@@ -89,13 +81,11 @@ class EIPConnector(SchematicAWSConnector):
                 yield {'data': error_resource_response}
 
     def _describe_nat_gateways(self):
-        response = self.client.describe_nat_gateways()
-        return response.get('NatGateways', [])
+        return self.ec2_snapshot.get_nat_gateways(self.client)
 
     def _describe_network_interfaces(self, nif_ids):
-        response = self.client.describe_network_interfaces(NetworkInterfaceIds=nif_ids)
-
-        return response.get('NetworkInterfaces', [])
+        return self.describe_all('describe_network_interfaces', 'NetworkInterfaces',
+                                 'network-interface-id', nif_ids)
 
     @staticmethod
     def _match_network_interface_public_dns(ip, network_interfaces):
@@ -22,11 +22,9 @@ class EKSConnector(SchematicAWSConnector):
 
     def get_resources(self):
         _LOGGER.debug(f"[get_resources][account_id: {self.account_id}] START: EKS")
-        resources = []
-        self.node_groups = []
         start_time = time.time()
 
-        resources.extend(self.set_cloud_service_types())
+        yield from self.set_cloud_service_types()
 
         collect_resource = {
             'request_method': self.request_data,
@@ -34,30 +32,25 @@ class EKSConnector(SchematicAWSConnector):
             'response_schema': ClusterResponse
         }
 
-        for region_name in self.region_names:
-            try:
-                self.reset_region(region_name)
-                resources.extend(self.collect_data_by_region(self.service_name, region_name, collect_resource))
-
-                # For Node Group
-                for node_group_vo in self.node_groups:
-                    resources.append(NodeGroupResponse(
-                        {'resource': NodeGroupResource({
-                            'name': node_group_vo.nodegroup_name,
-                            'launched_at': self.datetime_to_iso8601(node_group_vo.created_at),
-                            'data': node_group_vo,
-                            'tags': node_group_vo.tags,
-                            'region_code': region_name,
-                            'reference': ReferenceModel(node_group_vo.reference(region_name))})}
-                    ))
-
-                self.node_groups = []
-            except Exception as e:
-                error_resource_response = self.generate_error(region_name, '', e)
-                resources.append(error_resource_response)
+        yield from self.collect_data_by_regions([collect_resource])
 
         _LOGGER.debug(f'[get_resources][account_id: {self.account_id}] FINISHED: EKS ({time.time() - start_time} sec)')
-        return resources
+
+    def collect_region(self, region_name, collect_resources):
+        self.node_groups = []
+        yield from super().collect_region(region_name, collect_resources)
+
+        # For Node Group
+        for node_group_vo in self.node_groups:
+            yield NodeGroupResponse(
+                {'resource': NodeGroupResource({
+                    'name': node_group_vo.nodegroup_name,
+                    'launched_at': self.datetime_to_iso8601(node_group_vo.created_at),
+                    'data': node_group_vo,
+                    'tags': node_group_vo.tags,
+                    'region_code': region_name,
+                    'reference': ReferenceModel(node_group_vo.reference(region_name))})}
+            )
 
     def request_data(self, region_name) -> List[Cluster]:
         self.cloud_service_type = 'Cluster'
@@ -189,7 +182,7 @@ class EKSConnector(SchematicAWSConnector):
         return list_tags
 
     def get_auto_scaling_groups(self):
-        auto_scaling_client = self.session.client('autoscaling', verify=BOTO3_HTTPS_VERIFIED)
+        auto_scaling_client = self.get_client('autoscaling')
         paginator = auto_scaling_client.get_paginator('describe_auto_scaling_groups')
         response_iterator = paginator.paginate(
             PaginationConfig={
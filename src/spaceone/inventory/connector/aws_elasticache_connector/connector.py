@@ -19,41 +19,36 @@ class ElastiCacheConnector(SchematicAWSConnector):
 
     def get_resources(self):
         _LOGGER.debug(f"[get_resources][account_id: {self.account_id}] START: ElastiCache")
-        resources = []
         start_time = time.time()
 
-        resources.extend(self.set_cloud_service_types())
+        yield from self.set_cloud_service_types()
 
-        for region_name in self.region_names:
-            try:
-                self.reset_region(region_name)
-                cache_clusters = [cluster for cluster in self.describe_clusters()]
-
-                for memcached_vo in self.get_memcached_data(region_name, cache_clusters):
-                    if getattr(memcached_vo, 'resource_type', None) and memcached_vo.resource_type == 'inventory.ErrorResource':
-                        # Error Resource
-                        resources.append(memcached_vo)
-                    else:
-                        if getattr(memcached_vo, 'set_cloudwatch', None):
-                            memcached_vo.cloudwatch = CloudWatchModel(memcached_vo.set_cloudwatch(region_name))
-
-                        resources.append(MemcachedResponse({'resource': memcached_vo}))
-
-                for redis_vo in self.get_redis_data(region_name, cache_clusters):
-                    if getattr(redis_vo, 'resource_type', None) and redis_vo.resource_type == 'inventory.ErrorResource':
-                        # Error Resource
-                        resources.append(redis_vo)
-                    else:
-                        if getattr(redis_vo, 'set_cloudwatch', None):
-                            redis_vo.cloudwatch = CloudWatchModel(redis_vo.set_cloudwatch(region_name))
-
-                        resources.append(RedisResponse({'resource': redis_vo}))
-            except Exception as e:
-                error_resource_response = self.generate_error(region_name, '', e)
-                resources.append(error_resource_response)
+        yield from self.collect_data_by_regions([])
 
         _LOGGER.debug(f'[get_resources][account_id: {self.account_id}] FINISHED: ElastiCache ({time.time() - start_time} sec)')
-        return resources
+
+    def collect_region(self, region_name, collect_resources):
+        cache_clusters = [cluster for cluster in self.describe_clusters()]
+
+        for memcached_vo in self.get_memcached_data(region_name, cache_clusters):
+            if getattr(memcached_vo, 'resource_type', None) and memcached_vo.resource_type == 'inventory.ErrorResource':
+                # Error Resource
+                yield memcached_vo
+            else:
+                if getattr(memcached_vo, 'set_cloudwatch', None):
+                    memcached_vo.cloudwatch = CloudWatchModel(memcached_vo.set_cloudwatch(region_name))
+
+                yield MemcachedResponse({'resource': memcached_vo})
+
+        for redis_vo in self.get_redis_data(region_name, cache_clusters):
+            if getattr(redis_vo, 'resource_type', None) and redis_vo.resource_type == 'inventory.ErrorResource':
+                # Error Resource
+                yield redis_vo
+            else:
+                if getattr(redis_vo, 'set_cloudwatch', None):
+                    redis_vo.cloudwatch = CloudWatchModel(redis_vo.set_cloudwatch(region_name))
+
+                yield RedisResponse({'resource': redis_vo})
 
     def get_memcached_data(self, region_name, cache_clusters):
         self.cloud_service_type = 'Memcached'
@@ -160,6 +155,11 @@ class ElastiCacheConnector(SchematicAWSConnector):
                 yield raw
 
     def list_tags(self, arn):
+        tags = self.get_indexed_tags('elasticache', arn)
+
+        if tags is not None:
+            return tags
+
         try:
             response = self.client.list_tags_for_resource(ResourceName=arn)
             return self.convert_tags_to_dict_type(response.get('TagList', []))
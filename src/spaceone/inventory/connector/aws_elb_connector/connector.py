@@ -1,4 +1,5 @@
 import logging
+from functools import partial
 from spaceone.core.utils import *
 from spaceone.inventory.connector.aws_elb_connector.schema.data import (
     LoadBalancer,
@@ -21,7 +22,6 @@ from spaceone.inventory.libs.connector import SchematicAWSConnector
 from spaceone.inventory.libs.schema.resource import CloudWatchModel
 from spaceone.inventory.conf.cloud_service_conf import *
 
-
 _LOGGER = logging.getLogger(__name__)
 MAX_TAG_RESOURCES = 20
 
@@ -33,10 +33,9 @@ class ELBConnector(SchematicAWSConnector):
 
     def get_resources(self):
         _LOGGER.debug(f"[get_resources][account_id: {self.account_id}] START: ELB")
-        resources = []
         start_time = time.time()
 
-        resources.extend(self.set_cloud_service_types())
+        yield from self.set_cloud_service_types()
 
         collect_resources = [
             {
@@ -51,26 +50,22 @@ class ELBConnector(SchematicAWSConnector):
             },
         ]
 
-        for region_name in self.region_names:
-            try:
-                self.reset_region(region_name)
-                self.target_groups = []
-                self.load_balancers = []
-
-                for collect_resource in collect_resources:
-                    resources.extend(
-                        self.collect_data_by_region(
-                            self.service_name, region_name, collect_resource
-                        )
-                    )
-            except Exception as e:
-                error_resource_response = self.generate_error(region_name, "", e)
-                resources.append(error_resource_response)
+        yield from self.collect_data_by_regions(collect_resources)
 
         _LOGGER.debug(
             f"[get_resources][account_id: {self.account_id}] FINISHED: ELB ({time.time() - start_time} sec)"
         )
-        return resources
+
+    @property
+    def elb_max_workers(self):
+        return self.options.get("elb_max_workers", ELB_MAX_WORKER)
+
+    def collect_region(self, region_name, collect_resources):
+        self.target_groups = []
+        self.target_groups_by_lb = {}
+        self.target_health = {}
+        self.load_balancers = []
+        return super().collect_region(region_name, collect_resources)
 
     def request_target_group_data(self, region_name):
         self.cloud_service_type = "TargetGroup"
@@ -82,7 +77,7 @@ class ELBConnector(SchematicAWSConnector):
             for raw_tg in raw_tgs
             if raw_tg.get("TargetGroupArn")
         ]
-        all_tags = []
+        all_tags = {}
 
         if tg_arns:
             all_tags = self.request_tags(tg_arns)
@@ -104,6 +99,11 @@ class ELBConnector(SchematicAWSConnector):
                 target_group_vo = TargetGroup(raw_tg, strict=False)
                 self.target_groups.append(target_group_vo)
 
+                for lb_arn in target_group_vo.load_balancer_arns or []:
+                    self.target_groups_by_lb.setdefault(lb_arn, []).append(
+                        target_group_vo
+                    )
+
                 yield {
                     "data": target_group_vo,
                     "instance_type": target_group_vo.target_type,
@@ -121,13 +121,14 @@ class ELBConnector(SchematicAWSConnector):
 
     def request_load_balancer_data(self, region_name):
         self.cloud_service_type = "LoadBalancer"
-        cloudtrail_resource_type = "AWS::ElasticLoadBalancingV2::LoadBalancer"
 
-        all_tags = []
+        all_tags = {}
         raw_lbs = self.request_loadbalancer(region_name)
 
         # Get EC2 Instances
         instances = self.request_instances(region_name)
+        instances_by_id = {instance["InstanceId"]: instance for instance in instances}
+        instances_by_ip = self.index_instances_by_private_ip(instances)
 
         lb_arns = [
             raw_lb.get("LoadBalancerArn")
@@ -138,108 +139,118 @@ class ELBConnector(SchematicAWSConnector):
         if lb_arns:
             all_tags = self.request_tags(lb_arns)
 
-        for raw_lb in raw_lbs:
-            try:
-                match_instances = []
+        self.describe_target_healths(
+            {
+                target_group.target_group_arn
+                for lb_arn in lb_arns
+                for target_group in self.match_target_group_from_lb(lb_arn)
+            }
+        )
 
-                match_target_groups = self.match_target_group_from_lb(
-                    raw_lb.get("LoadBalancerArn")
-                )
-                match_tags = self.search_tags(all_tags, raw_lb.get("LoadBalancerArn"))
-                raw_listeners = self.request_listeners(raw_lb.get("LoadBalancerArn"))
+        yield from self.enrich_concurrently(
+            partial(
+                self.request_load_balancer,
+                region_name,
+                all_tags,
+                instances_by_id,
+                instances_by_ip,
+            ),
+            raw_lbs,
+            self.elb_max_workers,
+        )
 
-                for match_tg in match_target_groups:
-                    match_instances.extend(self.match_elb_instance(match_tg, instances))
+    def request_load_balancer(
+        self, region_name, all_tags, instances_by_id, instances_by_ip, raw_lb
+    ):
+        cloudtrail_resource_type = "AWS::ElasticLoadBalancingV2::LoadBalancer"
 
-                # Generate custom stats data
-                stats = {"instances_size": len(match_instances)}
+        try:
+            match_instances = []
 
-                raw_lb.update(
-                    {
-                        "region_name": region_name,
-                        "listeners": list(
-                            map(
-                                lambda _listener: Listener(_listener, strict=False),
-                                raw_listeners,
-                            )
-                        ),
-                        "cloudwatch": self.elb_cloudwatch(raw_lb, region_name),
-                        "cloudtrail": self.set_cloudtrail(
-                            region_name,
-                            cloudtrail_resource_type,
-                            raw_lb["LoadBalancerArn"],
-                        ),
-                        "target_groups": match_target_groups,
-                        "instances": match_instances,
-                        "stats": stats,
-                    }
+            match_target_groups = self.match_target_group_from_lb(
+                raw_lb.get("LoadBalancerArn")
+            )
+            match_tags = self.search_tags(all_tags, raw_lb.get("LoadBalancerArn"))
+            raw_listeners = self.request_listeners(raw_lb.get("LoadBalancerArn"))
+
+            for match_tg in match_target_groups:
+                match_instances.extend(
+                    self.match_elb_instance(match_tg, instances_by_id, instances_by_ip)
                 )
 
-                load_balancer_vo = LoadBalancer(raw_lb, strict=False)
-                self.load_balancers.append(load_balancer_vo)
+            # Generate custom stats data
+            stats = {"instances_size": len(match_instances)}
 
-                yield {
-                    "name": load_balancer_vo.load_balancer_name,
-                    "data": load_balancer_vo,
-                    "instance_type": load_balancer_vo.type,
-                    "launched_at": self.datetime_to_iso8601(
-                        load_balancer_vo.created_time
+            raw_lb.update(
+                {
+                    "region_name": region_name,
+                    "attributes": self.request_lb_attributes(
+                        raw_lb.get("LoadBalancerArn")
                     ),
-                    "account": self.account_id,
-                    "tags": self.convert_tags_to_dict_type(match_tags),
+                    "listeners": list(
+                        map(
+                            lambda _listener: Listener(_listener, strict=False),
+                            raw_listeners,
+                        )
+                    ),
+                    "cloudwatch": self.elb_cloudwatch(raw_lb, region_name),
+                    "cloudtrail": self.set_cloudtrail(
+                        region_name,
+                        cloudtrail_resource_type,
+                        raw_lb["LoadBalancerArn"],
+                    ),
+                    "target_groups": match_target_groups,
+                    "instances": match_instances,
+                    "stats": stats,
                 }
+            )
+
+            load_balancer_vo = LoadBalancer(raw_lb, strict=False)
+            self.load_balancers.append(load_balancer_vo)
+
+            yield {
+                "name": load_balancer_vo.load_balancer_name,
+                "data": load_balancer_vo,
+                "instance_type": load_balancer_vo.type,
+                "launched_at": self.datetime_to_iso8601(load_balancer_vo.created_time),
+                "account": self.account_id,
+                "tags": self.convert_tags_to_dict_type(match_tags),
+            }
 
-                # for avoid to API Rate limitation.
-                time.sleep(0.5)
-
-            except Exception as e:
-                resource_id = raw_lb.get("LoadBalancerArn", "")
-                error_resource_response = self.generate_error(
-                    region_name, resource_id, e
-                )
-                yield {"data": error_resource_response}
+        except Exception as e:
+            resource_id = raw_lb.get("LoadBalancerArn", "")
+            error_resource_response = self.generate_error(
+                region_name, resource_id, e, "LoadBalancer"
+            )
+            yield {"data": error_resource_response}
 
-    def match_elb_instance(self, target_group, instances):
+    def match_elb_instance(self, target_group, instances_by_id, instances_by_ip):
         match_instances = []
 
-        for target_health in self.request_target_health(target_group.target_group_arn):
+        for target_health in self.describe_target_health(target_group.target_group_arn):
             target_id = target_health.get("Target", {}).get("Id")
 
-            for instance in instances:
-                if target_group.target_type == "instance":
-                    if instance["InstanceId"] == target_id:
-                        instance.update(
-                            {
-                                "instance_name": self.get_instance_name_from_tag(
-                                    instance
-                                ),
-                                "target_group_arn": target_group.target_group_arn,
-                                "target_group_name": target_group.target_group_name,
-                            }
-                        )
-
-                        match_instances.append(Instance(instance, strict=False))
-                elif target_group.target_type == "ip":
-                    for network_interface in instance.get("NetworkInterfaces", []):
-                        for private_ip_addr_info in network_interface.get(
-                            "PrivateIpAddresses", []
-                        ):
-                            if (
-                                private_ip_addr_info.get("PrivateIpAddress")
-                                == target_id
-                            ):
-                                instance.update(
-                                    {
-                                        "instance_name": self.get_instance_name_from_tag(
-                                            instance
-                                        ),
-                                        "target_group_arn": target_group.target_group_arn,
-                                        "target_group_name": target_group.target_group_name,
-                                    }
-                                )
-
-                                match_instances.append(Instance(instance, strict=False))
-                                break
+            if target_group.target_type == "instance":
+                match_target_instances = (
+                    [instances_by_id[target_id]] if target_id in instances_by_id else []
+                )
+            elif target_group.target_type == "ip":
+                match_target_instances = instances_by_ip.get(target_id, [])
+            else:
+                match_target_instances = []
+
+            for instance in match_target_instances:
+                match_instances.append(
+                    Instance(
+                        dict(
+                            instance,
+                            instance_name=self.get_instance_name_from_tag(instance),
+                            target_group_arn=target_group.target_group_arn,
+                            target_group_name=target_group.target_group_name,
+                        ),
+                        strict=False,
+                    )
+                )
 
         return match_instances
 
@@ -255,13 +266,30 @@ class ELBConnector(SchematicAWSConnector):
 
         for data in response_iterator:
             for raw in data.get("LoadBalancers", []):
-                raw["attributes"] = self.request_lb_attributes(
-                    raw.get("LoadBalancerArn")
-                )
                 load_balancers.append(raw)
 
         return load_balancers
 
+    def describe_target_healths(self, target_group_arns):
+        """
+        Prefetches the target health of target_group_arns into target_health on DESCRIBE_MAX_WORKER threads.
+        describe_target_health calls the ones which failed again on its own.
+        """
+        self.fetch_concurrently(
+            self.request_target_health,
+            target_group_arns,
+            self.target_health,
+            DESCRIBE_MAX_WORKER,
+        )
+
+    def describe_target_health(self, target_group_arn):
+        if target_group_arn not in self.target_health:
+            self.target_health[target_group_arn] = self.request_target_health(
+                target_group_arn
+            )
+
+        return self.target_health[target_group_arn]
+
     def request_target_health(self, target_group_arn):
         response = self.client.describe_target_health(TargetGroupArn=target_group_arn)
         return response.get("TargetHealthDescriptions", [])
@@ -277,11 +305,18 @@ class ELBConnector(SchematicAWSConnector):
         )
         for data in response_iterator:
             for raw in data.get("TargetGroups", []):
-                raw["attributes"] = self.request_target_group_attributes(
-                    raw.get("TargetGroupArn")
-                )
                 target_groups.append(raw)
 
+        for raw, attributes in zip(
+            target_groups,
+            self.map_concurrently(
+                self.request_target_group_attributes,
+                [raw.get("TargetGroupArn") for raw in target_groups],
+                self.elb_max_workers,
+            ),
+        ):
+            raw["attributes"] = attributes
+
         return target_groups
 
     def request_listeners(self, lb_arn):
@@ -289,56 +324,35 @@ class ELBConnector(SchematicAWSConnector):
         return response.get("Listeners", [])
 
     def request_tags(self, resource_arns):
-        all_tags = []
-
-        for _arns in self.divide_to_chunks(resource_arns, MAX_TAG_RESOURCES):
-            response = self.client.describe_tags(ResourceArns=_arns)
-            all_tags.extend(response.get("TagDescriptions", []))
+        """
+        Returns {ResourceArn: Tags} of resource_arns.
+        describe_tags takes at most MAX_TAG_RESOURCES arns, so the chunks are fetched concurrently.
+        """
+        all_tags = {}
+
+        for tag_descriptions in self.map_concurrently(
+            self.describe_tags,
+            self.divide_to_chunks(resource_arns, MAX_TAG_RESOURCES),
+            DESCRIBE_MAX_WORKER,
+        ):
+            for tag_description in tag_descriptions:
+                all_tags.setdefault(
+                    tag_description.get("ResourceArn"),
+                    tag_description.get("Tags", []),
+                )
 
         return all_tags
 
-    def match_target_group_from_lb(self, load_balancer_arn):
-        match_target_groups = []
-
-        for _tg in self.target_groups:
-            if _tg.load_balancer_arns:
-                for _tg_lb_arn in _tg.load_balancer_arns:
-                    if _tg_lb_arn == load_balancer_arn:
-                        match_target_groups.append(_tg)
+    def describe_tags(self, resource_arns):
+        response = self.client.describe_tags(ResourceArns=resource_arns)
+        return response.get("TagDescriptions", [])
 
-        return match_target_groups
+    def match_target_group_from_lb(self, load_balancer_arn):
+        return list(self.target_groups_by_lb.get(load_balancer_arn, []))
 
     def request_instances(self, region_name):
-        ec2_client = self.session.client(
-            "ec2", region_name=region_name, verify=BOTO3_HTTPS_VERIFIED
-        )
-
-        instances = []
-        paginator = ec2_client.get_paginator("describe_instances")
-        response_iterator = paginator.paginate(
-            PaginationConfig={
-                "MaxItems": 10000,
-                "PageSize": 50,
-            },
-            Filters=[
-                {
-                    "Name": "instance-state-name",
-                    "Values": [
-                        "pending",
-                        "running",
-                        "shutting-down",
-                        "stopping",
-                        "stopped",
-                    ],
-                }
-            ],
-        )
-
-        for data in response_iterator:
-            for _reservation in data.get("Reservations", []):
-                instances.extend(_reservation.get("Instances", []))
-
-        return instances
+        ec2_client = self.get_client("ec2", region_name)
+        return self.ec2_snapshot.get_instances(ec2_client)
 
     def request_lb_attributes(self, lb_arn):
         attribute_info = {}
@@ -459,11 +473,29 @@ class ELBConnector(SchematicAWSConnector):
 
     @staticmethod
     def search_tags(all_tags, resource_arn):
-        for tag in all_tags:
-            if tag.get("ResourceArn") == resource_arn:
-                return tag.get("Tags", [])
+        return all_tags.get(resource_arn, [])
 
-        return []
+    @staticmethod
+    def index_instances_by_private_ip(instances):
+        """
+        Returns {PrivateIpAddress: [instance]} of every network interface of instances, in instance order.
+        """
+        instances_by_ip = {}
+
+        for instance in instances:
+            for network_interface in instance.get("NetworkInterfaces", []):
+                private_ips = []
+
+                for private_ip_addr_info in network_interface.get(
+                    "PrivateIpAddresses", []
+                ):
+                    private_ip = private_ip_addr_info.get("PrivateIpAddress")
+
+                    if private_ip not in private_ips:
+                        private_ips.append(private_ip)
+                        instances_by_ip.setdefault(private_ip, []).append(instance)
+
+        return instances_by_ip
 
     @staticmethod
     def get_instance_name_from_tag(instance):
@@ -0,0 +1,129 @@
+import logging
+
+_LOGGER = logging.getLogger(__name__)
+
+AUTHORIZATION_DETAILS_FILTER = [
+    "User",
+    "Group",
+    "Role",
+    "LocalManagedPolicy",
+    "AWSManagedPolicy",
+]
+
+
+class AccountAuthorizationDetails:
+    """
+    In-memory snapshot of the users, groups, roles and managed policies of an account,
+    built from a single paginated get_account_authorization_details sweep.
+
+    users, groups and roles are indexed by name, policies by ARN.
+    AWS managed policies which are not attached to anything are dropped.
+    """
+
+    def __init__(self):
+        self.users = {}
+        self.groups = {}
+        self.roles = {}
+        self.policies = {}
+        self.group_members = {}
+        self.policy_usage = {}
+
+    @classmethod
+    def load(cls, client):
+        authorization_details = cls()
+        paginator = client.get_paginator("get_account_authorization_details")
+
+        for response in paginator.paginate(Filter=AUTHORIZATION_DETAILS_FILTER):
+            for user in response.get("UserDetailList", []):
+                authorization_details.add_user(user)
+
+            for group in response.get("GroupDetailList", []):
+                authorization_details.add_group(group)
+
+            for role in response.get("RoleDetailList", []):
+                authorization_details.add_role(role)
+
+            for policy in response.get("Policies", []):
+                authorization_details.add_policy(policy)
+
+        _LOGGER.debug(
+            f"[AccountAuthorizationDetails] users: {len(authorization_details.users)}, "
+            f"groups: {len(authorization_details.groups)}, roles: {len(authorization_details.roles)}, "
+            f"policies: {len(authorization_details.policies)}"
+        )
+
+        return authorization_details
+
+    def add_user(self, user):
+        user_name = user["UserName"]
+        self.users[user_name] = user
+
+        for group_name in user.get("GroupList", []):
+            self.group_members.setdefault(group_name, []).append(user)
+
+        self._add_policy_usage(user, user_name, "User")
+
+    def add_group(self, group):
+        group_name = group["GroupName"]
+        self.groups[group_name] = group
+        self._add_policy_usage(group, group_name, "Group")
+
+    def add_role(self, role):
+        role_name = role["RoleName"]
+        self.roles[role_name] = role
+        self._add_policy_usage(role, role_name, "Role")
+
+    def add_policy(self, policy):
+        if "PolicyName" not in policy:
+            # incomplete detail, the policy is fetched with the per policy calls instead
+            return
+
+        if policy["Arn"].startswith("arn:aws:iam::aws:") and not policy.get(
+            "AttachmentCount"
+        ):
+            return
+
+        self.policies[policy["Arn"]] = policy
+
+    def get_policy_info(self, policy_arn):
+        policy = self.policies.get(policy_arn)
+
+        if policy is None:
+            return None
+
+        return {
+            key: value for key, value in policy.items() if key != "PolicyVersionList"
+        }
+
+    def get_policy_versions(self, policy_arn):
+        policy = self.policies.get(policy_arn)
+
+        if policy is None:
+            return None
+
+        return [
+            {
+                "VersionId": version.get("VersionId"),
+                "IsDefaultVersion": version.get("IsDefaultVersion"),
+                "CreateDate": version.get("CreateDate"),
+            }
+            for version in policy.get("PolicyVersionList", [])
+        ]
+
+    def get_policy_document(self, policy_arn, version_id):
+        policy = self.policies.get(policy_arn)
+
+        if policy is None:
+            return None
+
+        for version in policy.get("PolicyVersionList", []):
+            if version.get("VersionId") == version_id:
+                return version.get("Document")
+
+        return None
+
+    def _add_policy_usage(self, entity, name, entity_type):
+        for attached_policy in entity.get("AttachedManagedPolicies", []):
+            self.policy_usage.setdefault(attached_policy["PolicyArn"], []).append(
+                {"name": name, "type": entity_type}
+            )
@@ -1,6 +1,7 @@
 import copy
 import time
 import logging
+from functools import partial
 from typing import List, Tuple
 from datetime import datetime, timezone
 
@@ -30,6 +31,19 @@ from spaceone.inventory.connector.aws_iam_connector.schema.resource import (
 from spaceone.inventory.connector.aws_iam_connector.schema.service_type import (
     CLOUD_SERVICE_TYPES,
 )
+from spaceone.inventory.connector.aws_iam_connector.authorization_details import (
+    AccountAuthorizationDetails,
+)
+from spaceone.inventory.connector.aws_iam_connector.credential_report import (
+    CredentialReport,
+)
+from spaceone.inventory.connector.aws_iam_connector.policy_catalog import (
+    PolicyCatalog,
+)
+from spaceone.inventory.connector.aws_iam_connector.policy_document_cache import (
+    get_policy_document_cache,
+)
+from spaceone.inventory.conf.cloud_service_conf import *
 from spaceone.inventory.libs.connector import SchematicAWSConnector
 from spaceone.inventory.libs.schema.resource import (
     ReferenceModel,
@@ -54,20 +68,30 @@ class IAMConnector(SchematicAWSConnector):
     service_name = "iam"
     cloud_service_group = "IAM"
     cloud_service_types = CLOUD_SERVICE_TYPES
+    authorization_details = None
+    credential_report = None
+    policy_document_cache = None
 
     def get_resources(self):
         _LOGGER.debug(f"[get_resources][account_id: {self.account_id}] START: IAM")
         start_time = time.time()
-        resources = []
 
         policy_errors = []
-        user_errors = []
 
-        resources.extend(self.set_cloud_service_types())
+        yield from self.set_cloud_service_types()
 
         try:
+            self.authorization_details = self.get_account_authorization_details()
+            self.credential_report = self.get_credential_report()
+            self.policy_document_cache = get_policy_document_cache(
+                self.options.get("cache_dir", CACHE_DIR),
+                self.options.get(
+                    "policy_document_cache_size", POLICY_DOCUMENT_CACHE_SIZE
+                ),
+            )
             policies, policy_errors = self.list_local_managed_policies()
-            users, access_keys, user_errors = self.request_user_data(policies)
+            users = []
+            access_keys = []
 
             for role, tags in self.request_role_data(policies):
                 if (
@@ -75,47 +99,45 @@ class IAMConnector(SchematicAWSConnector):
                     and role.resource_type == "inventory.ErrorResource"
                 ):
                     # Error Resource
-                    resources.append(role)
+                    yield role
                 else:
-                    resources.append(
-                        self.role_response_schema(
-                            {
-                                "resource": RoleResource(
-                                    {
-                                        "name": role.role_name,
-                                        "data": role,
-                                        "account": self.account_id,
-                                        "tags": self.convert_tags_to_dict_type(tags),
-                                        "reference": ReferenceModel(role.reference()),
-                                        "region_code": "global",
-                                    }
-                                )
-                            }
-                        )
+                    yield self.role_response_schema(
+                        {
+                            "resource": RoleResource(
+                                {
+                                    "name": role.role_name,
+                                    "data": role,
+                                    "account": self.account_id,
+                                    "tags": self.convert_tags_to_dict_type(tags),
+                                    "reference": ReferenceModel(role.reference()),
+                                    "region_code": "global",
+                                }
+                            )
+                        }
                     )
 
-            for user in users:
+            for user, _access_keys in self.request_user_data(policies):
                 if (
                     getattr(user, "resource_type", None)
                     and user.resource_type == "inventory.ErrorResource"
                 ):
                     # Error Resource
-                    resources.append(user)
+                    yield user
                 else:
-                    resources.append(
-                        self.user_response_schema(
-                            {
-                                "resource": UserResource(
-                                    {
-                                        "name": user.user_name,
-                                        "data": user,
-                                        "account": self.account_id,
-                                        "reference": ReferenceModel(user.reference()),
-                                        "region_code": "global",
-                                    }
-                                )
-                            }
-                        )
+                    users.append(user)
+                    access_keys.extend(_access_keys)
+                    yield self.user_response_schema(
+                        {
+                            "resource": UserResource(
+                                {
+                                    "name": user.user_name,
+                                    "data": user,
+                                    "account": self.account_id,
+                                    "reference": ReferenceModel(user.reference()),
+                                    "region_code": "global",
+                                }
+                            )
+                        }
                     )
 
             for group in self.request_group_data(users, policies):
@@ -124,22 +146,20 @@ class IAMConnector(SchematicAWSConnector):
                     and group.resource_type == "inventory.ErrorResource"
                 ):
                     # Error Resource
-                    resources.append(group)
+                    yield group
                 else:
-                    resources.append(
-                        self.group_response_schema(
-                            {
-                                "resource": GroupResource(
-                                    {
-                                        "name": group.group_name,
-                                        "data": group,
-                                        "account": self.account_id,
-                                        "reference": ReferenceModel(group.reference()),
-                                        "region_code": "global",
-                                    }
-                                )
-                            }
-                        )
+                    yield self.group_response_schema(
+                        {
+                            "resource": GroupResource(
+                                {
+                                    "name": group.group_name,
+                                    "data": group,
+                                    "account": self.account_id,
+                                    "reference": ReferenceModel(group.reference()),
+                                    "region_code": "global",
+                                }
+                            )
+                        }
                     )
 
             for policy in policies:
@@ -148,22 +168,20 @@ class IAMConnector(SchematicAWSConnector):
                     and policy.resource_type == "inventory.ErrorResource"
                 ):
                     # Error Resource
-                    resources.append(policy)
+                    yield policy
                 else:
-                    resources.append(
-                        self.policy_response_schema(
-                            {
-                                "resource": PolicyResource(
-                                    {
-                                        "name": policy.policy_name,
-                                        "data": policy,
-                                        "account": self.account_id,
-                                        "reference": ReferenceModel(policy.reference()),
-                                        "region_code": "global",
-                                    }
-                                )
-                            }
-                        )
+                    yield self.policy_response_schema(
+                        {
+                            "resource": PolicyResource(
+                                {
+                                    "name": policy.policy_name,
+                                    "data": policy,
+                                    "account": self.account_id,
+                                    "reference": ReferenceModel(policy.reference()),
+                                    "region_code": "global",
+                                }
+                            )
+                        }
                     )
 
             for identity_provider in self.request_identity_provider_data():
@@ -172,24 +190,22 @@ class IAMConnector(SchematicAWSConnector):
                     and identity_provider.resource_type == "inventory.ErrorResource"
                 ):
                     # Error Resource
-                    resources.append(identity_provider)
+                    yield identity_provider
                 else:
-                    resources.append(
-                        self.identity_provider_response_schema(
-                            {
-                                "resource": IdentityProviderResource(
-                                    {
-                                        "name": identity_provider.url,
-                                        "data": identity_provider,
-                                        "account": self.account_id,
-                                        "reference": ReferenceModel(
-                                            identity_provider.reference()
-                                        ),
-                                        "region_code": "global",
-                                    }
-                                )
-                            }
-                        )
+                    yield self.identity_provider_response_schema(
+                        {
+                            "resource": IdentityProviderResource(
+                                {
+                                    "name": identity_provider.url,
+                                    "data": identity_provider,
+                                    "account": self.account_id,
+                                    "reference": ReferenceModel(
+                                        identity_provider.reference()
+                                    ),
+                                    "region_code": "global",
+                                }
+                            )
+                        }
                     )
 
             for access_key in access_keys:
@@ -198,40 +214,37 @@ class IAMConnector(SchematicAWSConnector):
                     and access_key.resource_type == "inventory.ErrorResource"
                 ):
                     # Error Resource
-                    resources.append(access_key)
+                    yield access_key
                 else:
-                    resources.append(
-                        self.access_key_response_schema(
-                            {
-                                "resource": AccessKeyResource(
-                                    {
-                                        "name": access_key.key_id,
-                                        "data": access_key,
-                                        "account": self.account_id,
-                                        "reference": ReferenceModel(
-                                            access_key.reference()
-                                        ),
-                                        "region_code": "global",
-                                    }
-                                )
-                            }
-                        )
+                    yield self.access_key_response_schema(
+                        {
+                            "resource": AccessKeyResource(
+                                {
+                                    "name": access_key.key_id,
+                                    "data": access_key,
+                                    "account": self.account_id,
+                                    "reference": ReferenceModel(access_key.reference()),
+                                    "region_code": "global",
+                                }
+                            )
+                        }
                     )
         except Exception as e:
             resource_id = ""
-            resources.append(self.generate_error("global", resource_id, e))
+            yield self.generate_error("global", resource_id, e)
 
-        resources.extend(policy_errors)
-        resources.extend(user_errors)
+        yield from policy_errors
 
         _LOGGER.debug(
             f"[get_resources][account_id: {self.account_id}] FINISHED: IAM ({time.time() - start_time} sec)"
         )
-        return resources
+
+    @property
+    def iam_max_workers(self):
+        return self.options.get("iam_max_workers", IAM_MAX_WORKER)
 
     def request_group_data(self, users, policies) -> List[Group]:
         self.cloud_service_type = "Group"
-        cloudtrail_resource_type = "AWS::IAM::Group"
 
         paginator = self.client.get_paginator("list_groups")
         response_iterator = paginator.paginate(
@@ -240,201 +253,204 @@ class IAMConnector(SchematicAWSConnector):
                 "PageSize": 50,
             }
         )
+        groups = [
+            group for data in response_iterator for group in data.get("Groups", [])
+        ]
 
-        for data in response_iterator:
-            for group in data.get("Groups", []):
-                try:
-                    group_name = group.get("GroupName")
-                    group_user_info = self.list_user_with_group_name(group_name)
-                    matched_users = self._get_matched_users_with_attached_user_info(
-                        users, group_user_info
-                    )
-                    policy_infos = self.list_policy_with_group_name(group_name)
-                    matched_policies = (
-                        self.get_matched_policies_with_attached_policy_info(
-                            policies, policy_infos
-                        )
-                    )
+        yield from self.enrich_concurrently(
+            partial(self.request_group, users=users, policies=policies),
+            groups,
+            self.iam_max_workers,
+        )
 
-                    group.update(
-                        {
-                            "users": matched_users,
-                            "user_count": len(group_user_info),
-                            "attached_permission": matched_policies,
-                            "cloudtrail": self.set_cloudtrail(
-                                "us-east-1",
-                                cloudtrail_resource_type,
-                                group["GroupName"],
-                            ),
-                        }
-                    )
+    def request_group(self, group, users, policies):
+        cloudtrail_resource_type = "AWS::IAM::Group"
 
-                    yield Group(group, strict=False)
-                except Exception as e:
-                    resource_id = group.get("Arn", "")
-                    error_resource_response = self.generate_error(
-                        "global", resource_id, e
-                    )
-                    yield error_resource_response
+        try:
+            group_name = group.get("GroupName")
+            group_user_info = self.list_user_with_group_name(group_name)
+            matched_users = self._get_matched_users_with_attached_user_info(
+                users, group_user_info
+            )
+            policy_infos = self.list_policy_with_group_name(group_name)
+            matched_policies = self.get_matched_policies_with_attached_policy_info(
+                policies, policy_infos
+            )
+
+            group.update(
+                {
+                    "users": matched_users,
+                    "user_count": len(group_user_info),
+                    "attached_permission": matched_policies,
+                    "cloudtrail": self.set_cloudtrail(
+                        "us-east-1",
+                        cloudtrail_resource_type,
+                        group["GroupName"],
+                    ),
+                }
+            )
+
+            yield Group(group, strict=False)
+        except Exception as e:
+            resource_id = group.get("Arn", "")
+            error_resource_response = self.generate_error(
+                "global", resource_id, e, "Group"
+            )
+            yield error_resource_response
 
     def request_user_data(self, policies):
         self.cloud_service_type = "User"
-        cloudtrail_resource_type = "AWS::IAM::User"
 
         paginator = self.client.get_paginator("list_users")
         query = self._generate_default_query()
         response_iterator = paginator.paginate(**query)
+        users = [user for data in response_iterator for user in data.get("Users", [])]
 
-        users = []
-        access_keys = []
-        errors = []
+        yield from self.enrich_concurrently(
+            partial(self.request_user, policies=policies), users, self.iam_max_workers
+        )
 
-        for data in response_iterator:
-            for user in data.get("Users", []):
-                try:
-                    user_name = user.get("UserName")
-                    user_arn = user.get("Arn")
-                    user_info = self.get_user_info(user_name)
-                    mfa_devices = self.list_mfa_devices(user_name)
-                    _access_keys = self.list_access_keys(user_name, user_arn)
-                    login_profile = self.get_login_profile(user_name)
-                    groups = self.list_groups_with_user_name(user_name)
-
-                    self._conditional_update_for_password_last_used(user, user_info)
-                    self.conditional_update_for_access_key_age_and_access_key_age_display(
-                        user, _access_keys
-                    )
-                    (
-                        code_commit_credential,
-                        cassandra_credential,
-                    ) = self.list_service_specific_credentials(user_name)
-                    last_active_age, last_activity = self._get_age_and_age_display(
-                        user_info.get("PasswordLastUsed", None)
-                    )
-                    sign_in_link = self._get_sign_in_link(user_info.get("Arn"))
+    def request_user(self, user, policies):
+        """
+        Yields (User, [AccessKey, ...]), or (ErrorResourceResponse, []) when it fails.
+        """
+        cloudtrail_resource_type = "AWS::IAM::User"
 
-                    attached_policies = self.list_attached_policy_to_user(user_name)
-                    matching_policies = (
-                        self.get_matched_policies_with_attached_policy_info(
-                            policies, attached_policies
-                        )
-                    )
+        try:
+            user_name = user.get("UserName")
+            user_arn = user.get("Arn")
+            user_info = self.get_user_info(user_name, user)
+            mfa_devices = self.list_mfa_devices(user_name)
+            _access_keys = self.list_access_keys(user_name, user_arn)
+            login_profile = self.get_login_profile(user_name)
+            groups = self.list_groups_with_user_name(user_name)
+
+            self._conditional_update_for_password_last_used(user, user_info)
+            self.conditional_update_for_access_key_age_and_access_key_age_display(
+                user, _access_keys
+            )
+            (
+                code_commit_credential,
+                cassandra_credential,
+            ) = self.list_service_specific_credentials(user_name)
+            last_active_age, last_activity = self._get_age_and_age_display(
+                user_info.get("PasswordLastUsed", None)
+            )
+            sign_in_link = self._get_sign_in_link(user_info.get("Arn"))
 
-                    user.update(
-                        {
-                            "access_key": _access_keys,
-                            "ssh_public_key": self.list_ssh_keys(user_name),
-                            "code_commit_credential": code_commit_credential,
-                            "cassandra_credential": cassandra_credential,
-                            "mfa_device": (
-                                "Virtual" if len(mfa_devices) > 0 else "Not enabled"
-                            ),
-                            "last_active_age": last_active_age,
-                            "last_activity": last_activity,
-                            "policies": matching_policies,
-                            "groups_display": (
-                                groups[0].get("GroupName", "")
-                                if len(groups) > 0
-                                else ""
-                            ),
-                            "groups": self.get_groups_for_user(groups),
-                            "sign_in_credential": {
-                                "summary": self._get_summary_with_login_profile(
-                                    login_profile, sign_in_link, mfa_devices
-                                ),
-                                "console_password": (
-                                    "Enabled"
-                                    if login_profile is not None
-                                    else "Disabled"
-                                ),
-                                "assigned_mfa_device": (
-                                    user_info.get("Arn")
-                                    if len(mfa_devices) > 0
-                                    else "Not assigned"
-                                ),
-                            },
-                            "cloudtrail": self.set_cloudtrail(
-                                "us-east-1", cloudtrail_resource_type, user["UserName"]
-                            ),
-                            "tags": user_info.get("Tags", []),
-                        }
-                    )
-                    users.append(User(user, strict=False))
-                    access_keys.extend([AccessKey(_key) for _key in _access_keys])
+            attached_policies = self.list_attached_policy_to_user(user_name)
+            matching_policies = self.get_matched_policies_with_attached_policy_info(
+                policies, attached_policies
+            )
 
-                except Exception as e:
-                    resource_id = user.get("Arn", "")
-                    errors.append(self.generate_error("global", resource_id, e))
+            user.update(
+                {
+                    "access_key": _access_keys,
+                    "ssh_public_key": self.list_ssh_keys(user_name),
+                    "code_commit_credential": code_commit_credential,
+                    "cassandra_credential": cassandra_credential,
+                    "mfa_device": (
+                        "Virtual" if len(mfa_devices) > 0 else "Not enabled"
+                    ),
+                    "last_active_age": last_active_age,
+                    "last_activity": last_activity,
+                    "policies": matching_policies,
+                    "groups_display": (
+                        groups[0].get("GroupName", "") if len(groups) > 0 else ""
+                    ),
+                    "groups": self.get_groups_for_user(groups),
+                    "sign_in_credential": {
+                        "summary": self._get_summary_with_login_profile(
+                            login_profile, sign_in_link, mfa_devices
+                        ),
+                        "console_password": (
+                            "Enabled" if login_profile is not None else "Disabled"
+                        ),
+                        "assigned_mfa_device": (
+                            user_info.get("Arn")
+                            if len(mfa_devices) > 0
+                            else "Not assigned"
+                        ),
+                    },
+                    "cloudtrail": self.set_cloudtrail(
+                        "us-east-1", cloudtrail_resource_type, user["UserName"]
+                    ),
+                    "tags": user_info.get("Tags", []),
+                }
+            )
 
-        return users, access_keys, errors
+            yield User(user, strict=False), [AccessKey(_key) for _key in _access_keys]
+
+        except Exception as e:
+            resource_id = user.get("Arn", "")
+            yield self.generate_error("global", resource_id, e, "User"), []
 
     def request_role_data(self, policies) -> List[Role]:
         self.cloud_service_type = "Role"
-        cloudtrail_resource_type = "AWS::IAM::Role"
 
         paginator = self.client.get_paginator("list_roles")
         query = self._generate_default_query()
         response_iterator = paginator.paginate(**query)
+        roles = [
+            role for response in response_iterator for role in response.get("Roles", [])
+        ]
 
-        for response in response_iterator:
-            for role in response.get("Roles", []):
-                try:
-                    role_name = role.get("RoleName")
-                    role_info = self.list_role_info_with_role_name(role_name)
-                    (
-                        role_last_used,
-                        last_activity,
-                    ) = self._get_role_last_used_and_activity(role_info)
-
-                    attached_policies = self.list_attached_policy_to_role(role_name)
-                    matched_policies = (
-                        self.get_matched_policies_with_attached_policy_info(
-                            policies, attached_policies
-                        )
-                    )
-                    (
-                        assume_role_policy_document,
-                        trust_entities,
-                        trusted_relationship,
-                        conditions,
-                    ) = self._get_role_policy_doc_and_trusted_entities_and_relationship_meta(
-                        role
-                    )
+        yield from self.enrich_concurrently(
+            partial(self.request_role, policies=policies), roles, self.iam_max_workers
+        )
+
+    def request_role(self, role, policies):
+        cloudtrail_resource_type = "AWS::IAM::Role"
+
+        try:
+            role_name = role.get("RoleName")
+            role_info = self.list_role_info_with_role_name(role_name)
+            (
+                role_last_used,
+                last_activity,
+            ) = self._get_role_last_used_and_activity(role_info)
+
+            attached_policies = self.list_attached_policy_to_role(role_name)
+            matched_policies = self.get_matched_policies_with_attached_policy_info(
+                policies, attached_policies
+            )
+            (
+                assume_role_policy_document,
+                trust_entities,
+                trusted_relationship,
+                conditions,
+            ) = self._get_role_policy_doc_and_trusted_entities_and_relationship_meta(
+                role
+            )
 
-                    role.update(
+            role.update(
+                {
+                    "AssumeRolePolicyDocument": assume_role_policy_document,
+                    "trust_relationship": [
                         {
-                            "AssumeRolePolicyDocument": assume_role_policy_document,
-                            "trust_relationship": [
-                                {
-                                    "trusted_entities": trusted_relationship,
-                                    "condition_name": conditions.get(
-                                        "condition_name", []
-                                    ),
-                                    "condition_key": conditions.get(
-                                        "condition_key", []
-                                    ),
-                                    "condition_value": conditions.get(
-                                        "condition_value", []
-                                    ),
-                                }
-                            ],
-                            "trusted_entities": trust_entities,
-                            "policies": matched_policies,
-                            "role_last_used": role_last_used,
-                            "last_activity": last_activity,
-                            "cloudtrail": self.set_cloudtrail(
-                                "us-east-1", cloudtrail_resource_type, role["RoleName"]
-                            ),
+                            "trusted_entities": trusted_relationship,
+                            "condition_name": conditions.get("condition_name", []),
+                            "condition_key": conditions.get("condition_key", []),
+                            "condition_value": conditions.get("condition_value", []),
                         }
-                    )
+                    ],
+                    "trusted_entities": trust_entities,
+                    "policies": matched_policies,
+                    "role_last_used": role_last_used,
+                    "last_activity": last_activity,
+                    "cloudtrail": self.set_cloudtrail(
+                        "us-east-1", cloudtrail_resource_type, role["RoleName"]
+                    ),
+                }
+            )
 
-                    yield Role(role, strict=False), role.get("Tags", [])
-                except Exception as e:
-                    resource_id = role.get("Arn", "")
-                    error_resource_response = self.generate_error(
-                        "global", resource_id, e
-                    )
-                    yield error_resource_response, []
+            yield Role(role, strict=False), role.get("Tags", [])
+        except Exception as e:
+            resource_id = role.get("Arn", "")
+            error_resource_response = self.generate_error(
+                "global", resource_id, e, "Role"
+            )
+            yield error_resource_response, []
 
     def request_identity_provider_data(self) -> List[IdentityProvider]:
         self.cloud_service_type = "IdentityProvider"
@@ -492,11 +508,56 @@ class IAMConnector(SchematicAWSConnector):
                 }
             )
 
-    def get_user_info(self, user_name):
+    def get_account_authorization_details(self):
+        """
+        Returns the AccountAuthorizationDetails snapshot of the account in bulk mode (default),
+        which replaces the per user, group, role and policy calls whenever it has the data.
+        Returns None when bulk mode is off or the sweep fails, so every call goes to the API.
+        """
+        if not self.options.get("iam_bulk_mode", True):
+            return None
+
+        try:
+            return AccountAuthorizationDetails.load(self.client)
+        except Exception as e:
+            _LOGGER.error(
+                f"[get_account_authorization_details] fall back to per entity calls: {e}"
+            )
+            return None
+
+    def get_credential_report(self):
+        """
+        Returns the CredentialReport of the account (default), which replaces the login profile,
+        MFA device and access key last used calls per user.
+        Returns None when it is turned off or cannot be generated.
+        """
+        if not self.options.get("iam_credential_report", True):
+            return None
+
+        try:
+            return CredentialReport.load(self.client)
+        except Exception as e:
+            _LOGGER.error(f"[get_credential_report] fall back to per user calls: {e}")
+            return None
+
+    def get_user_info(self, user_name, user=None):
+        if self.authorization_details and user_name in self.authorization_details.users:
+            # list_users already returns PasswordLastUsed, tags come from the snapshot
+            return dict(
+                user or {},
+                Tags=self.authorization_details.users[user_name].get("Tags", []),
+            )
+
         response = self.client.get_user(UserName=user_name)
         return response.get("User", {})
 
     def get_login_profile(self, user_name):
+        if self.credential_report and user_name in self.credential_report:
+            if self.credential_report.is_password_enabled(user_name):
+                return {"UserName": user_name}
+
+            return None
+
         login_profile = None
         try:
             response = self.client.get_login_profile(UserName=user_name)
@@ -510,9 +571,8 @@ class IAMConnector(SchematicAWSConnector):
 
     def list_local_managed_policies(self, **query):
         self.cloud_service_type = "Policy"
-        cloudtrail_resource_type = "AWS::IAM::Policy"
 
-        policies = []
+        policies = PolicyCatalog(self.get_aws_managed_policy)
         errors = []
 
         policy_paginator = self.client.get_paginator("list_policies")
@@ -521,44 +581,51 @@ class IAMConnector(SchematicAWSConnector):
             "Scope", "Local", "", is_paginate=True, **query
         )
         response_iterator_local = policy_paginator.paginate(**query)
+        local_policies = [
+            policy
+            for data in response_iterator_local
+            for policy in data.get("Policies", [])
+        ]
 
-        for data in response_iterator_local:
-            for policy in data.get("Policies", []):
-                try:
-                    policy_arn = policy.get("Arn")
-                    description = self.list_policy_description(policy_arn)
-                    query = self._generate_key_query(
-                        "PolicyArn", policy_arn, "Scope", is_paginate=True, **query
-                    )
+        for policy in self.enrich_concurrently(
+            self.request_local_managed_policy, local_policies, self.iam_max_workers
+        ):
+            if isinstance(policy, ErrorResourceResponse):
+                errors.append(policy)
+            else:
+                policies.add(policy)
 
-                    permission_summary = self.list_policy_summary(
-                        policy_arn, policy.get("DefaultVersionId")
-                    )
-                    policy.update(
-                        {
-                            "description": description,
-                            "policy_usage": self.list_policy_usage(policy_arn),
-                            "permission": permission_summary,
-                            "permission_versions": self.list_policy_versions(
-                                policy_arn
-                            ),
-                            "cloudtrail": self.set_cloudtrail(
-                                "us-east-1", cloudtrail_resource_type, policy["Arn"]
-                            ),
-                            "policy_type": "Custom Managed",
-                        }
-                    )
+        return policies, errors
 
-                    policies.append(Policy(policy, strict=False))
+    def request_local_managed_policy(self, policy):
+        cloudtrail_resource_type = "AWS::IAM::Policy"
 
-                except Exception as e:
-                    resource_id = policy.get("Arn", "")
-                    errors.append(self.generate_error("global", resource_id, e))
+        try:
+            policy_arn = policy.get("Arn")
+            description = self.list_policy_description(policy_arn)
+            permission_summary = self.list_policy_summary(
+                policy_arn, policy.get("PolicyId"), policy.get("DefaultVersionId")
+            )
+            policy.update(
+                {
+                    "description": description,
+                    "policy_usage": self.list_policy_usage(policy_arn),
+                    "permission": permission_summary,
+                    "permission_versions": self.list_policy_versions(policy_arn),
+                    "cloudtrail": self.set_cloudtrail(
+                        "us-east-1", cloudtrail_resource_type, policy["Arn"]
+                    ),
+                    "policy_type": "Custom Managed",
+                }
+            )
 
-        return policies, errors
+            yield Policy(policy, strict=False)
+
+        except Exception as e:
+            resource_id = policy.get("Arn", "")
+            yield self.generate_error("global", resource_id, e, "Policy")
 
     def list_access_keys(self, user_name, user_arn):
-        self.cloud_service_type = "AccessKey"
         cloudtrail_resource_type = "AWS::IAM::AccessKey"
 
         access_keys = []
@@ -572,7 +639,10 @@ class IAMConnector(SchematicAWSConnector):
             for access_key_meta in data.get("AccessKeyMetadata", []):
                 key_id = access_key_meta.get("AccessKeyId")
                 access_key_last_used_vo = AccessKeyLastUsed(
-                    self.get_access_key_last_used(key_id), strict=False
+                    self.get_access_key_last_used(
+                        key_id, user_name, access_key_meta.get("CreateDate")
+                    ),
+                    strict=False,
                 )
                 access_key_vo = {
                     "key_id": key_id,
@@ -623,6 +693,12 @@ class IAMConnector(SchematicAWSConnector):
         return ssh_keys
 
     def list_mfa_devices(self, user_name):
+        if self.credential_report and user_name in self.credential_report:
+            if self.credential_report.is_mfa_active(user_name):
+                return [{"UserName": user_name}]
+
+            return []
+
         response = self.client.list_mfa_devices(UserName=user_name)
         return response.get("MFADevices", [])
 
@@ -643,6 +719,15 @@ class IAMConnector(SchematicAWSConnector):
         return code_commit_credential, cassandra_credential
 
     def list_groups_with_user_name(self, user_name, **query):
+        if self.authorization_details and user_name in self.authorization_details.users:
+            return [
+                self.authorization_details.groups[group_name]
+                for group_name in self.authorization_details.users[user_name].get(
+                    "GroupList", []
+                )
+                if group_name in self.authorization_details.groups
+            ]
+
         groups = []
         query = self._generate_key_query(
             "UserName", user_name, "", is_paginate=True, **query
@@ -656,6 +741,12 @@ class IAMConnector(SchematicAWSConnector):
         return groups
 
     def list_user_with_group_name(self, group_name, **query):
+        if (
+            self.authorization_details
+            and group_name in self.authorization_details.groups
+        ):
+            return self.authorization_details.group_members.get(group_name, [])
+
         users = []
         query = self._generate_key_query(
             "GroupName", group_name, "", is_paginate=True, **query
@@ -686,6 +777,14 @@ class IAMConnector(SchematicAWSConnector):
         return groups_for_user
 
     def list_policy_with_group_name(self, group_name, **query):
+        if (
+            self.authorization_details
+            and group_name in self.authorization_details.groups
+        ):
+            return self.authorization_details.groups[group_name].get(
+                "AttachedManagedPolicies", []
+            )
+
         policies = []
         query = self._generate_key_query(
             "GroupName", group_name, "", is_paginate=True, **query
@@ -699,14 +798,27 @@ class IAMConnector(SchematicAWSConnector):
         return policies
 
     def list_role_info_with_role_name(self, role_name):
+        if self.authorization_details and role_name in self.authorization_details.roles:
+            return self.authorization_details.roles[role_name]
+
         response = self.client.get_role(RoleName=role_name)
         return response.get("Role", {})
 
     def list_attached_policy_to_user(self, user_name):
+        if self.authorization_details and user_name in self.authorization_details.users:
+            return self.authorization_details.users[user_name].get(
+                "AttachedManagedPolicies", []
+            )
+
         response = self.client.list_attached_user_policies(UserName=user_name)
         return response.get("AttachedPolicies", [])
 
     def list_attached_policy_to_role(self, role_name):
+        if self.authorization_details and role_name in self.authorization_details.roles:
+            return self.authorization_details.roles[role_name].get(
+                "AttachedManagedPolicies", []
+            )
+
         response = self.client.list_attached_role_policies(RoleName=role_name)
         return response.get("AttachedPolicies", [])
 
@@ -716,18 +828,38 @@ class IAMConnector(SchematicAWSConnector):
         )
         return response
 
-    def get_access_key_last_used(self, access_key_id):
+    def get_access_key_last_used(self, access_key_id, user_name=None, create_date=None):
+        if self.credential_report and user_name in self.credential_report:
+            access_key_last_used = self.credential_report.get_access_key_last_used(
+                user_name, create_date
+            )
+
+            if access_key_last_used is not None:
+                return access_key_last_used
+
         response = self.client.get_access_key_last_used(AccessKeyId=access_key_id)
         return response.get("AccessKeyLastUsed", {})
 
     def list_policy_info(self, policy_arn):
+        if (
+            self.authorization_details
+            and policy_arn in self.authorization_details.policies
+        ):
+            return self.authorization_details.get_policy_info(policy_arn)
+
         return self.client.get_policy(PolicyArn=policy_arn).get("Policy", {})
 
     def list_policy_description(self, policy_arn):
-        policy_info = self.client.get_policy(PolicyArn=policy_arn).get("Policy", {})
+        policy_info = self.list_policy_info(policy_arn)
         return policy_info.get("Description", "")
 
     def list_policy_versions(self, policy_arn, **query):
+        if (
+            self.authorization_details
+            and policy_arn in self.authorization_details.policies
+        ):
+            return self.authorization_details.get_policy_versions(policy_arn)
+
         versions = []
         query = self._generate_key_query(
             "PolicyArn", policy_arn, "", is_paginate=True, **query
@@ -740,12 +872,46 @@ class IAMConnector(SchematicAWSConnector):
 
         return versions
 
-    def list_policy_summary(self, policy_arn, version_id):
+    def get_snapshot_policy_document(self, policy_arn, version_id):
+        if self.authorization_details:
+            document = self.authorization_details.get_policy_document(
+                policy_arn, version_id
+            )
+
+            if document is not None:
+                return copy.deepcopy(document)
+
+        return None
+
+    def request_policy_document(self, policy_arn, version_id):
         policy_info = self.client.get_policy_version(
             PolicyArn=policy_arn, VersionId=version_id
         ).get("PolicyVersion", {})
+        return policy_info.get("Document")
+
+    def list_policy_summary(self, policy_arn, policy_id, version_id):
+        """
+        The document comes from the authorization details snapshot first, then from the disk cache,
+        then from get_policy_version.
+        The cache is keyed by PolicyId, since a policy recreated with the same name gets the same ARN
+        and starts again at v1.
+        """
+        use_cache = self.policy_document_cache and policy_id and version_id
+        document = self.get_snapshot_policy_document(policy_arn, version_id)
+
+        if document is None:
+            if use_cache:
+                permission_summary = self.policy_document_cache.get(
+                    policy_id, version_id
+                )
+
+                if permission_summary is not None:
+                    return permission_summary
+
+            document = self.request_policy_document(policy_arn, version_id)
+
         empty_permission_summary = {"Statement": [], "Version": "N/A"}
-        return_value = policy_info.get("Document", empty_permission_summary)
+        return_value = document or empty_permission_summary
         statements = []
 
         if isinstance(return_value.get("Statement"), list):
@@ -758,38 +924,40 @@ class IAMConnector(SchematicAWSConnector):
             )
 
         return_value.update({"Statement": statements})
+
+        if use_cache and document:
+            self.policy_document_cache.put(policy_id, version_id, return_value)
+
         return return_value
 
-    def get_matched_policies_with_attached_policy_info(
-        self, policies, attached_policies
-    ):
-        matched_policies = []
-        attached_policy_arn = [
-            policy.get("PolicyArn", "") for policy in attached_policies
+    @staticmethod
+    def get_matched_policies_with_attached_policy_info(policies, attached_policies):
+        return [
+            policies.get(policy.get("PolicyArn", "")) for policy in attached_policies
         ]
-        for policy_arn in attached_policy_arn:
-            policy = [p for p in policies if p.get("arn", "") == policy_arn]
-            if not policy:
-                new_policy = self.list_policy_info(policy_arn)
-                permission_summary = self.list_policy_summary(
-                    policy_arn, new_policy.get("DefaultVersionId")
-                )
-                new_policy.update(
-                    {
-                        "policy_usage": self.list_policy_usage(policy_arn),
-                        "permission": permission_summary,
-                        "permission_versions": self.list_policy_versions(policy_arn),
-                        "policy_type": "AWS Managed",
-                    }
-                )
-                policies.append(Policy(new_policy, strict=False))
-                matched_policies.append(Policy(new_policy, strict=False))
-            else:
-                matched_policies.extend(policy)
 
-        return matched_policies
+    def get_aws_managed_policy(self, policy_arn):
+        new_policy = self.list_policy_info(policy_arn)
+        permission_summary = self.list_policy_summary(
+            policy_arn, new_policy.get("PolicyId"), new_policy.get("DefaultVersionId")
+        )
+        new_policy.update(
+            {
+                "policy_usage": self.list_policy_usage(policy_arn),
+                "permission": permission_summary,
+                "permission_versions": self.list_policy_versions(policy_arn),
+                "policy_type": "AWS Managed",
+            }
+        )
+        return Policy(new_policy, strict=False)
 
     def list_policy_usage(self, policy_arn, **query):
+        if (
+            self.authorization_details
+            and policy_arn in self.authorization_details.policies
+        ):
+            return self.authorization_details.policy_usage.get(policy_arn, [])
+
         query = self._generate_key_query(
             "PolicyArn", policy_arn, "", is_paginate=True, **query
         )
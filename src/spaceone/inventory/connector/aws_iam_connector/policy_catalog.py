@@ -0,0 +1,46 @@
+import threading
+
+
+class PolicyCatalog:
+    """
+    Every Policy of a collection indexed by ARN, one canonical instance per ARN.
+
+    Local managed policies are added up front. A policy which is not in the catalog yet
+    (an attached AWS managed policy) is built by fetch_policy(policy_arn) on first use.
+    Concurrent lookups of the same ARN wait for that single fetch instead of repeating it.
+    Iterating the catalog returns the policies in the order they were added.
+    """
+
+    def __init__(self, fetch_policy):
+        self.fetch_policy = fetch_policy
+        self._policies = {}
+        self._lock = threading.Lock()
+        self._fetch_locks = {}
+
+    def __iter__(self):
+        with self._lock:
+            return iter(list(self._policies.values()))
+
+    def __len__(self):
+        return len(self._policies)
+
+    def __contains__(self, policy_arn):
+        return policy_arn in self._policies
+
+    def add(self, policy):
+        with self._lock:
+            self._policies.setdefault(policy.arn, policy)
+
+    def get(self, policy_arn):
+        if (policy := self._policies.get(policy_arn)) is not None:
+            return policy
+
+        with self._lock:
+            fetch_lock = self._fetch_locks.setdefault(policy_arn, threading.Lock())
+
+        with fetch_lock:
+            if (policy := self._policies.get(policy_arn)) is None:
+                policy = self.fetch_policy(policy_arn)
+                self.add(policy)
+
+        return policy
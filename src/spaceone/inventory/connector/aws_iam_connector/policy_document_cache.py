@@ -0,0 +1,171 @@
+import json
+import logging
+import os
+import sqlite3
+import stat
+import threading
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+POLICY_DOCUMENT_CACHE_FILE = "iam_policy_documents.sqlite3"
+PLUGIN_CACHE_DIR = os.path.join(
+    os.path.expanduser("~"), ".cache", "plugin-aws-cloudservices"
+)
+PRIVATE_DIR_MODE = 0o700
+PRIVATE_FILE_MODE = 0o600
+SQLITE_TIMEOUT = 30
+
+
+class PolicyDocumentCache:
+    """
+    On-disk LRU cache of formatted policy documents keyed by (PolicyId, VersionId).
+
+    A policy version never changes once created, so a collection only needs get_policy_version
+    for versions which are new since the previous one.
+    PolicyId rather than PolicyArn is the key, because a policy deleted and recreated with the same name
+    keeps its ARN and starts again at v1.
+    The cache lives in a SQLite file shared by every collection of the plugin process
+    and keeps the max_entries most recently used documents.
+    """
+
+    def __init__(self, path, max_entries):
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            path, timeout=SQLITE_TIMEOUT, check_same_thread=False
+        )
+
+        with self._lock, self._connection:
+            # documents keyed by PolicyArn could belong to a deleted policy of the same name
+            self._connection.execute("DROP TABLE IF EXISTS policy_documents")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS policy_version_documents ("
+                "policy_id TEXT NOT NULL, "
+                "version_id TEXT NOT NULL, "
+                "document TEXT NOT NULL, "
+                "accessed_at REAL NOT NULL, "
+                "PRIMARY KEY (policy_id, version_id))"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS policy_version_documents_accessed_at "
+                "ON policy_version_documents (accessed_at)"
+            )
+
+    def get(self, policy_id, version_id):
+        try:
+            with self._lock, self._connection:
+                row = self._connection.execute(
+                    "SELECT document FROM policy_version_documents "
+                    "WHERE policy_id = ? AND version_id = ?",
+                    (policy_id, version_id),
+                ).fetchone()
+
+                if row is None:
+                    return None
+
+                self._connection.execute(
+                    "UPDATE policy_version_documents SET accessed_at = ? "
+                    "WHERE policy_id = ? AND version_id = ?",
+                    (time.time(), policy_id, version_id),
+                )
+        except sqlite3.Error as e:
+            _LOGGER.error(f"[PolicyDocumentCache] get {policy_id} {version_id}: {e}")
+            return None
+
+        return json.loads(row[0])
+
+    def put(self, policy_id, version_id, document):
+        """
+        Stores document, then evicts the least recently used documents beyond max_entries.
+        A failed write only costs a fetch in the next collection.
+        """
+        try:
+            with self._lock, self._connection:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO policy_version_documents "
+                    "(policy_id, version_id, document, accessed_at) VALUES (?, ?, ?, ?)",
+                    (policy_id, version_id, json.dumps(document), time.time()),
+                )
+                self._connection.execute(
+                    "DELETE FROM policy_version_documents WHERE rowid IN ("
+                    "SELECT rowid FROM policy_version_documents "
+                    "ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+        except sqlite3.Error as e:
+            _LOGGER.error(f"[PolicyDocumentCache] put {policy_id} {version_id}: {e}")
+
+
+_CACHES = {}
+_CACHES_LOCK = threading.Lock()
+
+
+def get_policy_document_cache(cache_dir, max_entries):
+    """
+    Returns the PolicyDocumentCache of cache_dir (PLUGIN_CACHE_DIR when None),
+    shared by every connector of the process.
+    Returns None when max_entries is 0 or the cache file cannot be opened privately.
+    A cache_dir which failed once stays disabled for the life of the process.
+    """
+    if not max_entries:
+        return None
+
+    cache_dir = cache_dir or PLUGIN_CACHE_DIR
+    path = os.path.join(cache_dir, POLICY_DOCUMENT_CACHE_FILE)
+
+    with _CACHES_LOCK:
+        if path not in _CACHES:
+            try:
+                _make_private_dir(cache_dir)
+                _make_private_file(path)
+                _CACHES[path] = PolicyDocumentCache(path, max_entries)
+            except Exception as e:
+                _LOGGER.warning(f"[get_policy_document_cache] cache disabled: {e}")
+                _CACHES[path] = None
+
+        policy_document_cache = _CACHES[path]
+
+        if policy_document_cache is not None:
+            policy_document_cache.max_entries = max_entries
+
+        return policy_document_cache
+
+
+def _make_private_dir(path):
+    """
+    Creates path with mode 0700 when missing.
+    An existing directory must be owned by the plugin user and closed to everyone else.
+    """
+    os.makedirs(path, mode=PRIVATE_DIR_MODE, exist_ok=True)
+    _check_private(os.lstat(path), path, stat.S_ISDIR)
+
+
+def _make_private_file(path):
+    """
+    Creates the cache file with mode 0600 without following links,
+    so nobody else can read it or hand in a file of their own.
+    """
+    try:
+        fd = os.open(
+            path,
+            os.O_RDWR | os.O_CREAT | os.O_EXCL | os.O_NOFOLLOW,
+            PRIVATE_FILE_MODE,
+        )
+        os.close(fd)
+    except FileExistsError:
+        pass
+
+    _check_private(os.lstat(path), path, stat.S_ISREG)
+
+
+def _check_private(path_stat, path, is_type):
+    if not is_type(path_stat.st_mode):
+        raise PermissionError(f"{path} has an unexpected file type")
+
+    if path_stat.st_uid != os.getuid():
+        raise PermissionError(f"{path} is not owned by the plugin user")
+
+    if path_stat.st_mode & (stat.S_IRWXG | stat.S_IRWXO):
+        raise PermissionError(f"{path} is accessible by other users")
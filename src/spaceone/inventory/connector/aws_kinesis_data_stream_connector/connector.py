@@ -18,7 +18,6 @@ class KinesisDataStreamConnector(SchematicAWSConnector):
 
     def get_resources(self):
         _LOGGER.debug(f"[get_resources][account_id: {self.account_id}] START: Kinesis Data Stream")
-        resources = []
         start_time = time.time()
 
         collect_resources = [
@@ -29,21 +28,12 @@ class KinesisDataStreamConnector(SchematicAWSConnector):
             }
         ]
 
-        resources.extend(self.set_cloud_service_types())
+        yield from self.set_cloud_service_types()
 
-        for region_name in self.region_names:
-            try:
-                self.reset_region(region_name)
-
-                for collect_resource in collect_resources:
-                    resources.extend(self.collect_data_by_region(self.service_name, region_name, collect_resource))
-            except Exception as e:
-                error_resource_response = self.generate_error(region_name, '', e)
-                resources.append(error_resource_response)
+        yield from self.collect_data_by_regions(collect_resources)
 
         _LOGGER.debug(f'[get_resources][account_id: '
                       f'{self.account_id}] FINISHED: Kinesis Data Stream ({time.time() - start_time} sec)')
-        return resources
 
     def request_data(self, region_name) -> List[StreamDescription]:
         cloudwatch_namespace = 'AWS/Kinesis'
@@ -105,7 +95,7 @@ class KinesisDataStreamConnector(SchematicAWSConnector):
                         'launched_at': self.datetime_to_iso8601(stream_vo.stream_creation_timestamp),
                         'name': stream_vo.stream_name,
                         'account': self.account_id,
-                        'tags': self.get_tags(stream_vo.stream_name)
+                        'tags': self.get_tags(stream_vo.stream_name, stream_vo.stream_arn)
                     }
 
                 except Exception as e:
@@ -113,7 +103,12 @@ class KinesisDataStreamConnector(SchematicAWSConnector):
                     error_resource_response = self.generate_error(region_name, resource_id, e)
                     yield {'data': error_resource_response}
 
-    def get_tags(self, name):
+    def get_tags(self, name, arn):
+        tags = self.get_indexed_tags('kinesis', arn)
+
+        if tags is not None:
+            return tags
+
         tag_response = self.client.list_tags_for_stream(StreamName=name)
         return self.convert_tags_to_dict_type(tag_response.get('Tags', []))
 
@@ -17,7 +17,6 @@ class KinesisFirehoseConnector(SchematicAWSConnector):
 
     def get_resources(self):
         _LOGGER.debug(f"[get_resources][account_id: {self.account_id}] START: Kinesis Firehose")
-        resources = []
         start_time = time.time()
 
         collect_resources = [
@@ -28,24 +27,11 @@ class KinesisFirehoseConnector(SchematicAWSConnector):
             }
         ]
 
-        resources.extend(self.set_cloud_service_types())
+        yield from self.set_cloud_service_types()
 
-        for region_name in self.region_names:
-            try:
-                self.reset_region(region_name)
-
-                for collect_resource in collect_resources:
-                    resources.extend(
-                        self.collect_data_by_region(
-                            self.service_name, region_name, collect_resource
-                        )
-                    )
-            except Exception as e:
-                error_resource_response = self.generate_error(region_name, '', e)
-                resources.append(error_resource_response)
+        yield from self.collect_data_by_regions(collect_resources)
 
         _LOGGER.debug(f'[get_resources][account_id: {self.account_id}] FINISHED: Kinesis Firehose ({time.time() - start_time} sec)')
-        return resources
 
     def list_delivery_streams(self):
         response = self.client.list_delivery_streams()
@@ -79,7 +65,7 @@ class KinesisFirehoseConnector(SchematicAWSConnector):
                     'name': stream_vo.delivery_stream_name,
                     'launched_at': self.datetime_to_iso8601(stream_vo.create_timestamp),
                     'account': self.account_id,
-                    'tags': self.get_tags(stream_vo.delivery_stream_name)
+                    'tags': self.get_tags(stream_vo.delivery_stream_name, stream_vo.delivery_stream_arn)
                 }
 
             except Exception as e:
@@ -87,7 +73,12 @@ class KinesisFirehoseConnector(SchematicAWSConnector):
                 error_resource_response = self.generate_error(region_name, resource_id, e)
                 yield {'data': error_resource_response}
 
-    def get_tags(self, name):
+    def get_tags(self, name, arn):
+        tags = self.get_indexed_tags('firehose', arn)
+
+        if tags is not None:
+            return tags
+
         tag_response = self.client.list_tags_for_delivery_stream(DeliveryStreamName=name)
         return self.convert_tags_to_dict_type(tag_response.get('Tags', []))
 
@@ -20,7 +20,6 @@ class KMSConnector(SchematicAWSConnector):
 
     def get_resources(self) -> List[KeyResource]:
         _LOGGER.debug(f"[get_resources][account_id: {self.account_id}] START: KMS")
-        resources = []
         start_time = time.time()
 
         collect_resource = {
@@ -29,18 +28,11 @@ class KMSConnector(SchematicAWSConnector):
             'response_schema': KeyResponse
         }
 
-        resources.extend(self.set_cloud_service_types())
+        yield from self.set_cloud_service_types()
 
-        for region_name in self.region_names:
-            try:
-                self.reset_region(region_name)
-                resources.extend(self.collect_data_by_region(self.service_name, region_name, collect_resource))
-            except Exception as e:
-                error_resource_response = self.generate_error(region_name, '', e)
-                resources.append(error_resource_response)
+        yield from self.collect_data_by_regions([collect_resource])
 
         _LOGGER.debug(f'[get_resources][account_id: {self.account_id}] FINISHED: KMS ({time.time() - start_time} sec)')
-        return resources
 
     def request_data(self, region_name) -> List[Key]:
         kms_keys = self.list_keys()
@@ -30,7 +30,6 @@ class LambdaConnector(SchematicAWSConnector):
 
     def get_resources(self):
         _LOGGER.debug(f"[get_resources][account_id: {self.account_id}] START: Lambda")
-        resources = []
         start_time = time.time()
 
         collect_resources = [
@@ -46,26 +45,13 @@ class LambdaConnector(SchematicAWSConnector):
             },
         ]
 
-        resources.extend(self.set_cloud_service_types())
+        yield from self.set_cloud_service_types()
 
-        for region_name in self.region_names:
-            try:
-                self.reset_region(region_name)
-
-                for collect_resource in collect_resources:
-                    resources.extend(
-                        self.collect_data_by_region(
-                            self.service_name, region_name, collect_resource
-                        )
-                    )
-            except Exception as e:
-                error_resource_response = self.generate_error(region_name, "", e)
-                resources.append(error_resource_response)
+        yield from self.collect_data_by_regions(collect_resources)
 
         _LOGGER.debug(
             f"[get_resources][account_id: {self.account_id}] FINISHED: Lambda ({time.time() - start_time} sec)"
         )
-        return resources
 
     @property
     def layers(self):
@@ -191,5 +177,10 @@ class LambdaConnector(SchematicAWSConnector):
                     yield {"data": error_resource_response}
 
     def list_tags(self, arn):
+        tags = self.get_indexed_tags("lambda", arn)
+
+        if tags is not None:
+            return tags
+
         response = self.client.list_tags(Resource=arn)
         return response.get("Tags", {})
@@ -82,7 +82,6 @@ class LightsailConnector(SchematicAWSConnector):
         _LOGGER.debug(
             f"[get_resources][account_id: {self.account_id}] START: Lightsail"
         )
-        resources = []
         start_time = time.time()
 
         collect_resources = [
@@ -138,46 +137,31 @@ class LightsailConnector(SchematicAWSConnector):
             },
         ]
 
-        resources.extend(self.set_cloud_service_types())
+        yield from self.set_cloud_service_types()
 
-        for region_name in self.region_names:
-            try:
-                if (region_name in EXCLUDE_REGION) or (
-                    region_name not in ALLOWED_REGION
-                ):
-                    continue
-
-                self.reset_region(region_name)
-
-                for collect_resource in collect_resources:
-                    # domain/distribution resources are global
-                    if (
-                        collect_resource["request_method"] == self.request_domain_data
-                    ) or (
-                        collect_resource["request_method"]
-                        == self.request_distribution_data
-                    ):
-                        # Global resource query interface to us-east-1 region
-                        if region_name == "us-east-1":
-                            resources.extend(
-                                self.collect_data_by_region(
-                                    self.service_name, region_name, collect_resource
-                                )
-                            )
-                    else:
-                        resources.extend(
-                            self.collect_data_by_region(
-                                self.service_name, region_name, collect_resource
-                            )
-                        )
-            except Exception as e:
-                error_resource_response = self.generate_error(region_name, "", e)
-                resources.append(error_resource_response)
+        region_names = [
+            region_name
+            for region_name in self.region_names
+            if region_name not in EXCLUDE_REGION and region_name in ALLOWED_REGION
+        ]
+        yield from self.collect_data_by_regions(collect_resources, region_names)
 
         _LOGGER.debug(
             f"[get_resources][account_id: {self.account_id}] FINISHED: Lightsail ({time.time() - start_time} sec)"
         )
-        return resources
+
+    def collect_region(self, region_name, collect_resources):
+        # domain/distribution resources are global
+        # Global resource query interface to us-east-1 region
+        if region_name != "us-east-1":
+            collect_resources = [
+                collect_resource
+                for collect_resource in collect_resources
+                if collect_resource["request_method"]
+                not in (self.request_domain_data, self.request_distribution_data)
+            ]
+
+        return super().collect_region(region_name, collect_resources)
 
     def request_instances_data(self, region_name):
         cloud_service_type = "Instance"
@@ -22,7 +22,6 @@ class MSKConnector(SchematicAWSConnector):
 
     def get_resources(self):
         _LOGGER.debug(f"[get_resources][account_id: {self.account_id}] START: MSK")
-        resources = []
         start_time = time.time()
 
         collect_resources = [
@@ -38,23 +37,12 @@ class MSKConnector(SchematicAWSConnector):
             }
         ]
 
-        resources.extend(self.set_cloud_service_types())
+        yield from self.set_cloud_service_types()
 
-        for region_name in self.region_names:
-            try:
-                if region_name in EXCLUDE_REGION:
-                    continue
-
-                self.reset_region(region_name)
-
-                for collect_resource in collect_resources:
-                    resources.extend(self.collect_data_by_region(self.service_name, region_name, collect_resource))
-            except Exception as e:
-                error_resource_response = self.generate_error(region_name, '', e)
-                resources.append(error_resource_response)
+        region_names = [region_name for region_name in self.region_names if region_name not in EXCLUDE_REGION]
+        yield from self.collect_data_by_regions(collect_resources, region_names)
 
         _LOGGER.debug(f'[get_resources][account_id: {self.account_id}] FINISHED: MSK ({time.time() - start_time} sec)')
-        return resources
 
     def request_cluster_data(self, region_name) -> List[Cluster]:
         cloud_service_group = 'MSK'
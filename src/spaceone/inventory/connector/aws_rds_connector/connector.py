@@ -25,7 +25,6 @@ class RDSConnector(SchematicAWSConnector):
 
     def get_resources(self):
         _LOGGER.debug(f"[get_resources][account_id: {self.account_id}] START: RDS")
-        resources = []
         start_time = time.time()
 
         collect_resources = [
@@ -56,39 +55,37 @@ class RDSConnector(SchematicAWSConnector):
             }
         ]
 
-        resources.extend(self.set_cloud_service_types())
+        yield from self.set_cloud_service_types()
 
-        for region_name in self.region_names:
-            self.reset_region(region_name)
+        yield from self.collect_data_by_regions(collect_resources)
 
-            try:
-                # For Database
-                for database_vo, resource, identifier in self.db_cluster_data(region_name):
-                    if getattr(database_vo, 'resource_type', None) \
-                            and database_vo.resource_type == 'inventory.ErrorResource':
-                        # Error Resource
-                        resources.append(database_vo)
-                    else:
-                        resources.append(DatabaseResponse(
-                            {'resource': resource({
-                                'name': identifier,
-                                'data': database_vo,
-                                'instance_type': database_vo.engine,
-                                'tags': self.list_tags_for_resource(database_vo.arn),
-                                'region_code': region_name,
-                                'account': self.account_id,
-                                'reference': ReferenceModel(database_vo.reference(region_name))})}
-                        ))
-            except Exception as e:
-                resource_id = ''
-                resources.append(self.generate_error(region_name, resource_id, e))
+        _LOGGER.debug(f'[get_resources][account_id: {self.account_id}] FINISHED: RDS ({time.time() - start_time} sec)')
 
-            # For All except Database
-            for collect_resource in collect_resources:
-                resources.extend(self.collect_data_by_region(self.service_name, region_name, collect_resource))
+    def collect_region(self, region_name, collect_resources):
+        try:
+            # For Database
+            for database_vo, resource, identifier in self.db_cluster_data(region_name):
+                if getattr(database_vo, 'resource_type', None) \
+                        and database_vo.resource_type == 'inventory.ErrorResource':
+                    # Error Resource
+                    yield database_vo
+                else:
+                    yield DatabaseResponse(
+                        {'resource': resource({
+                            'name': identifier,
+                            'data': database_vo,
+                            'instance_type': database_vo.engine,
+                            'tags': self.list_tags_for_resource(database_vo.arn),
+                            'region_code': region_name,
+                            'account': self.account_id,
+                            'reference': ReferenceModel(database_vo.reference(region_name))})}
+                    )
+        except Exception as e:
+            resource_id = ''
+            yield self.generate_error(region_name, resource_id, e)
 
-        _LOGGER.debug(f'[get_resources][account_id: {self.account_id}] FINISHED: RDS ({time.time() - start_time} sec)')
-        return resources
+        # For All except Database
+        yield from super().collect_region(region_name, collect_resources)
 
     def db_cluster_data(self, region_name) -> List[Database]:
         self.cloud_service_type = 'Database'
@@ -348,6 +345,11 @@ class RDSConnector(SchematicAWSConnector):
                 yield Parameter(raw, strict=False)
 
     def list_tags_for_resource(self, resource_name):
+        tags = self.get_indexed_tags('rds', resource_name)
+
+        if tags is not None:
+            return tags
+
         response = self.client.list_tags_for_resource(ResourceName=resource_name)
         return self.convert_tags_to_dict_type(response.get('TagList', []))
 
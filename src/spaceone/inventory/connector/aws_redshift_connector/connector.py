@@ -19,7 +19,6 @@ class RedshiftConnector(SchematicAWSConnector):
 
     def get_resources(self) -> List[ClusterResource]:
         _LOGGER.debug(f"[get_resources][account_id: {self.account_id}] START: Redshift")
-        resources = []
         start_time = time.time()
 
         collect_resource = {
@@ -28,18 +27,11 @@ class RedshiftConnector(SchematicAWSConnector):
             'response_schema': ClusterResponse
         }
 
-        resources.extend(self.set_cloud_service_types())
+        yield from self.set_cloud_service_types()
 
-        for region_name in self.region_names:
-            try:
-                self.reset_region(region_name)
-                resources.extend(self.collect_data_by_region(self.service_name, region_name, collect_resource))
-            except Exception as e:
-                error_resource_response = self.generate_error(region_name, '', e)
-                resources.append(error_resource_response)
+        yield from self.collect_data_by_regions([collect_resource])
 
         _LOGGER.debug(f'[get_resources][account_id: {self.account_id}] FINISHED: Redshift ({time.time() - start_time} sec)')
-        return resources
 
     def request_data(self, region_name) -> List[Cluster]:
         cloudwatch_namespace = 'AWS/Redshift'
@@ -90,6 +82,11 @@ class RedshiftConnector(SchematicAWSConnector):
                                               region=arn_dict.get('region', ''),
                                               account_id=arn_dict.get('account_id', ''),
                                               resource_id=arn_dict.get('resource_id', ''))
+        tags = self.get_indexed_tags('redshift', tag_arn)
+
+        if tags is not None:
+            return tags
+
         try:
             response = self.client.describe_tags(ResourceName=tag_arn)
             for _tag_resource in response.get('TaggedResources', []):
@@ -20,19 +20,18 @@ class Route53Connector(SchematicAWSConnector):
 
     def get_resources(self) -> List[HostedZoneResource]:
         _LOGGER.debug(f"[get_resources][account_id: {self.account_id}] START: Route53")
-        resources = []
         start_time = time.time()
 
         try:
-            resources.extend(self.set_cloud_service_types())
+            yield from self.set_cloud_service_types()
 
             # merge data
             for data in self.request_data():
                 if getattr(data, 'resource_type', None) and data.resource_type == 'inventory.ErrorResource':
                     # Error Resource
-                    resources.append(data)
+                    yield data
                 else:
-                    resources.append(self.response_schema(
+                    yield self.response_schema(
                         {'resource': HostedZoneResource({
                             'name': data.name,
                             'data': data,
@@ -40,14 +39,13 @@ class Route53Connector(SchematicAWSConnector):
                             'account': self.account_id,
                             'reference': ReferenceModel(data.reference()),
                             'region_code': 'global'
-                        })}))
+                        })})
 
         except Exception as e:
             resource_id = ''
-            resources.append(self.generate_error('global', resource_id, e))
+            yield self.generate_error('global', resource_id, e)
 
         _LOGGER.debug(f'[get_resources][account_id: {self.account_id}] FINISHED: Route53 ({time.time() - start_time} sec)')
-        return resources
 
     def request_data(self) -> List[HostedZone]:
         cloudwatch_namespace = 'AWS/Route53'
@@ -1,7 +1,8 @@
 import time
 import logging
+import concurrent.futures
+from functools import partial
 from typing import List
-from spaceone.core import utils
 from datetime import datetime, timedelta
 from botocore.exceptions import ClientError
 from spaceone.inventory.connector.aws_s3_connector.schema.data import (
@@ -30,6 +31,29 @@ from spaceone.inventory.libs.schema.resource import CloudWatchModel
 from spaceone.inventory.conf.cloud_service_conf import *
 
 _LOGGER = logging.getLogger(__name__)
+S3_STORAGE_TYPES = [
+    "StandardStorage",
+    "IntelligentTieringFAStorage",
+    "IntelligentTieringIAStorage",
+    "IntelligentTieringAAStorage",
+    "IntelligentTieringAIAStorage",
+    "IntelligentTieringDAAStorage",
+    "StandardIAStorage",
+    "StandardIASizeOverhead",
+    "StandardIAObjectOverhead",
+    "OneZoneIAStorage",
+    "OneZoneIASizeOverhead",
+    "ReducedRedundancyStorage",
+    "GlacierInstantRetrievalStorage",
+    "GlacierStorage",
+    "GlacierStagingStorage",
+    "GlacierObjectOverhead",
+    "GlacierS3ObjectOverhead",
+    "DeepArchiveStorage",
+    "DeepArchiveObjectOverhead",
+    "DeepArchiveS3ObjectOverhead",
+    "DeepArchiveStagingStorage",
+]
 
 
 class S3Connector(SchematicAWSConnector):
@@ -41,21 +65,22 @@ class S3Connector(SchematicAWSConnector):
 
     def get_resources(self) -> List[BucketResource]:
         _LOGGER.debug(f"[get_resources][account_id: {self.account_id}] START: S3")
-        resources = []
         start_time = time.time()
 
         try:
-            resources.extend(self.set_cloud_service_types())
+            yield from self.set_cloud_service_types()
 
             # merge data
-            for data in self.request_data():
+            for collected_dict in self.request_data():
                 if (
-                    getattr(data, "resource_type", None)
-                    and data.resource_type == "inventory.ErrorResource"
+                    getattr(collected_dict, "resource_type", None)
+                    and collected_dict.resource_type == "inventory.ErrorResource"
                 ):
                     # Error Resource
-                    resources.append(data)
+                    yield collected_dict
                 else:
+                    data = collected_dict["data"]
+
                     # This is Global API, yet set up its region for bucket
                     if getattr(data, "set_cloudwatch", None):
                         data.cloudwatch = CloudWatchModel(data.set_cloudwatch())
@@ -64,7 +89,7 @@ class S3Connector(SchematicAWSConnector):
                         "name": data.name,
                         "data": data,
                         "account": self.account_id,
-                        "tags": self.get_tags(data.name),
+                        "tags": collected_dict["tags"],
                         "instance_size": float(data.size),
                         "reference": ReferenceModel(data.reference()),
                     }
@@ -76,109 +101,141 @@ class S3Connector(SchematicAWSConnector):
                             }
                         )
 
-                    resources.append(
-                        self.response_schema(
-                            {"resource": BucketResource(bucket_resource)}
-                        )
+                    yield self.response_schema(
+                        {"resource": BucketResource(bucket_resource)}
                     )
         except Exception as e:
             resource_id = ""
-            resources.append(self.generate_error("global", resource_id, e))
+            yield self.generate_error("global", resource_id, e)
 
         _LOGGER.debug(
             f"[get_resources][account_id: {self.account_id}] FINISHED: S3 ({time.time() - start_time} sec)"
         )
-        return resources
 
-    def request_data(self) -> List[Bucket]:
-        cloudwatch_namespace = "AWS/S3"
-        cloudwatch_dimension_name = "BucketName"
-        cloudtrail_resource_type = "AWS::S3::Bucket"
+    def request_data(self):
+        """
+        Yields the buckets in list_buckets order.
+        The detail getters of every bucket are queued as separate tasks on one pool of BUCKET_MAX_WORKER threads,
+        so no more S3 calls are in flight than the max_pool_connections of a client.
+        """
         response = self.client.list_buckets()
+        raw_buckets = response.get("Buckets", [])
 
-        for raw in response.get("Buckets", []):
-            bucket_name = raw.get("Name")
-            try:
-                region_name = self.get_bucket_location(bucket_name)
+        for raw, region_name in zip(
+            raw_buckets,
+            self.map_concurrently(
+                self.get_bucket_location,
+                [raw.get("Name") for raw in raw_buckets],
+                BUCKET_MAX_WORKER,
+            ),
+        ):
+            raw["region_name"] = region_name
 
-                raw.update(
-                    {
-                        "arn": self.generate_arn(
-                            service=self.service_name,
-                            region="",
-                            account_id="",
-                            resource_type=bucket_name,
-                            resource_id="*",
-                        ),
-                        "region_name": region_name,
-                        "cloudwatch": self.set_cloudwatch(
-                            cloudwatch_namespace,
-                            cloudwatch_dimension_name,
-                            raw["Name"],
-                            region_name,
-                        ),
-                        "cloudtrail": self.set_cloudtrail(
-                            region_name, cloudtrail_resource_type, raw["Name"]
-                        ),
-                    }
-                )
+        bucket_metrics = self.get_bucket_metrics(raw_buckets)
 
-                if versioning := self.get_bucket_versioning(bucket_name):
-                    raw.update({"versioning": versioning})
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=BUCKET_MAX_WORKER)
 
-                if server_access_logging := self.get_server_access_logging(bucket_name):
-                    raw.update({"server_access_logging": server_access_logging})
+        try:
+            bucket_futures = [
+                self.submit_bucket_details(executor, raw) for raw in raw_buckets
+            ]
 
-                if website_hosting := self.get_website_hosting(bucket_name):
-                    raw.update({"website_hosting": website_hosting})
+            for raw, futures in zip(raw_buckets, bucket_futures):
+                yield from self.request_bucket_data(raw, futures, bucket_metrics)
+        finally:
+            # a closed stream drops the getters which have not started yet
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def submit_bucket_details(self, executor, raw):
+        """
+        Submits every detail getter of a bucket to executor with a client of the bucket region.
+        Returns {detail key: Future}.
+        """
+        region_name = raw["region_name"]
+        connector = self.region_connector(region_name) if region_name else self
+        connector._share_client()
+
+        getters = {
+            "versioning": connector.get_bucket_versioning,
+            "server_access_logging": connector.get_server_access_logging,
+            "website_hosting": connector.get_website_hosting,
+            "encryption": connector.get_encryption,
+            "object_lock": connector.get_object_lock,
+            "public_access": connector.get_bucket_public_access,
+            "transfer_acceleration": connector.get_transfer_acceleration,
+            "request_payment": connector.get_request_payment,
+            "notification_configurations": connector.get_notification_configurations,
+            "bucket_acl": partial(connector.get_bucket_acl_info, need_all_info=True),
+            "bucket_policy": connector.get_bucket_policy_info,
+            "tags": connector.get_tags,
+        }
 
-                if encryption := self.get_encryption(bucket_name):
-                    raw.update({"encryption": encryption})
+        return {
+            key: executor.submit(getter, raw.get("Name"))
+            for key, getter in getters.items()
+        }
 
-                if object_lock := self.get_object_lock(bucket_name):
-                    raw.update({"object_lock": object_lock})
+    def request_bucket_data(self, raw, futures, bucket_metrics):
+        """
+        Yields {"data": Bucket, "tags": {...}} once every detail future of the bucket resolved.
+        """
+        cloudwatch_namespace = "AWS/S3"
+        cloudwatch_dimension_name = "BucketName"
+        cloudtrail_resource_type = "AWS::S3::Bucket"
+        bucket_name = raw.get("Name")
 
-                if public_access := self.get_bucket_public_access(bucket_name):
-                    raw.update({"public_access": public_access})
+        try:
+            region_name = raw["region_name"]
 
-                if transfer_acceleration := self.get_transfer_acceleration(bucket_name):
-                    raw.update({"transfer_acceleration": transfer_acceleration})
+            raw.update(
+                {
+                    "arn": self.generate_arn(
+                        service=self.service_name,
+                        region="",
+                        account_id="",
+                        resource_type=bucket_name,
+                        resource_id="*",
+                    ),
+                    "cloudwatch": self.set_cloudwatch(
+                        cloudwatch_namespace,
+                        cloudwatch_dimension_name,
+                        raw["Name"],
+                        region_name,
+                    ),
+                    "cloudtrail": self.set_cloudtrail(
+                        region_name, cloudtrail_resource_type, raw["Name"]
+                    ),
+                }
+            )
 
-                if request_payment := self.get_request_payment(bucket_name):
-                    raw.update({"request_payment": request_payment})
+            details = {key: future.result() for key, future in futures.items()}
 
-                if notification_configurations := self.get_notification_configurations(
-                    bucket_name
-                ):
-                    raw.update(
-                        {"notification_configurations": notification_configurations}
-                    )
+            tags = details.pop("tags")
+            bucket_policy = details.pop("bucket_policy")
 
-                if bucket_acl := self.get_bucket_acl_info(
-                    bucket_name, need_all_info=True
-                ):
-                    raw.update({"bucket_acl": bucket_acl})
+            for key, value in details.items():
+                if value:
+                    raw.update({key: value})
 
-                bucket_policy = self.get_bucket_policy_info(bucket_name)
-                if bucket_policy:
-                    raw.update(
-                        {"bucket_policy": bucket_policy, "policy_document_exists": True}
-                    )
-                else:
-                    raw.update({"policy_document_exists": False})
+            if bucket_policy:
+                raw.update(
+                    {"bucket_policy": bucket_policy, "policy_document_exists": True}
+                )
+            else:
+                raw.update({"policy_document_exists": False})
 
-                if region_name:
-                    count, size = self.get_count_and_size(bucket_name, region_name)
-                    raw.update(
-                        {"object_count": count, "object_total_size": size, "size": size}
-                    )
+            if region_name:
+                count, size = bucket_metrics.get(bucket_name, (0, 0))
+                raw.update(
+                    {"object_count": count, "object_total_size": size, "size": size}
+                )
 
-                yield Bucket(raw, strict=False)
+            yield {"data": Bucket(raw, strict=False), "tags": tags}
 
-            except Exception as e:
-                resource_id = raw.get("Name", "")
-                error_resource_response = self.generate_error("global", resource_id, e)
-                yield error_resource_response
+        except Exception as e:
+            resource_id = raw.get("Name", "")
+            error_resource_response = self.generate_error("global", resource_id, e)
+            yield error_resource_response
 
     def get_bucket_policy_info(self, bucket_name):
         try:
@@ -305,6 +362,11 @@ class S3Connector(SchematicAWSConnector):
             return None
 
     def get_tags(self, bucket_name):
+        tags = self.get_indexed_tags("s3", f"arn:aws:s3:::{bucket_name}")
+
+        if tags is not None:
+            return tags
+
         try:
             response = self.client.get_bucket_tagging(Bucket=bucket_name)
             return self.convert_tags_to_dict_type(response.get("TagSet", []))
@@ -361,67 +423,71 @@ class S3Connector(SchematicAWSConnector):
             _LOGGER.error(f"[S3 {bucket_name}: Get Bucket Location] {e}")
             return ""
 
-    def get_count_and_size(self, bucket_name, region_name):
-        try:
-            cloudwatch_client = self.session.client(
-                "cloudwatch", region_name=region_name, verify=BOTO3_HTTPS_VERIFIED
+    def get_bucket_metrics(self, raw_buckets):
+        """
+        Returns {bucket_name: (object_count, object_total_size)},
+        fetching the metrics of every bucket of a region in batched GetMetricData calls.
+        """
+        bucket_names_by_region = {}
+        for raw in raw_buckets:
+            if region_name := raw.get("region_name"):
+                bucket_names_by_region.setdefault(region_name, []).append(
+                    raw.get("Name")
+                )
+
+        bucket_metrics = {}
+        for region_name, bucket_names in bucket_names_by_region.items():
+            bucket_metrics.update(
+                self.get_region_bucket_metrics(region_name, bucket_names)
             )
 
-            count = self.get_object_count(cloudwatch_client, bucket_name)
-            size = self.get_object_total_size(cloudwatch_client, bucket_name)
+        return bucket_metrics
 
-            return count, size
-        except Exception as e:
-            _LOGGER.error(f"[S3 {bucket_name}: Get Count, Size] {e}")
-            return 0, 0
-
-    def get_object_count(self, cw_client, bucket_name):
-        count_dimensions = [
-            {"Name": "BucketName", "Value": bucket_name},
-            {"Name": "StorageType", "Value": "AllStorageTypes"},
-        ]
-
-        count_param = self._get_metric_param("NumberOfObjects", count_dimensions)
-        return int(self.get_metric_data(cw_client, count_param))
-
-    def get_object_total_size(self, cw_client, bucket_name):
-        total_size = 0.0
-
-        storage_types = [
-            "StandardStorage",
-            "IntelligentTieringFAStorage",
-            "IntelligentTieringIAStorage",
-            "IntelligentTieringAAStorage",
-            "IntelligentTieringAIAStorage",
-            "IntelligentTieringDAAStorage",
-            "StandardIAStorage",
-            "StandardIASizeOverhead",
-            "StandardIAObjectOverhead",
-            "OneZoneIAStorage",
-            "OneZoneIASizeOverhead",
-            "ReducedRedundancyStorage",
-            "GlacierInstantRetrievalStorage",
-            "GlacierStorage",
-            "GlacierStagingStorage",
-            "GlacierObjectOverhead",
-            "GlacierS3ObjectOverhead",
-            "DeepArchiveStorage",
-            "DeepArchiveObjectOverhead",
-            "DeepArchiveS3ObjectOverhead",
-            "DeepArchiveStagingStorage",
-        ]
-
-        for storage_type in storage_types:
-            size_dimensions = [
-                {"Name": "BucketName", "Value": bucket_name},
-                {"Name": "StorageType", "Value": storage_type},
-            ]
+    def get_region_bucket_metrics(self, region_name, bucket_names):
+        bucket_metrics = {bucket_name: (0, 0.0) for bucket_name in bucket_names}
 
-            size_param = self._get_metric_param("BucketSizeBytes", size_dimensions)
-            total_size += float(self.get_metric_data(cw_client, size_param))
-            time.sleep(0.1)
+        try:
+            cloudwatch_client = self.get_client("cloudwatch", region_name)
+            metric_queries = {}
 
-        return total_size
+            for bucket_index, bucket_name in enumerate(bucket_names):
+                metric_queries[f"count_{bucket_index}"] = self._get_metric_query(
+                    bucket_name, "NumberOfObjects", "AllStorageTypes"
+                )
+
+                for type_index, storage_type in enumerate(S3_STORAGE_TYPES):
+                    metric_queries[f"size_{bucket_index}_{type_index}"] = (
+                        self._get_metric_query(
+                            bucket_name, "BucketSizeBytes", storage_type
+                        )
+                    )
+
+            metric_values = {}
+            for metric_ids in self.divide_to_chunks(
+                list(metric_queries), MAX_METRIC_DATA_QUERIES
+            ):
+                metric_values.update(
+                    self.get_metric_data(
+                        cloudwatch_client,
+                        [
+                            dict(metric_queries[metric_id], Id=metric_id)
+                            for metric_id in metric_ids
+                        ],
+                    )
+                )
+
+            for bucket_index, bucket_name in enumerate(bucket_names):
+                count = int(metric_values.get(f"count_{bucket_index}", 0))
+                size = sum(
+                    float(metric_values.get(f"size_{bucket_index}_{type_index}", 0.0))
+                    for type_index in range(len(S3_STORAGE_TYPES))
+                )
+                bucket_metrics[bucket_name] = (count, size)
+
+        except Exception as e:
+            _LOGGER.error(f"[S3 {region_name}: Get Count, Size] {e}")
+
+        return bucket_metrics
 
     @staticmethod
     def update_grants_info(bucket_acl):
@@ -445,51 +511,41 @@ class S3Connector(SchematicAWSConnector):
             )
 
     @staticmethod
-    def get_metric_data(client, params):
-        metric_id = f"metric_{utils.random_string()[:12]}"
-        extra_opts = {}
-
-        if params.get("limit"):
-            extra_opts["MaxDatapoints"] = params.get("limit")
+    def get_metric_data(client, metric_data_queries):
+        """
+        Returns {query id: latest value} of metric_data_queries (up to MAX_METRIC_DATA_QUERIES).
+        """
+        end = datetime.utcnow()
+        paginator = client.get_paginator("get_metric_data")
+        metric_values = {}
 
-        response = client.get_metric_data(
-            MetricDataQueries=[
-                {
-                    "Id": metric_id,
-                    "MetricStat": {
-                        "Metric": {
-                            "Namespace": params.get("namespace"),
-                            "MetricName": params.get("metric_name"),
-                            "Dimensions": params.get("dimensions"),
-                        },
-                        "Period": params.get("period"),
-                        "Stat": params.get("stat"),
-                    },
-                }
-            ],
-            StartTime=params.get("start"),
-            EndTime=params.get("end"),
+        for response in paginator.paginate(
+            MetricDataQueries=metric_data_queries,
+            StartTime=end - timedelta(days=7),
+            EndTime=end,
             ScanBy="TimestampAscending",
-            **extra_opts,
-        )
+        ):
+            for result in response.get("MetricDataResults", []):
+                if values := result.get("Values"):
+                    metric_values[result["Id"]] = values[-1]
 
-        results = response.get("MetricDataResults", [])
-        target_value = results[0].get("Values") if len(results) > 0 else []
-        return target_value[len(target_value) - 1] if len(target_value) > 0 else 0.0
+        return metric_values
 
     @staticmethod
-    def _get_metric_param(metric_name, dimensions):
-        end = datetime.utcnow()
-
+    def _get_metric_query(bucket_name, metric_name, storage_type):
         return {
-            "id": f"metric_{utils.random_string()[:12]}",
-            "namespace": "AWS/S3",
-            "dimensions": dimensions,
-            "start": end - timedelta(days=7),
-            "end": datetime.utcnow(),
-            "period": 10800,
-            "metric_name": metric_name,
-            "stat": "Average",
+            "MetricStat": {
+                "Metric": {
+                    "Namespace": "AWS/S3",
+                    "MetricName": metric_name,
+                    "Dimensions": [
+                        {"Name": "BucketName", "Value": bucket_name},
+                        {"Name": "StorageType", "Value": storage_type},
+                    ],
+                },
+                "Period": 10800,
+                "Stat": "Average",
+            },
         }
 
     @staticmethod
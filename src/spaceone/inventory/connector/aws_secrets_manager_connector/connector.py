@@ -19,7 +19,6 @@ class SecretsManagerConnector(SchematicAWSConnector):
 
     def get_resources(self) -> List[SecretResource]:
         _LOGGER.debug(f"[get_resources][account_id: {self.account_id}] START: Secrets Manager")
-        resources = []
         start_time = time.time()
 
         collect_resource = {
@@ -28,19 +27,12 @@ class SecretsManagerConnector(SchematicAWSConnector):
             'response_schema': SecretResponse
         }
 
-        resources.extend(self.set_cloud_service_types())
+        yield from self.set_cloud_service_types()
 
         # merge data
-        for region_name in self.region_names:
-            try:
-                self.reset_region(region_name)
-                resources.extend(self.collect_data_by_region(self.service_name, region_name, collect_resource))
-            except Exception as e:
-                error_resource_response = self.generate_error(region_name, '', e)
-                resources.append(error_resource_response)
+        yield from self.collect_data_by_regions([collect_resource])
 
         _LOGGER.debug(f'[get_resources][account_id: {self.account_id}] FINISHED: Secrets Manager ({time.time() - start_time} sec)')
-        return resources
 
     def request_data(self, region_name) -> List[Secret]:
         cloudwatch_namespace = 'AWS/SecretsManager'
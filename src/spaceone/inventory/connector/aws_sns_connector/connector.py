@@ -22,7 +22,6 @@ class SNSConnector(SchematicAWSConnector):
 
     def get_resources(self) -> List[TopicResource]:
         _LOGGER.debug(f"[get_resources][account_id: {self.account_id}] START: SNS")
-        resources = []
         start_time = time.time()
 
         collect_resource = {
@@ -31,19 +30,12 @@ class SNSConnector(SchematicAWSConnector):
             'response_schema': TopicResponse
         }
 
-        resources.extend(self.set_cloud_service_types())
+        yield from self.set_cloud_service_types()
 
         # merge data
-        for region_name in self.region_names:
-            try:
-                self.reset_region(region_name)
-                resources.extend(self.collect_data_by_region(self.service_name, region_name, collect_resource))
-            except Exception as e:
-                error_resource_response = self.generate_error(region_name, '', e)
-                resources.append(error_resource_response)
+        yield from self.collect_data_by_regions([collect_resource])
 
         _LOGGER.debug(f'[get_resources][account_id: {self.account_id}] FINISHED: SNS ({time.time() - start_time} sec)')
-        return resources
 
     def request_data(self, region_name) -> List[Topic]:
         cloudwatch_namespace = 'AWS/SNS'
@@ -97,7 +89,7 @@ class SNSConnector(SchematicAWSConnector):
     @property
     def kms_client(self):
         if self._kms_client is None:
-            self._kms_client = self.session.client('kms', verify=BOTO3_HTTPS_VERIFIED)
+            self._kms_client = self.get_client('kms')
 
         return self._kms_client
 
@@ -148,6 +140,11 @@ class SNSConnector(SchematicAWSConnector):
         return None
 
     def list_tags(self, arn):
+        tags = self.get_indexed_tags('sns', arn)
+
+        if tags is not None:
+            return tags
+
         response = self.client.list_tags_for_resource(ResourceArn=arn)
         return self.convert_tags_to_dict_type(response.get('Tags', []))
 
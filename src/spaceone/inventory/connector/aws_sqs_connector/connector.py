@@ -18,7 +18,6 @@ class SQSConnector(SchematicAWSConnector):
 
     def get_resources(self) -> List[SQSResponse]:
         _LOGGER.debug(f"[get_resources][account_id: {self.account_id}] START: SQS")
-        resources = []
         start_time = time.time()
 
         collect_resource = {
@@ -27,25 +26,18 @@ class SQSConnector(SchematicAWSConnector):
             'response_schema': SQSResponse
         }
 
-        resources.extend(self.set_cloud_service_types())
+        yield from self.set_cloud_service_types()
 
         # merge data
-        for region_name in self.region_names:
-            try:
-                self.reset_region(region_name)
-                resources.extend(self.collect_data_by_region(self.service_name, region_name, collect_resource))
-            except Exception as e:
-                error_resource_response = self.generate_error(region_name, '', e)
-                resources.append(error_resource_response)
+        yield from self.collect_data_by_regions([collect_resource])
 
         _LOGGER.debug(f'[get_resources][account_id: {self.account_id}] FINISHED: SQS ({time.time() - start_time} sec)')
-        return resources
 
     def request_data(self, region_name) -> List[QueData]:
         cloudwatch_namespace = 'AWS/SQS'
         cloudwatch_dimension_name = 'QueueName'
         cloudtrail_resource_type = 'AWS::SQS::Queue'
-        resource = self.session.resource('sqs', verify=BOTO3_HTTPS_VERIFIED)
+        resource = self.get_resource('sqs')
 
         for que in resource.queues.all():
             try:
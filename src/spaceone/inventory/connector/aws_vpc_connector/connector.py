@@ -53,9 +53,16 @@ from spaceone.inventory.connector.aws_vpc_connector.schema.resource import (
 from spaceone.inventory.connector.aws_vpc_connector.schema.service_type import (
     CLOUD_SERVICE_TYPES,
 )
+from spaceone.inventory.connector.aws_vpc_connector.relationship_index import (
+    VPCRelationshipIndex,
+)
+from spaceone.inventory.conf.cloud_service_conf import *
 from spaceone.inventory.libs.connector import SchematicAWSConnector
 
 _LOGGER = logging.getLogger(__name__)
+VPC_ATTRIBUTES = ["enableDnsSupport", "enableDnsHostnames"]
+ROUTE_TABLE_PAGE_SIZE = 100
+EGRESS_ONLY_INTERNET_GATEWAY_PAGE_SIZE = 255
 PROTOCOL_NUMBER_INFO = {
     "0": "HOPOPT",
     "1": "ICMP",
@@ -210,19 +217,8 @@ class VPCConnector(SchematicAWSConnector):
     cloud_service_group = "VPC"
     cloud_service_types = CLOUD_SERVICE_TYPES
 
-    customer_gateways = None
-    vpn_gateways = None
-    vpn_connections = None
-    transit_gateways = None
-    peering_connections = None
-    nat_gateways = None
-    network_acls = None
-    endpoints = None
-    egress_only_internet_gateways = None
-    internet_gateways = None
-    route_tables = None
-    subnets = None
-    dhcp_options = None
+    relationship_index = None
+    vpc_attributes = None
     vpcs = []
     vpc_ids = []
 
@@ -230,8 +226,6 @@ class VPCConnector(SchematicAWSConnector):
 
     def get_resources(self):
         _LOGGER.debug(f"[get_resources][account_id: {self.account_id}] START: VPC")
-
-        resources = []
         start_time = time.time()
 
         collect_resources = [
@@ -302,58 +296,41 @@ class VPCConnector(SchematicAWSConnector):
             },
         ]
 
-        resources.extend(self.set_cloud_service_types())
+        yield from self.set_cloud_service_types()
 
         # Region
-        for region_name in self.region_names:
-            try:
-                self.reset_region(region_name)
-
-                self.customer_gateways = []
-                self.transit_gateways = []
-                self.vpn_gateways = []
-                self.vpn_connections = []
-                self.peering_connections = []
-                self.nat_gateways = []
-                self.network_acls = []
-                self.endpoints = []
-                self.egress_only_internet_gateways = []
-                self.internet_gateways = []
-                self.route_tables = []
-                self.subnets = []
-                self.dhcp_options = []
-
-                # VPC
-                self.vpcs = self.list_vpcs()
-                self.vpc_ids = [vpc.get("VpcId") for vpc in self.vpcs]
-
-                for collect_resource in collect_resources:
-                    resources.extend(
-                        self.collect_data_by_region(
-                            self.service_name, region_name, collect_resource
-                        )
-                    )
-            except Exception as e:
-                error_resource_response = self.generate_error(region_name, "", e)
-                resources.append(error_resource_response)
+        yield from self.collect_data_by_regions(collect_resources)
 
         _LOGGER.debug(
             f"[get_resources][account_id: {self.account_id}] FINISHED: VPC ({time.time() - start_time} sec)"
         )
-        return resources
+
+    def collect_region(self, region_name, collect_resources):
+        self.relationship_index = VPCRelationshipIndex()
+        self.vpc_attributes = {}
+
+        # VPC
+        self.vpcs = self.list_vpcs()
+        self.vpc_ids = [vpc.get("VpcId") for vpc in self.vpcs]
+
+        return super().collect_region(region_name, collect_resources)
 
     def request_vpc_data(self, region_name) -> List[VPC]:
         self.cloud_service_type = "VPC"
         cloudtrail_resource_type = "AWS::EC2::VPC"
 
-        if len(self.dhcp_options) > 0:
-            self.dhcp_options = self.describe_dhcp_options()
+        self.relationship_index.add_dhcp_options(self.describe_dhcp_options())
+
+        if self.relationship_index.transit_gateways:
+            self.relationship_index.add_transit_gateway_attachments(
+                self.describe_transit_gateway_attachments()
+            )
+
+        self.describe_vpc_attributes(self.vpc_ids, VPC_ATTRIBUTES)
 
         for vpc in self.vpcs:
             try:
-                route_tables = self._match_vpc_object(
-                    self.route_tables, vpc.get("VpcId")
-                )
+                route_tables = self._match_vpc_object("route_table", vpc.get("VpcId"))
 
                 vpc.update(
                     {
@@ -367,22 +344,20 @@ class VPCConnector(SchematicAWSConnector):
                             resource_type="vpc",
                             resource_id=vpc.get("VpcId"),
                         ),
-                        "subnets": self._match_vpc_object(
-                            self.subnets, vpc.get("VpcId")
-                        ),
+                        "subnets": self._match_vpc_object("subnet", vpc.get("VpcId")),
                         "route_tables": route_tables,
                         "main_route_table_id": self._get_main_route_table(route_tables),
                         "main_network_acl_id": self._get_main_network_acl(
-                            self._match_vpc_object(self.network_acls, vpc.get("VpcId"))
+                            self._match_vpc_object("network_acl", vpc.get("VpcId"))
                         ),
                         "endpoints": self._match_vpc_object(
-                            self.endpoints, vpc.get("VpcId")
+                            "endpoint", vpc.get("VpcId")
                         ),
                         "peering_connections": self._match_vpc_peering_connection(
                             vpc.get("VpcId")
                         ),
                         "nat_gateways": self._match_vpc_object(
-                            self.nat_gateways, vpc.get("VpcId")
+                            "nat_gateway", vpc.get("VpcId")
                         ),
                         "transit_gateway": self._match_transit_gateway(
                             vpc.get("VpcId")
@@ -428,7 +403,27 @@ class VPCConnector(SchematicAWSConnector):
                 )
                 yield {"data": error_resource_response}
 
+    def describe_vpc_attributes(self, vpc_ids, attributes):
+        """
+        Prefetches every (vpc_id, attribute) into vpc_attributes on VPC_ATTRIBUTE_MAX_WORKER threads.
+        describe_vpc_attribute calls the ones which failed again on its own.
+        """
+        self.fetch_concurrently(
+            lambda key: self._describe_vpc_attribute(*key),
+            [(vpc_id, attribute) for vpc_id in vpc_ids for attribute in attributes],
+            self.vpc_attributes,
+            VPC_ATTRIBUTE_MAX_WORKER,
+        )
+
     def describe_vpc_attribute(self, vpc_id, attribute):
+        if (vpc_id, attribute) not in self.vpc_attributes:
+            self.vpc_attributes[(vpc_id, attribute)] = self._describe_vpc_attribute(
+                vpc_id, attribute
+            )
+
+        return self.vpc_attributes[(vpc_id, attribute)]
+
+    def _describe_vpc_attribute(self, vpc_id, attribute):
         response = self.client.describe_vpc_attribute(VpcId=vpc_id, Attribute=attribute)
         _first_letter_upper_attr = attribute[:1].upper() + attribute[1:]
         if response[_first_letter_upper_attr]["Value"] is True:
@@ -439,27 +434,26 @@ class VPCConnector(SchematicAWSConnector):
     def request_peering_connection_data(self, region_name):
         self.cloud_service_type = "PeeringConnection"
         cloudtrail_resource_type = "AWS::EC2::VPCPeeringConnection"
-        vpc_peering_connections = []
-
         if self.include_default:
-            response = self.client.describe_vpc_peering_connections()
-            vpc_peering_connections = response.get("VpcPeeringConnections", [])
-        elif len(self.vpc_ids) > 0:
-            accepter_response = self.client.describe_vpc_peering_connections(
-                Filters=[{"Name": "accepter-vpc-info.vpc-id", "Values": self.vpc_ids}]
+            vpc_peering_connections = self.describe_all(
+                "describe_vpc_peering_connections", "VpcPeeringConnections"
             )
-
-            vpc_peering_connections = accepter_response.get("VpcPeeringConnections", [])
-            peerx_ids = [
-                _peerx.get("VpcPeeringConnectionId")
-                for _peerx in accepter_response.get("VpcPeeringConnections", [])
-            ]
-
-            requester_response = self.client.describe_vpc_peering_connections(
-                Filters=[{"Name": "requester-vpc-info.vpc-id", "Values": self.vpc_ids}]
+        else:
+            vpc_peering_connections = self.describe_all(
+                "describe_vpc_peering_connections",
+                "VpcPeeringConnections",
+                **self._vpc_filter("accepter-vpc-info.vpc-id"),
             )
+            peerx_ids = {
+                _peerx.get("VpcPeeringConnectionId")
+                for _peerx in vpc_peering_connections
+            }
 
-            for _peerx in requester_response.get("VpcPeeringConnections", []):
+            for _peerx in self.describe_all(
+                "describe_vpc_peering_connections",
+                "VpcPeeringConnections",
+                **self._vpc_filter("requester-vpc-info.vpc-id"),
+            ):
                 if _peerx.get("VpcPeeringConnectionId") not in peerx_ids:
                     vpc_peering_connections.append(_peerx)
 
@@ -485,7 +479,7 @@ class VPCConnector(SchematicAWSConnector):
                 )
 
                 peer_connect_vo = PeeringConnection(peerx, strict=False)
-                self.peering_connections.append(peer_connect_vo)
+                self.relationship_index.add_peering_connection(peer_connect_vo)
                 yield {
                     "data": peer_connect_vo,
                     "name": peer_connect_vo.name,
@@ -506,14 +500,13 @@ class VPCConnector(SchematicAWSConnector):
         cloudwatch_dimension_name = "NatGatewayId"
         cloudtrail_resource_type = "AWS::EC2::NatGateway"
 
-        response = {}
-        if self.include_default:
-            response = self.client.describe_nat_gateways()
-        elif len(self.vpc_ids) > 0:
-            _filters = [{"Name": "vpc-id", "Values": self.vpc_ids}]
-            response = self.client.describe_nat_gateways(Filters=_filters)
+        nat_gateways = [
+            ngw
+            for ngw in self.ec2_snapshot.get_nat_gateways(self.client)
+            if self.include_default or ngw.get("VpcId") in self.vpc_ids
+        ]
 
-        for ngw in response.get("NatGateways", []):
+        for ngw in nat_gateways:
             try:
                 ngw.update(
                     {
@@ -539,7 +532,7 @@ class VPCConnector(SchematicAWSConnector):
                 )
 
                 nat_gateway_vo = NATGateway(ngw, strict=False)
-                self.nat_gateways.append(nat_gateway_vo)
+                self.relationship_index.add_nat_gateway(nat_gateway_vo)
                 yield {
                     "data": nat_gateway_vo,
                     "name": nat_gateway_vo.name,
@@ -559,14 +552,11 @@ class VPCConnector(SchematicAWSConnector):
         self.cloud_service_type = "NetworkACL"
         cloudtrail_resource_type = "AWS::EC2::NetworkAcl"
 
-        response = {}
-        if self.include_default:
-            response = self.client.describe_network_acls()
-        elif len(self.vpc_ids) > 0:
-            _filters = [{"Name": "vpc-id", "Values": self.vpc_ids}]
-            response = self.client.describe_network_acls(Filters=_filters)
+        network_acls = self.describe_all(
+            "describe_network_acls", "NetworkAcls", **self._vpc_filter("vpc-id")
+        )
 
-        for nacl in response.get("NetworkAcls", []):
+        for nacl in network_acls:
             try:
                 inbound_rules, outbound_rules, total_rules = self._get_rules_from_rules(
                     nacl.get("Entries", [])
@@ -593,7 +583,7 @@ class VPCConnector(SchematicAWSConnector):
                 )
 
                 network_acl_vo = NetworkACL(nacl, strict=False)
-                self.network_acls.append(network_acl_vo)
+                self.relationship_index.add_network_acl(network_acl_vo)
                 yield {
                     "data": network_acl_vo,
                     "name": network_acl_vo.name,
@@ -612,14 +602,11 @@ class VPCConnector(SchematicAWSConnector):
         self.cloud_service_type = "Endpoint"
         cloudtrail_resource_type = "AWS::EC2::VPCEndpoint"
 
-        response = {}
-        if self.include_default:
-            response = self.client.describe_vpc_endpoints()
-        elif len(self.vpc_ids) > 0:
-            _filters = [{"Name": "vpc-id", "Values": self.vpc_ids}]
-            response = self.client.describe_vpc_endpoints(Filters=_filters)
+        endpoints = self.describe_all(
+            "describe_vpc_endpoints", "VpcEndpoints", **self._vpc_filter("vpc-id")
+        )
 
-        for endp in response.get("VpcEndpoints", []):
+        for endp in endpoints:
             try:
                 endp.update(
                     {
@@ -639,7 +626,7 @@ class VPCConnector(SchematicAWSConnector):
                 )
 
                 endpoint_vo = Endpoint(endp, strict=False)
-                self.endpoints.append(endpoint_vo)
+                self.relationship_index.add_endpoint(endpoint_vo)
                 yield {
                     "data": endpoint_vo,
                     "name": endpoint_vo.name,
@@ -662,16 +649,14 @@ class VPCConnector(SchematicAWSConnector):
         self.cloud_service_type = "EgressOnlyInternetGateway"
         cloudtrail_resource_type = "AWS::EC2::EgressOnlyInternetGateway"
 
-        response = {}
-        if self.include_default:
-            response = self.client.describe_egress_only_internet_gateways()
-        elif len(self.vpc_ids) > 0:
-            _filters = [{"Name": "vpc-id", "Values": self.vpc_ids}]
-            response = self.client.describe_egress_only_internet_gateways(
-                Filters=_filters
-            )
+        egress_only_internet_gateways = self.describe_all(
+            "describe_egress_only_internet_gateways",
+            "EgressOnlyInternetGateways",
+            page_size=EGRESS_ONLY_INTERNET_GATEWAY_PAGE_SIZE,
+            **self._vpc_filter("vpc-id"),
+        )
 
-        for eoigw in response.get("EgressOnlyInternetGateways", []):
+        for eoigw in egress_only_internet_gateways:
             try:
                 eoigw.update(
                     {
@@ -695,7 +680,7 @@ class VPCConnector(SchematicAWSConnector):
                 egress_only_internet_gateway_vo = EgressOnlyInternetGateway(
                     eoigw, strict=False
                 )
-                self.egress_only_internet_gateways.append(
+                self.relationship_index.add_egress_only_internet_gateway(
                     egress_only_internet_gateway_vo
                 )
                 yield {
@@ -716,14 +701,13 @@ class VPCConnector(SchematicAWSConnector):
         self.cloud_service_type = "InternetGateway"
         cloudtrail_resource_type = "AWS::EC2::InternetGateway"
 
-        response = {}
-        if self.include_default:
-            response = self.client.describe_internet_gateways()
-        elif len(self.vpc_ids) > 0:
-            _filters = [{"Name": "attachment.vpc-id", "Values": self.vpc_ids}]
-            response = self.client.describe_internet_gateways(Filters=_filters)
+        internet_gateways = self.describe_all(
+            "describe_internet_gateways",
+            "InternetGateways",
+            **self._vpc_filter("attachment.vpc-id"),
+        )
 
-        for igw in response.get("InternetGateways", []):
+        for igw in internet_gateways:
             try:
                 state = None
                 _attachments = igw.get("Attachments", [])
@@ -753,7 +737,7 @@ class VPCConnector(SchematicAWSConnector):
                     igw.update({"state": state})
 
                 internet_gateway_vo = InternetGateway(igw, strict=False)
-                self.internet_gateways.append(internet_gateway_vo)
+                self.relationship_index.add_internet_gateway(internet_gateway_vo)
                 yield {
                     "data": internet_gateway_vo,
                     "name": internet_gateway_vo.name,
@@ -772,14 +756,14 @@ class VPCConnector(SchematicAWSConnector):
         self.cloud_service_type = "RouteTable"
         cloudtrail_resource_type = "AWS::EC2::RouteTable"
 
-        response = {}
-        if self.include_default:
-            response = self.client.describe_route_tables()
-        elif len(self.vpc_ids) > 0:
-            _filters = [{"Name": "vpc-id", "Values": self.vpc_ids}]
-            response = self.client.describe_route_tables(Filters=_filters)
+        route_tables = self.describe_all(
+            "describe_route_tables",
+            "RouteTables",
+            page_size=ROUTE_TABLE_PAGE_SIZE,
+            **self._vpc_filter("vpc-id"),
+        )
 
-        for rt in response.get("RouteTables", []):
+        for rt in route_tables:
             try:
                 subnet_associations, edge_associations, main = self._get_association(
                     rt.get("Associations", [])
@@ -807,7 +791,7 @@ class VPCConnector(SchematicAWSConnector):
                 )
 
                 route_table_vo = RouteTable(rt, strict=False)
-                self.route_tables.append(route_table_vo)
+                self.relationship_index.add_route_table(route_table_vo)
                 yield {
                     "data": route_table_vo,
                     "name": route_table_vo.name,
@@ -826,14 +810,11 @@ class VPCConnector(SchematicAWSConnector):
         self.cloud_service_type = "Subnet"
         cloudtrail_resource_type = "AWS::EC2::Subnet"
 
-        response = {}
-        if self.include_default:
-            response = self.client.describe_subnets()
-        elif len(self.vpc_ids) > 0:
-            _filters = [{"Name": "vpc-id", "Values": self.vpc_ids}]
-            response = self.client.describe_subnets(Filters=_filters)
+        subnets = self.describe_all(
+            "describe_subnets", "Subnets", **self._vpc_filter("vpc-id")
+        )
 
-        for subnet in response.get("Subnets", []):
+        for subnet in subnets:
             try:
                 subnet.update(
                     {
@@ -862,7 +843,7 @@ class VPCConnector(SchematicAWSConnector):
                     subnet.update({"nat_gateways": match_nat_gateways})
 
                 subnet_vo = Subnet(subnet, strict=False)
-                self.subnets.append(subnet_vo)
+                self.relationship_index.add_subnet(subnet_vo)
                 yield {
                     "data": subnet_vo,
                     "name": subnet_vo.name,
@@ -884,9 +865,11 @@ class VPCConnector(SchematicAWSConnector):
         cloudwatch_namespace = "AWS/TransitGateway"
         cloudwatch_dimension_name = "TransitGateway"
 
-        response = self.client.describe_transit_gateways()
+        transit_gateways = self.describe_all(
+            "describe_transit_gateways", "TransitGateways"
+        )
 
-        for transit_gateway in response.get("TransitGateways", []):
+        for transit_gateway in transit_gateways:
             try:
                 transit_gateway.update(
                     {
@@ -912,7 +895,7 @@ class VPCConnector(SchematicAWSConnector):
                 )
 
                 tgw_vo = TransitGateway(transit_gateway, strict=False)
-                self.transit_gateways.append(tgw_vo)
+                self.relationship_index.add_transit_gateway(tgw_vo)
                 yield {
                     "data": tgw_vo,
                     "name": tgw_vo.name,
@@ -934,9 +917,11 @@ class VPCConnector(SchematicAWSConnector):
         self.cloud_service_type = "CustomerGateway"
         cloudtrail_resource_type = "AWS::EC2::CustomerGateway"
 
-        response = self.client.describe_customer_gateways()
+        customer_gateways = self.describe_all(
+            "describe_customer_gateways", "CustomerGateways"
+        )
 
-        for customer_gateway in response.get("CustomerGateways", []):
+        for customer_gateway in customer_gateways:
             try:
                 customer_gateway.update(
                     {
@@ -960,7 +945,6 @@ class VPCConnector(SchematicAWSConnector):
                     customer_gateway.update({"vpn_connection": _match_vpn_conn[0]})
 
                 customer_gw_vo = CustomerGateway(customer_gateway, strict=False)
-                self.customer_gateways.append(customer_gw_vo)
                 yield {
                     "data": customer_gw_vo,
                     "name": customer_gw_vo.name,
@@ -982,9 +966,9 @@ class VPCConnector(SchematicAWSConnector):
         self.cloud_service_type = "VPNGateway"
         cloudtrail_resource_type = "AWS::EC2::VPNGateway"
 
-        response = self.client.describe_vpn_gateways()
+        vpn_gateways = self.describe_all("describe_vpn_gateways", "VpnGateways")
 
-        for vpn_gateway in response.get("VpnGateways", []):
+        for vpn_gateway in vpn_gateways:
             try:
                 vpn_gateway.update(
                     {
@@ -1006,7 +990,7 @@ class VPCConnector(SchematicAWSConnector):
                     vpn_gateway.update({"vpn_connection": _match_vpn_conn[0]})
 
                 vpn_gw_vo = VPNGateway(vpn_gateway, strict=False)
-                self.vpn_gateways.append(vpn_gw_vo)
+                self.relationship_index.add_vpn_gateway(vpn_gw_vo)
                 yield {
                     "data": vpn_gw_vo,
                     "name": vpn_gw_vo.name,
@@ -1028,8 +1012,10 @@ class VPCConnector(SchematicAWSConnector):
         cloudwatch_dimension_name = "VpnId"
         cloudtrail_resource_type = "AWS::EC2::VPNConnection"
 
-        response = self.client.describe_vpn_connections()
-        for vpn_connection in response.get("VpnConnections", []):
+        vpn_connections = self.describe_all(
+            "describe_vpn_connections", "VpnConnections"
+        )
+        for vpn_connection in vpn_connections:
             try:
                 vpn_connection.update(
                     {
@@ -1052,7 +1038,7 @@ class VPCConnector(SchematicAWSConnector):
                 )
 
                 vpn_conn_vo = VPNConnection(vpn_connection, strict=False)
-                self.vpn_connections.append(vpn_conn_vo)
+                self.relationship_index.add_vpn_connection(vpn_conn_vo)
                 yield {
                     "data": vpn_conn_vo,
                     "name": vpn_conn_vo.name,
@@ -1107,86 +1093,34 @@ class VPCConnector(SchematicAWSConnector):
         return inbounds, outbounds, total_rules
 
     def _match_route_table(self, subnet_id):
-        for route_table in self.route_tables:
-            for subnet_asso in route_table.subnet_associations:
-                if subnet_asso.subnet_id == subnet_id:
-                    return route_table
-
-        return None
+        return self.relationship_index.get_route_table(subnet_id)
 
     def _match_network_acl(self, subnet_id):
-        for nacl in self.network_acls:
-            if associations := getattr(nacl, "associations", None):
-                for asso in associations:
-                    if asso.subnet_id == subnet_id:
-                        return nacl
-
-        return None
+        return self.relationship_index.get_network_acl(subnet_id)
 
     def _match_internet_gateway(self, vpc_id):
-        for igw in self.internet_gateways:
-            if attachments := getattr(igw, "attachments", None):
-                for attach in attachments:
-                    if attach.vpc_id == vpc_id:
-                        return igw
-
-        return None
+        return self.relationship_index.get_internet_gateway(vpc_id)
 
     def _match_transit_gateway(self, vpc_id):
-        if len(self.transit_gateways) > 0:
-            filters = [
-                {"Name": "resource-type", "Values": ["vpc"]},
-                {
-                    "Name": "transit-gateway-id",
-                    "Values": [
-                        transit_gw.transit_gateway_id
-                        for transit_gw in self.transit_gateways
-                    ],
-                },
-                {"Name": "resource-id", "Values": [vpc_id]},
-            ]
-
-            response = self.client.describe_transit_gateway_attachments(Filters=filters)
-
-            for _attach in response.get("TransitGatewayAttachments", []):
-                transit_gw_id = _attach.get("TransitGatewayId")
-                for transit_gw in self.transit_gateways:
-                    if transit_gw_id == transit_gw.transit_gateway_id:
-                        return transit_gw
-
-        return None
+        return self.relationship_index.get_transit_gateway_by_vpc(vpc_id)
 
     def _match_vpn_gateway(self, vpc_id):
-        for vpn_gw in self.vpn_gateways:
-            if vpc_attachments := getattr(vpn_gw, "vpc_attachments", None):
-                for _attach in vpc_attachments:
-                    if vpc_id == _attach.vpc_id:
-                        return vpn_gw
-
-        return None
+        return self.relationship_index.get_vpn_gateway(vpc_id)
 
     def _match_nat_gateways(self, subnet_id):
-        return [ngw for ngw in self.nat_gateways if ngw.subnet_id == subnet_id]
+        return self.relationship_index.get_nat_gateways(subnet_id)
 
     def _match_egress_only_internet_gateway(self, vpc_id):
-        for eoigw in self.egress_only_internet_gateways:
-            if attachments := getattr(eoigw, "attachments", None):
-                for attach in attachments:
-                    if attach.vpc_id == vpc_id:
-                        return eoigw
-
-        return None
+        return self.relationship_index.get_egress_only_internet_gateway(vpc_id)
 
     def _match_dhcp_options(self, dhcp_option_id):
-        for dhcp_option in self.dhcp_options:
-            if dhcp_option.get("DhcpOptionsId") == dhcp_option_id:
-                return DHCPOptions(dhcp_option, strict=False)
+        if dhcp_option := self.relationship_index.get_dhcp_options(dhcp_option_id):
+            return DHCPOptions(dhcp_option, strict=False)
 
         return None
 
-    @staticmethod
-    def _match_vpc_object(objects, vpc_id):
-        return [obj for obj in objects if obj.vpc_id == vpc_id]
+    def _match_vpc_object(self, object_type, vpc_id):
+        return self.relationship_index.get_vpc_objects(object_type, vpc_id)
 
     @staticmethod
     def _get_main_route_table(route_tables):
@@ -1240,38 +1174,10 @@ class VPCConnector(SchematicAWSConnector):
         return return_routes
 
     def _match_vpc_peering_connection(self, vpc_id):
-        match_peering_connections = []
-        for peercon in self.peering_connections:
-            if (
-                getattr(peercon, "accepter_vpc_info", None) is not None
-                and peercon.accepter_vpc_info.vpc_id == vpc_id
-            ):
-                match_peering_connections.append(peercon)
-            elif (
-                getattr(peercon, "requester_vpc_info", None) is not None
-                and peercon.requester_vpc_info.vpc_id == vpc_id
-            ):
-                match_peering_connections.append(peercon)
-
-        return match_peering_connections
+        return self.relationship_index.get_peering_connections(vpc_id)
 
     def _match_vpn_connection(self, resource_type, resource_id):
-        match_vpn_connections = []
-
-        resource_type_map = {
-            "transit_gateway": "transit_gateway_id",
-            "customer_gateway": "customer_gateway_id",
-            "vpn_gateway": "vpn_gateway_id",
-        }
-
-        for vpnconn in self.vpn_connections:
-            if target_resource_id := getattr(
-                vpnconn, resource_type_map.get(resource_type, ""), None
-            ):
-                if target_resource_id == resource_id:
-                    match_vpn_connections.append(vpnconn)
-
-        return match_vpn_connections
+        return self.relationship_index.get_vpn_connections(resource_type, resource_id)
 
     @staticmethod
     def _get_main_network_acl(nacls):
@@ -1282,26 +1188,42 @@ class VPCConnector(SchematicAWSConnector):
             return ""
 
     def describe_dhcp_options(self):
-        response = self.client.describe_dhcp_options()
-        return response.get("DhcpOptions", [])
+        return self.describe_all("describe_dhcp_options", "DhcpOptions")
+
+    def describe_transit_gateway_attachments(self):
+        """
+        VPC attachments of the transit gateways of this region, in one paginated sweep
+        instead of one call per VPC.
+        """
+        return self.describe_all(
+            "describe_transit_gateway_attachments",
+            "TransitGatewayAttachments",
+            filter_name="transit-gateway-id",
+            filter_values=list(self.relationship_index.transit_gateways),
+            Filters=[{"Name": "resource-type", "Values": ["vpc"]}],
+        )
 
     def list_vpcs(self):
-        vpcs = []
         _filter_value = ["false"]
 
         if self.include_default:
             _filter_value.append("true")
 
-        paginator = self.client.get_paginator("describe_vpcs")
-        response_iterator = paginator.paginate(
-            Filters=[{"Name": "isDefault", "Values": _filter_value}],
-            PaginationConfig={"MaxItems": 10000},
-        )
+        return [
+            vpc
+            for vpc in self.ec2_snapshot.get_vpcs(self.client)
+            if str(vpc.get("IsDefault", False)).lower() in _filter_value
+        ]
 
-        for data in response_iterator:
-            vpcs = vpcs + data.get("Vpcs", [])
+    def _vpc_filter(self, filter_name):
+        """
+        describe_all arguments limiting a describe call to the collected VPCs.
+        Nothing is filtered when default VPCs are included.
+        """
+        if self.include_default:
+            return {}
 
-        return vpcs
+        return {"filter_name": filter_name, "filter_values": self.vpc_ids}
 
     def _get_associated_cidr_blocks(self, cidr_blocks):
         return [cidr for cidr in cidr_blocks if self._is_associated_cidr_block(cidr)]
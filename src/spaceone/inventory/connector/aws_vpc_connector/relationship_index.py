@@ -0,0 +1,150 @@
+VPN_CONNECTION_TARGETS = {
+    "transit_gateway": "transit_gateway_id",
+    "customer_gateway": "customer_gateway_id",
+    "vpn_gateway": "vpn_gateway_id",
+}
+
+
+class VPCRelationshipIndex:
+    """
+    Relationships between the VPC resources of a region, indexed by VPC, subnet and gateway id.
+
+    The request methods of a region add each resource once they built it,
+    and later request methods look relationships up here instead of scanning every resource of the region.
+    Where a lookup returns a single resource, the first one added wins.
+    """
+
+    def __init__(self):
+        self.vpc_objects = {}
+        self.route_table_by_subnet = {}
+        self.network_acl_by_subnet = {}
+        self.nat_gateways_by_subnet = {}
+        self.internet_gateway_by_vpc = {}
+        self.egress_only_internet_gateway_by_vpc = {}
+        self.vpn_gateway_by_vpc = {}
+        self.peering_connections_by_vpc = {}
+        self.vpn_connections_by_target = {}
+        self.transit_gateways = {}
+        self.transit_gateway_attachments_by_vpc = {}
+        self.dhcp_options = {}
+
+    def add_vpc_object(self, object_type, vpc_object):
+        self.vpc_objects.setdefault((object_type, vpc_object.vpc_id), []).append(
+            vpc_object
+        )
+
+    def get_vpc_objects(self, object_type, vpc_id):
+        return list(self.vpc_objects.get((object_type, vpc_id), []))
+
+    def add_subnet(self, subnet):
+        self.add_vpc_object("subnet", subnet)
+
+    def add_endpoint(self, endpoint):
+        self.add_vpc_object("endpoint", endpoint)
+
+    def add_route_table(self, route_table):
+        self.add_vpc_object("route_table", route_table)
+
+        for subnet_asso in route_table.subnet_associations or []:
+            self.route_table_by_subnet.setdefault(subnet_asso.subnet_id, route_table)
+
+    def add_network_acl(self, nacl):
+        self.add_vpc_object("network_acl", nacl)
+
+        for asso in getattr(nacl, "associations", None) or []:
+            self.network_acl_by_subnet.setdefault(asso.subnet_id, nacl)
+
+    def add_nat_gateway(self, nat_gateway):
+        self.add_vpc_object("nat_gateway", nat_gateway)
+        self.nat_gateways_by_subnet.setdefault(nat_gateway.subnet_id, []).append(
+            nat_gateway
+        )
+
+    def add_internet_gateway(self, igw):
+        for attach in getattr(igw, "attachments", None) or []:
+            self.internet_gateway_by_vpc.setdefault(attach.vpc_id, igw)
+
+    def add_egress_only_internet_gateway(self, eoigw):
+        for attach in getattr(eoigw, "attachments", None) or []:
+            self.egress_only_internet_gateway_by_vpc.setdefault(attach.vpc_id, eoigw)
+
+    def add_vpn_gateway(self, vpn_gateway):
+        for attach in getattr(vpn_gateway, "vpc_attachments", None) or []:
+            self.vpn_gateway_by_vpc.setdefault(attach.vpc_id, vpn_gateway)
+
+    def add_peering_connection(self, peering_connection):
+        vpc_ids = []
+
+        for vpc_info in ["accepter_vpc_info", "requester_vpc_info"]:
+            if getattr(peering_connection, vpc_info, None) is not None:
+                vpc_id = getattr(peering_connection, vpc_info).vpc_id
+
+                if vpc_id not in vpc_ids:
+                    vpc_ids.append(vpc_id)
+
+        for vpc_id in vpc_ids:
+            self.peering_connections_by_vpc.setdefault(vpc_id, []).append(
+                peering_connection
+            )
+
+    def add_vpn_connection(self, vpn_connection):
+        for resource_type, field_name in VPN_CONNECTION_TARGETS.items():
+            if target_resource_id := getattr(vpn_connection, field_name, None):
+                self.vpn_connections_by_target.setdefault(
+                    (resource_type, target_resource_id), []
+                ).append(vpn_connection)
+
+    def add_transit_gateway(self, transit_gateway):
+        self.transit_gateways[transit_gateway.transit_gateway_id] = transit_gateway
+
+    def add_transit_gateway_attachments(self, attachments):
+        for attachment in attachments:
+            if attachment.get("ResourceType") == "vpc":
+                self.transit_gateway_attachments_by_vpc.setdefault(
+                    attachment.get("ResourceId"), []
+                ).append(attachment)
+
+    def add_dhcp_options(self, dhcp_options):
+        for dhcp_option in dhcp_options:
+            self.dhcp_options.setdefault(dhcp_option.get("DhcpOptionsId"), dhcp_option)
+
+    def get_route_table(self, subnet_id):
+        return self.route_table_by_subnet.get(subnet_id)
+
+    def get_network_acl(self, subnet_id):
+        return self.network_acl_by_subnet.get(subnet_id)
+
+    def get_nat_gateways(self, subnet_id):
+        return list(self.nat_gateways_by_subnet.get(subnet_id, []))
+
+    def get_internet_gateway(self, vpc_id):
+        return self.internet_gateway_by_vpc.get(vpc_id)
+
+    def get_egress_only_internet_gateway(self, vpc_id):
+        return self.egress_only_internet_gateway_by_vpc.get(vpc_id)
+
+    def get_vpn_gateway(self, vpc_id):
+        return self.vpn_gateway_by_vpc.get(vpc_id)
+
+    def get_peering_connections(self, vpc_id):
+        return list(self.peering_connections_by_vpc.get(vpc_id, []))
+
+    def get_vpn_connections(self, resource_type, resource_id):
+        return list(
+            self.vpn_connections_by_target.get((resource_type, resource_id), [])
+        )
+
+    def get_transit_gateway(self, transit_gateway_id):
+        return self.transit_gateways.get(transit_gateway_id)
+
+    def get_transit_gateway_by_vpc(self, vpc_id):
+        for attachment in self.transit_gateway_attachments_by_vpc.get(vpc_id, []):
+            if transit_gateway := self.get_transit_gateway(
+                attachment.get("TransitGatewayId")
+            ):
+                return transit_gateway
+
+        return None
+
+    def get_dhcp_options(self, dhcp_options_id):
+        return self.dhcp_options.get(dhcp_options_id)
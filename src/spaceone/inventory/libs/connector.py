@@ -1,12 +1,16 @@
+import concurrent.futures
+import copy
 import json
 import logging
 import datetime
 from functools import partial
 from typing import List
-from boto3.session import Session
-from spaceone.core import utils
 from spaceone.core.connector import BaseConnector
 from spaceone.inventory.conf.cloud_service_conf import *
+from spaceone.inventory.libs.ec2_snapshot import EC2Snapshot
+from spaceone.inventory.libs.session_pool import SESSION_POOL
+from spaceone.inventory.libs.stream import stream_concurrently
+from spaceone.inventory.libs.tag_index import TagIndex
 from spaceone.inventory.libs.schema.resource import (
     CloudServiceResponse,
     ReferenceModel,
@@ -42,37 +46,13 @@ REGIONS = [
 
 
 def get_session(secret_data, region_name):
-    params = {
-        "aws_access_key_id": secret_data["aws_access_key_id"],
-        "aws_secret_access_key": secret_data["aws_secret_access_key"],
-        "region_name": region_name,
-    }
+    return SESSION_POOL.get_session(secret_data, region_name)
 
-    session = Session(**params)
 
-    # ASSUME ROLE
-    if role_arn := secret_data.get("role_arn"):
-        sts = session.client("sts", verify=BOTO3_HTTPS_VERIFIED)
-
-        _assume_role_request = {
-            "RoleArn": role_arn,
-            "RoleSessionName": utils.generate_id("AssumeRoleSession"),
-        }
-
-        if external_id := secret_data.get("external_id"):
-            _assume_role_request.update({"ExternalId": external_id})
-
-        assume_role_object = sts.assume_role(**_assume_role_request)
-        credentials = assume_role_object["Credentials"]
-
-        assume_role_params = {
-            "aws_access_key_id": credentials["AccessKeyId"],
-            "aws_secret_access_key": credentials["SecretAccessKey"],
-            "region_name": region_name,
-            "aws_session_token": credentials["SessionToken"],
-        }
-        session = Session(**assume_role_params)
-    return session
+def get_client(secret_data, region_name, service_name, client_config=None):
+    return SESSION_POOL.get_client(
+        secret_data, region_name, service_name, client_config
+    )
 
 
 class AWSConnector(BaseConnector):
@@ -109,19 +89,41 @@ class AWSConnector(BaseConnector):
         self.filter = filter
         self.account_id = kwargs.get("account_id")
         self.region_names = kwargs.get("regions", [])
+        self.scheduler = kwargs.get("scheduler")
+        self.ec2_snapshot = kwargs.get("ec2_snapshot") or EC2Snapshot()
+        self.tag_index = kwargs.get("tag_index") or TagIndex()
 
     def reset_region(self, region_name):
         self.region_name = region_name
         self._client = None
+        self._init_client = None
         self._session = None
 
     def set_client(self, service_name):
         self.service_name = service_name
-        self._client = self.session.client(
-            self.service_name, verify=BOTO3_HTTPS_VERIFIED
-        )
+        self._client = self.get_client(self.service_name)
         return self._client
 
+    def get_client(self, service_name, region_name=None):
+        """
+        Returns a pooled client which is shared by every connector using the same credentials.
+        region_name defaults to the region of this connector.
+        """
+        return get_client(
+            self.secret_data,
+            region_name or self.region_name,
+            service_name,
+            self.options.get("client_config"),
+        )
+
+    def get_resource(self, service_name, region_name=None):
+        return SESSION_POOL.create_resource(
+            self.secret_data,
+            region_name or self.region_name,
+            service_name,
+            self.options.get("client_config"),
+        )
+
     @property
     def session(self):
         return self.init_property(
@@ -131,17 +133,34 @@ class AWSConnector(BaseConnector):
     @property
     def init_client(self):
         if self._init_client is None:
-            self._init_client = self.session.client("ec2", verify=BOTO3_HTTPS_VERIFIED)
+            self._init_client = self.get_client("ec2")
         return self._init_client
 
     @property
     def client(self):
         if self._client is None:
-            self._client = self.session.client(
-                self.service_name, verify=BOTO3_HTTPS_VERIFIED
-            )
+            self._client = self.get_client(self.service_name)
         return self._client
 
+    def _share_client(self):
+        # resolved once before worker threads share self.client, so none of them races to set it
+        return self.client
+
+    def get_indexed_tags(self, resource_type, arn, region_name=None):
+        """
+        Returns the tags of arn from the tag index of region_name (the connector region by default).
+        Returns None when the tag_index option is off or the index could not be loaded,
+        then the caller fetches the tags with its own service API.
+        """
+        if not self.options.get("tag_index", True):
+            return None
+
+        return self.tag_index.get_tags(
+            self.get_client("resourcegroupstaggingapi", region_name),
+            resource_type,
+            arn,
+        )
+
     @staticmethod
     def generate_arn(
         partition=ARN_DEFAULT_PARTITION,
@@ -163,6 +182,101 @@ class AWSConnector(BaseConnector):
         for i in range(0, len(resources), n):
             yield resources[i : i + n]
 
+    def describe_all(
+        self,
+        operation_name,
+        result_key,
+        filter_name=None,
+        filter_values=None,
+        page_size=DESCRIBE_PAGE_SIZE,
+        **query,
+    ):
+        """
+        Returns every item under result_key of operation_name, following all pages.
+
+        With filter_name, filter_values are sent as a filter of at most FILTER_VALUES_MAX values per request.
+        The chunks are fetched concurrently and an empty filter_values returns nothing without a call.
+        Operations without a paginator are called once.
+        """
+        if filter_name is None:
+            return self._describe_all(operation_name, result_key, page_size, query)
+
+        queries = [
+            dict(
+                query,
+                Filters=query.get("Filters", [])
+                + [{"Name": filter_name, "Values": values}],
+            )
+            for values in self.divide_to_chunks(list(filter_values), FILTER_VALUES_MAX)
+        ]
+
+        return [
+            item
+            for items in self.map_concurrently(
+                partial(self._describe_all, operation_name, result_key, page_size),
+                queries,
+                DESCRIBE_MAX_WORKER,
+            )
+            for item in items
+        ]
+
+    def map_concurrently(self, function, items, max_workers):
+        """
+        Returns [function(item) for item in items], computed on at most max_workers threads
+        sharing the rate limited client of the connector.
+        A single item is computed on the calling thread.
+        """
+        items = list(items)
+
+        if len(items) <= 1:
+            return [function(item) for item in items]
+
+        self._share_client()
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(len(items), max_workers)
+        ) as executor:
+            return list(executor.map(function, items))
+
+    def fetch_concurrently(self, fetch, keys, cache, max_workers):
+        """
+        Stores fetch(key) in cache for every key which is not cached yet,
+        concurrently on max_workers threads sharing the rate limited client of the connector.
+        A fetch which still fails after the client retries is left out of cache,
+        so the caller fetches that key again on its own.
+        """
+        keys = [key for key in keys if key not in cache]
+
+        if not keys:
+            return
+
+        self._share_client()
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(fetch, key): key for key in keys}
+
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    cache[futures[future]] = future.result()
+                except Exception as e:
+                    _LOGGER.warning(
+                        f"[fetch_concurrently] [{self.service_name}] {futures[future]} deferred: {e}"
+                    )
+
+    def _describe_all(self, operation_name, result_key, page_size, query):
+        if not self.client.can_paginate(operation_name):
+            return getattr(self.client, operation_name)(**query).get(result_key, [])
+
+        items = []
+        paginator = self.client.get_paginator(operation_name)
+
+        for data in paginator.paginate(
+            **query, PaginationConfig={"PageSize": page_size}
+        ):
+            items.extend(data.get(result_key, []))
+
+        return items
+
 
 class SchematicAWSConnector(AWSConnector):
     function_response_schema = CloudServiceResponse
@@ -177,6 +291,125 @@ class SchematicAWSConnector(AWSConnector):
     def collect_data(self):
         return self.get_resources()
 
+    @property
+    def region_max_workers(self):
+        return self.options.get("region_max_workers", REGION_MAX_WORKER)
+
+    @property
+    def stream_queue_size(self):
+        return self.options.get("stream_queue_size", STREAM_QUEUE_SIZE)
+
+    def enrich_concurrently(self, enrich, items, max_workers):
+        """
+        Runs enrich(item), a generator, for every item on a pool of max_workers threads
+        and yields results in completion order.
+        The workers share the pooled client of the connector, so its rate limiter and adaptive retries
+        back off all of them together when the service throttles.
+        """
+        self._share_client()
+
+        yield from stream_concurrently(
+            [partial(enrich, item) for item in items],
+            max_workers,
+            self.stream_queue_size,
+        )
+
+    def region_connector(self, region_name):
+        """
+        Returns a copy of this connector bound to region_name.
+        Sessions, clients and per-region caches set on the copy never touch the shared instance,
+        so regions can be collected concurrently.
+        """
+        region_connector = copy.copy(self)
+        region_connector.reset_region(region_name)
+        return region_connector
+
+    def collect_data_by_regions(self, collect_resources, region_names=None):
+        """
+        Fans collect_resources out over region_names (self.region_names by default),
+        one isolated region connector per task, at most region_max_workers tasks at a time.
+        Resources are yielded as soon as any task builds them.
+
+        With a WorkScheduler every (region, request_method) is its own task on the shared pool.
+        Connectors overriding collect_region set up per-region state there,
+        so each of their regions stays a single task.
+        """
+        if region_names is None:
+            region_names = self.region_names
+
+        if self.scheduler is None:
+            yield from stream_concurrently(
+                [
+                    partial(self._collect_region, region_name, collect_resources)
+                    for region_name in region_names
+                ],
+                self.region_max_workers,
+                self.stream_queue_size,
+            )
+        else:
+            yield from self.scheduler.stream(
+                self.__class__.__name__,
+                self._region_tasks(collect_resources, region_names),
+                self.region_max_workers,
+                self.stream_queue_size,
+            )
+
+    def _region_tasks(self, collect_resources, region_names):
+        if type(self).collect_region is not SchematicAWSConnector.collect_region:
+            return [
+                (
+                    region_name,
+                    "collect_region",
+                    partial(self._collect_region, region_name, collect_resources),
+                )
+                for region_name in region_names
+            ]
+
+        return [
+            (
+                region_name,
+                collect_resource["request_method"].__name__,
+                partial(self._collect_region, region_name, [collect_resource]),
+            )
+            for region_name in region_names
+            for collect_resource in collect_resources
+        ]
+
+    def _collect_region(self, region_name, collect_resources):
+        region_connector = self.region_connector(region_name)
+
+        try:
+            yield from region_connector.collect_region(
+                region_name,
+                [
+                    region_connector.bind_collect_resource(collect_resource)
+                    for collect_resource in collect_resources
+                ],
+            )
+        except Exception as e:
+            yield region_connector.generate_error(region_name, "", e)
+
+    def bind_collect_resource(self, collect_resource):
+        request_method = collect_resource["request_method"]
+
+        if getattr(request_method, "__self__", None) is None:
+            return collect_resource
+
+        return dict(
+            collect_resource,
+            request_method=getattr(self, request_method.__name__),
+        )
+
+    def collect_region(self, region_name, collect_resources):
+        """
+        Collects every collect_resource of a single region.
+        Override to set up per-region caches or to skip resources in some regions.
+        """
+        for collect_resource in collect_resources:
+            yield from self.collect_data_by_region(
+                self.service_name, region_name, collect_resource
+            )
+
     def collect_data_by_region(self, service_name, region_name, collect_resource_info):
         """
         collect_resource_info = {
@@ -186,7 +419,6 @@ class SchematicAWSConnector(AWSConnector):
             'kwargs': {}
         }
         """
-        resources = []
         additional_data = ["name", "type", "size", "launched_at"]
 
         try:
@@ -200,7 +432,7 @@ class SchematicAWSConnector(AWSConnector):
                     and data.resource_type == "inventory.ErrorResource"
                 ):
                     # Error Resource
-                    resources.append(data)
+                    yield data
                 else:
                     # Cloud Service Resource
                     if getattr(data, "set_cloudwatch", None):
@@ -223,23 +455,19 @@ class SchematicAWSConnector(AWSConnector):
                         if add_field in collected_dict:
                             resource_dict.update({add_field: collected_dict[add_field]})
 
-                    resources.append(
-                        collect_resource_info["response_schema"](
-                            {
-                                "resource": collect_resource_info["resource"](
-                                    resource_dict
-                                )
-                            }
-                        )
+                    yield collect_resource_info["response_schema"](
+                        {"resource": collect_resource_info["resource"](resource_dict)}
                     )
         except Exception as e:
             resource_id = ""
-            error_resource_response = self.generate_error(region_name, resource_id, e)
-            resources.append(error_resource_response)
+            yield self.generate_error(region_name, resource_id, e)
 
-        return resources
+    def generate_error(
+        self, region_name, resource_id, error_message, cloud_service_type=None
+    ):
+        # workers sharing one connector pass their cloud_service_type instead of setting it
+        cloud_service_type = cloud_service_type or self.cloud_service_type
 
-    def generate_error(self, region_name, resource_id, error_message):
         _LOGGER.error(
             f"[generate_error] [{self.service_name}] [{region_name}] {error_message}",
             exc_info=True,
@@ -252,7 +480,7 @@ class SchematicAWSConnector(AWSConnector):
                     "resource": {
                         "resource_id": resource_id,
                         "cloud_service_group": self.cloud_service_group,
-                        "cloud_service_type": self.cloud_service_type,
+                        "cloud_service_type": cloud_service_type,
                     },
                 }
             )
@@ -263,7 +491,7 @@ class SchematicAWSConnector(AWSConnector):
                     "resource": {
                         "resource_id": resource_id,
                         "cloud_service_group": self.cloud_service_group,
-                        "cloud_service_type": self.cloud_service_type,
+                        "cloud_service_type": cloud_service_type,
                     },
                 }
             )
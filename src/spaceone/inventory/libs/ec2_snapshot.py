@@ -0,0 +1,111 @@
+import copy
+import logging
+import threading
+from functools import partial
+
+from spaceone.inventory.conf.cloud_service_conf import *
+
+_LOGGER = logging.getLogger(__name__)
+
+INSTANCE_STATES = ["pending", "running", "shutting-down", "stopping", "stopped"]
+
+
+class EC2Snapshot:
+    """
+    EC2 describe results of one collection, shared by every connector which needs them.
+
+    Each (region, dataset) is described once: the first caller loads it and concurrent callers
+    of the same key wait for that load instead of repeating it. A failed load is not kept,
+    so the next caller tries again.
+    Callers get deep copies, so updating the returned items never leaks into other connectors.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._results = {}
+        self._load_locks = {}
+
+    def get_instances(self, ec2_client):
+        """
+        Instances of the client region which are not terminated.
+        """
+        return self._get(
+            ec2_client, "instances", partial(self._describe_instances, ec2_client)
+        )
+
+    def get_instance_lifecycles(self, ec2_client):
+        """
+        {instance_id: InstanceLifecycle} of get_instances, "scheduled" when AWS omits it.
+        The dict is shared, callers must not update it.
+        """
+        return self._load(
+            ec2_client,
+            "instance_lifecycles",
+            lambda: {
+                instance.get("InstanceId"): instance.get(
+                    "InstanceLifecycle", "scheduled"
+                )
+                for instance in self._load(
+                    ec2_client,
+                    "instances",
+                    partial(self._describe_instances, ec2_client),
+                )
+            },
+        )
+
+    def get_vpcs(self, ec2_client):
+        return self._get(
+            ec2_client,
+            "vpcs",
+            lambda: [
+                vpc
+                for data in self._paginate(ec2_client, "describe_vpcs")
+                for vpc in data.get("Vpcs", [])
+            ],
+        )
+
+    def get_nat_gateways(self, ec2_client):
+        return self._get(
+            ec2_client,
+            "nat_gateways",
+            lambda: [
+                nat_gateway
+                for data in self._paginate(ec2_client, "describe_nat_gateways")
+                for nat_gateway in data.get("NatGateways", [])
+            ],
+        )
+
+    def _get(self, ec2_client, dataset, load):
+        return copy.deepcopy(self._load(ec2_client, dataset, load))
+
+    def _load(self, ec2_client, dataset, load):
+        key = (ec2_client.meta.region_name, dataset)
+
+        with self._lock:
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+
+        with load_lock:
+            if key not in self._results:
+                _LOGGER.debug(f"[EC2Snapshot] load {key}")
+                self._results[key] = load()
+
+        return self._results[key]
+
+    def _describe_instances(self, ec2_client):
+        return [
+            instance
+            for data in self._paginate(
+                ec2_client,
+                "describe_instances",
+                Filters=[{"Name": "instance-state-name", "Values": INSTANCE_STATES}],
+            )
+            for reservation in data.get("Reservations", [])
+            for instance in reservation.get("Instances", [])
+        ]
+
+    @staticmethod
+    def _paginate(ec2_client, operation_name, **query):
+        paginator = ec2_client.get_paginator(operation_name)
+        return paginator.paginate(
+            **query, PaginationConfig={"PageSize": DESCRIBE_PAGE_SIZE}
+        )
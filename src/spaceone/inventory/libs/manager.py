@@ -15,24 +15,22 @@ class AWSManager(BaseManager):
         connector = self.locator.get_connector(self.connector_name, secret_data=secret_data)
         connector.verify()
 
-    def collect_resources(self, **kwargs) -> list:
+    def collect_resources(self, **kwargs):
         try:
             connector = self.locator.get_connector(self.connector_name, **kwargs)
-            return connector.collect_data()
+            yield from connector.collect_data()
         except Exception as e:
             _LOGGER.error(f'[collect_resources] {e}')
 
             if type(e) is dict:
-                return [
-                    ErrorResourceResponse(
-                        {'message': json.dumps(e),
-                         'resource': {'cloud_service_group': connector.cloud_service_group,
-                                      'cloud_service_type': connector.cloud_service_type}}
-                    )]
+                yield ErrorResourceResponse(
+                    {'message': json.dumps(e),
+                     'resource': {'cloud_service_group': connector.cloud_service_group,
+                                  'cloud_service_type': connector.cloud_service_type}}
+                )
             else:
-                return [
-                    ErrorResourceResponse(
-                        {'message': str(e),
-                         'resource': {'cloud_service_group': connector.cloud_service_group,
-                                      'cloud_service_type': connector.cloud_service_type}}
-                    )]
+                yield ErrorResourceResponse(
+                    {'message': str(e),
+                     'resource': {'cloud_service_group': connector.cloud_service_group,
+                                  'cloud_service_type': connector.cloud_service_type}}
+                )
@@ -0,0 +1,109 @@
+import logging
+import threading
+import time
+from functools import partial
+
+from spaceone.inventory.conf.cloud_service_conf import *
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    Token bucket whose refill rate follows AIMD: every successful request raises the rate by
+    RATE_LIMIT_INCREASE requests/sec, every throttled one multiplies it by RATE_LIMIT_DECREASE.
+    The bucket holds up to one second worth of tokens for bursts.
+    """
+
+    def __init__(self, rate=RATE_LIMIT_INITIAL):
+        self.rate = rate
+        self.tokens = rate
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                self._refill()
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                wait_time = (1 - self.tokens) / self.rate
+
+            time.sleep(wait_time)
+
+    def on_success(self):
+        with self._lock:
+            self.rate = min(self.rate + RATE_LIMIT_INCREASE, RATE_LIMIT_MAX)
+
+    def on_throttled(self):
+        with self._lock:
+            self.rate = max(self.rate * RATE_LIMIT_DECREASE, RATE_LIMIT_MIN)
+            self.tokens = min(self.tokens, 0)
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(
+            self.tokens + (now - self.updated_at) * self.rate, max(self.rate, 1)
+        )
+        self.updated_at = now
+
+
+class RateLimiter:
+    """
+    Process-wide token buckets, one per (account, service, region).
+
+    register() hooks a botocore client so that every HTTP attempt, retries included,
+    takes a token first and every response adjusts the rate of its bucket.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets = {}
+
+    def get_bucket(self, key) -> TokenBucket:
+        with self._lock:
+            if key not in self._buckets:
+                self._buckets[key] = TokenBucket()
+
+            return self._buckets[key]
+
+    def register(self, client, account_key):
+        bucket = self.get_bucket(
+            (
+                account_key,
+                client.meta.service_model.service_name,
+                client.meta.region_name,
+            )
+        )
+
+        client.meta.events.register("before-send", partial(self._on_send, bucket))
+        client.meta.events.register("needs-retry", partial(self._on_response, bucket))
+
+    @staticmethod
+    def _on_send(bucket, **kwargs):
+        bucket.acquire()
+        # a return value would replace the HTTP response
+        return None
+
+    @staticmethod
+    def _on_response(bucket, response=None, **kwargs):
+        if response is None:
+            return None
+
+        http_response, parsed = response
+        error_code = parsed.get("Error", {}).get("Code")
+
+        if error_code in THROTTLING_ERROR_CODES:
+            _LOGGER.debug(f"[RateLimiter] {error_code}, decrease rate")
+            bucket.on_throttled()
+        elif http_response.status_code < 400:
+            bucket.on_success()
+
+        # never takes part in the retry decision
+        return None
+
+
+RATE_LIMITER = RateLimiter()
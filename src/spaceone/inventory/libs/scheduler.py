@@ -0,0 +1,165 @@
+import itertools
+import logging
+import threading
+import time
+from collections import defaultdict
+
+from spaceone.inventory.conf.cloud_service_conf import *
+from spaceone.inventory.libs.stream import ResultStream
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TaskDurations:
+    """
+    Exponentially weighted moving average of task durations in seconds,
+    kept for the lifetime of the plugin process so that later collections are
+    scheduled with what earlier ones measured.
+    """
+
+    def __init__(self, alpha=TASK_DURATION_ALPHA):
+        self.alpha = alpha
+        self._lock = threading.Lock()
+        self._durations = {}
+
+    def expected(self, key):
+        return self._durations.get(key)
+
+    def record(self, key, duration):
+        with self._lock:
+            previous = self._durations.get(key)
+
+            if previous is None:
+                self._durations[key] = duration
+            else:
+                self._durations[key] = (
+                    self.alpha * duration + (1 - self.alpha) * previous
+                )
+
+
+TASK_DURATIONS = TaskDurations()
+
+
+class _Task:
+    def __init__(self, sequence, service, key, producer, result_stream):
+        self.sequence = sequence
+        self.service = service
+        self.key = key
+        self.producer = producer
+        self.result_stream = result_stream
+
+        expected = TASK_DURATIONS.expected(key)
+        # Tasks that never ran are scheduled first, so their duration gets measured early
+        self.expected = float("inf") if expected is None else expected
+
+    def priority(self):
+        return self.expected, -self.sequence
+
+
+class WorkScheduler:
+    """
+    Shared worker pool for the (service, region, task) work of one collection.
+
+    Every connector hands its tasks to the same pool. Workers always pick the pending task with
+    the longest expected duration (see TaskDurations) among the services that are still
+    below their concurrency limit, so long tasks start early and short ones fill the gaps
+    instead of one slow service dominating the wall time.
+    """
+
+    def __init__(self, max_workers):
+        self.max_workers = max_workers
+        self._condition = threading.Condition()
+        self._sequence = itertools.count()
+        self._pending = []
+        self._running = defaultdict(int)
+        self._limits = {}
+        self._workers = []
+        self._is_shutdown = False
+
+    def stream(self, service, tasks, max_concurrency, queue_size):
+        """
+        tasks = [(region_name, task_name, producer), ...]
+        Runs at most max_concurrency tasks of service at the same time and yields
+        the items of every producer as soon as they are built.
+        """
+        tasks = list(tasks)
+
+        if not tasks:
+            return
+
+        result_stream = ResultStream(queue_size)
+
+        with self._condition:
+            if self._is_shutdown:
+                raise RuntimeError("WorkScheduler is already shut down")
+
+            self._limits[service] = max_concurrency
+
+            for region_name, task_name, producer in tasks:
+                self._pending.append(
+                    _Task(
+                        next(self._sequence),
+                        service,
+                        (service, region_name, task_name),
+                        producer,
+                        result_stream,
+                    )
+                )
+
+            self._start_workers()
+            self._condition.notify_all()
+
+        yield from result_stream.consume(len(tasks))
+
+    def shutdown(self):
+        with self._condition:
+            self._is_shutdown = True
+            self._pending = []
+            self._condition.notify_all()
+
+        for worker in self._workers:
+            worker.join()
+
+    def _start_workers(self):
+        while len(self._workers) < self.max_workers:
+            worker = threading.Thread(target=self._work, daemon=True)
+            worker.start()
+            self._workers.append(worker)
+
+    def _next_task(self):
+        runnable = [
+            task
+            for task in self._pending
+            if self._running[task.service] < self._limits[task.service]
+        ]
+
+        if not runnable:
+            return None
+
+        task = max(runnable, key=_Task.priority)
+        self._pending.remove(task)
+        return task
+
+    def _work(self):
+        while True:
+            with self._condition:
+                task = self._next_task()
+
+                while task is None:
+                    if self._is_shutdown:
+                        return
+
+                    self._condition.wait()
+                    task = self._next_task()
+
+                self._running[task.service] += 1
+
+            start_time = time.time()
+
+            try:
+                if task.result_stream.produce(task.producer):
+                    TASK_DURATIONS.record(task.key, time.time() - start_time)
+            finally:
+                with self._condition:
+                    self._running[task.service] -= 1
+                    self._condition.notify_all()
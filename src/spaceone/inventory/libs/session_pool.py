@@ -0,0 +1,261 @@
+import hashlib
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache, partial
+
+import botocore.session
+from boto3.session import Session
+from botocore.config import Config
+from botocore.credentials import RefreshableCredentials
+from spaceone.core import utils
+from spaceone.inventory.conf.cloud_service_conf import *
+from spaceone.inventory.libs.rate_limiter import RATE_LIMITER
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def get_client_config_key(client_config=None):
+    """
+    Merges client_config (the client_config collector option) over CLIENT_CONFIG
+    into a hashable key.
+    """
+    params = dict(CLIENT_CONFIG)
+    params.update(client_config or {})
+    return tuple(sorted(params.items()))
+
+
+@lru_cache(maxsize=None)
+def create_client_config(client_config_key) -> Config:
+    params = dict(client_config_key)
+
+    return Config(
+        retries={"mode": params["retry_mode"], "max_attempts": params["max_attempts"]},
+        max_pool_connections=params["max_pool_connections"],
+        connect_timeout=params["connect_timeout"],
+        read_timeout=params["read_timeout"],
+        tcp_keepalive=params["tcp_keepalive"],
+    )
+
+
+class PooledSession:
+    def __init__(self, session, expires_at, account_key):
+        self.session = session
+        self.account_key = account_key
+        self.expires_at = expires_at
+        self.clients = {}
+        # boto3 sessions are not thread safe, so client creation is serialized per session
+        self.lock = threading.Lock()
+
+    def is_expired(self):
+        return time.time() >= self.expires_at
+
+    def get_client(self, service_name, client_config=None):
+        client_key = (service_name, get_client_config_key(client_config))
+
+        with self.lock:
+            if client_key not in self.clients:
+                client = self.session.client(
+                    service_name,
+                    verify=BOTO3_HTTPS_VERIFIED,
+                    config=create_client_config(client_key[1]),
+                )
+                RATE_LIMITER.register(client, self.account_key)
+                self.clients[client_key] = client
+
+            return self.clients[client_key]
+
+    def create_resource(self, service_name, client_config=None):
+        # boto3 resources are not thread safe, so they are never shared
+        with self.lock:
+            resource = self.session.resource(
+                service_name,
+                verify=BOTO3_HTTPS_VERIFIED,
+                config=create_client_config(get_client_config_key(client_config)),
+            )
+
+        RATE_LIMITER.register(resource.meta.client, self.account_key)
+        return resource
+
+
+class SessionPool:
+    """
+    Process-wide cache of boto3 sessions and clients.
+
+    Sessions are keyed by (credential fingerprint, role_arn, region_name) and clients by
+    (service name, client config) on top of that. Entries expire after SESSION_POOL_TTL seconds.
+
+    When secret_data has a role_arn, the role is assumed once per (credential fingerprint, role_arn)
+    and every region shares the resulting RefreshableCredentials, which assume the role again
+    by themselves shortly before the STS credentials expire.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._key_locks = {}
+        self._sessions = {}
+        self._credentials = {}
+
+    def get_session(self, secret_data, region_name) -> Session:
+        return self._get_pooled_session(secret_data, region_name).session
+
+    def get_client(self, secret_data, region_name, service_name, client_config=None):
+        return self._get_pooled_session(secret_data, region_name).get_client(
+            service_name, client_config
+        )
+
+    def create_resource(
+        self, secret_data, region_name, service_name, client_config=None
+    ):
+        return self._get_pooled_session(secret_data, region_name).create_resource(
+            service_name, client_config
+        )
+
+    def clear(self):
+        with self._lock:
+            self._sessions = {}
+            self._credentials = {}
+
+    def _get_pooled_session(self, secret_data, region_name) -> PooledSession:
+        key = (
+            self.fingerprint(secret_data),
+            secret_data.get("role_arn"),
+            region_name,
+        )
+
+        with self._lock:
+            pooled_session = self._sessions.get(key)
+
+        if pooled_session is not None and not pooled_session.is_expired():
+            return pooled_session
+
+        with self._key_lock(key):
+            with self._lock:
+                pooled_session = self._sessions.get(key)
+
+            if pooled_session is None or pooled_session.is_expired():
+                pooled_session = PooledSession(
+                    self._create_session(secret_data, region_name),
+                    time.time() + SESSION_POOL_TTL,
+                    key[:2],
+                )
+
+                with self._lock:
+                    self._sessions[key] = pooled_session
+                    self._evict_expired()
+
+        return pooled_session
+
+    @contextmanager
+    def _key_lock(self, key):
+        """
+        Serializes the threads building (and assuming the role for) the same key.
+        The lock is shared while any thread waits for or holds it, and dropped by the last one.
+        """
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, [threading.Lock(), 0])
+            key_lock[1] += 1
+
+        try:
+            with key_lock[0]:
+                yield
+        finally:
+            with self._lock:
+                key_lock[1] -= 1
+
+                if key_lock[1] == 0 and self._key_locks.get(key) is key_lock:
+                    del self._key_locks[key]
+
+    def _evict_expired(self):
+        # callers hold self._lock
+        for key in [key for key, value in self._sessions.items() if value.is_expired()]:
+            del self._sessions[key]
+
+        # keep the credentials of live sessions and of keys being built right now
+        credential_keys = {key[:2] for key in self._sessions}
+        credential_keys.update(key[:2] for key in self._key_locks)
+        for key in [key for key in self._credentials if key not in credential_keys]:
+            del self._credentials[key]
+
+    def _create_session(self, secret_data, region_name):
+        if secret_data.get("role_arn"):
+            botocore_session = botocore.session.get_session()
+            botocore_session._credentials = self._get_role_credentials(secret_data)
+            return Session(botocore_session=botocore_session, region_name=region_name)
+
+        return self._create_base_session(secret_data, region_name)
+
+    def _get_role_credentials(self, secret_data) -> RefreshableCredentials:
+        key = (self.fingerprint(secret_data), secret_data["role_arn"])
+
+        with self._lock:
+            credentials = self._credentials.get(key)
+
+        if credentials is not None:
+            return credentials
+
+        # the key lock only keeps a second thread from assuming the same role
+        with self._key_lock(key):
+            with self._lock:
+                credentials = self._credentials.get(key)
+
+            if credentials is None:
+                credentials = RefreshableCredentials.create_from_metadata(
+                    metadata=self._assume_role(secret_data),
+                    refresh_using=partial(self._assume_role, secret_data),
+                    method="sts-assume-role",
+                )
+
+                with self._lock:
+                    self._credentials[key] = credentials
+
+        return credentials
+
+    @staticmethod
+    def fingerprint(secret_data):
+        credential = ":".join(
+            [
+                secret_data.get("aws_access_key_id", ""),
+                secret_data.get("aws_secret_access_key", ""),
+                secret_data.get("external_id", ""),
+            ]
+        )
+        return hashlib.sha256(credential.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _create_base_session(secret_data, region_name):
+        params = {
+            "aws_access_key_id": secret_data["aws_access_key_id"],
+            "aws_secret_access_key": secret_data["aws_secret_access_key"],
+            "region_name": region_name,
+        }
+
+        return Session(**params)
+
+    def _assume_role(self, secret_data):
+        _LOGGER.debug(f"[_assume_role] {secret_data['role_arn']}")
+
+        session = self._create_base_session(secret_data, DEFAULT_REGION)
+        sts = session.client("sts", verify=BOTO3_HTTPS_VERIFIED)
+
+        _assume_role_request = {
+            "RoleArn": secret_data["role_arn"],
+            "RoleSessionName": utils.generate_id("AssumeRoleSession"),
+        }
+
+        if external_id := secret_data.get("external_id"):
+            _assume_role_request.update({"ExternalId": external_id})
+
+        assume_role_object = sts.assume_role(**_assume_role_request)
+        credentials = assume_role_object["Credentials"]
+
+        return {
+            "access_key": credentials["AccessKeyId"],
+            "secret_key": credentials["SecretAccessKey"],
+            "token": credentials["SessionToken"],
+            "expiry_time": credentials["Expiration"].isoformat(),
+        }
+
+
+SESSION_POOL = SessionPool()
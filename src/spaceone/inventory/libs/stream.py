@@ -0,0 +1,109 @@
+import concurrent.futures
+import logging
+import queue
+import threading
+
+from spaceone.inventory.conf.cloud_service_conf import *
+
+_LOGGER = logging.getLogger(__name__)
+
+_DONE = object()
+
+
+class ResultStream:
+    """
+    Bounded queue between producer threads and a single consumer.
+
+    Items go through a queue of at most queue_size entries, so producers pause while
+    the consumer lags instead of buffering whole result sets in memory.
+    When the consumer stops early (the gRPC stream is cancelled or the generator is closed),
+    producers are stopped and closed instead of waiting on a queue nobody reads.
+    """
+
+    def __init__(self, queue_size):
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.stopped = threading.Event()
+
+    def put(self, item):
+        while not self.stopped.is_set():
+            try:
+                self.queue.put(item, timeout=STREAM_PUT_TIMEOUT)
+                return True
+            except queue.Full:
+                continue
+
+        return False
+
+    def produce(self, producer):
+        """
+        Puts every item of producer() and then marks the producer as done.
+        Returns True when the producer ran to the end without being stopped.
+        Producers are expected to turn their own errors into error resources; anything that still
+        escapes is logged and ends that producer only.
+        """
+        if self.stopped.is_set():
+            return False
+
+        items = None
+        completed = False
+        try:
+            items = producer()
+            for item in items:
+                if not self.put(item):
+                    break
+            else:
+                completed = True
+        except Exception as e:
+            _LOGGER.error(f"[ResultStream] {e}", exc_info=True)
+        finally:
+            if hasattr(items, "close"):
+                items.close()
+
+            self.put(_DONE)
+
+        return completed
+
+    def consume(self, producer_count):
+        """
+        Yields items until producer_count producers are done.
+        """
+        remaining = producer_count
+
+        try:
+            while remaining:
+                item = self.queue.get()
+
+                if item is _DONE:
+                    remaining -= 1
+                else:
+                    yield item
+        finally:
+            if remaining:
+                _LOGGER.debug(
+                    f"[ResultStream] consumer stopped, cancel {remaining} producers"
+                )
+
+            self.stopped.set()
+
+
+def stream_concurrently(producers, max_workers, queue_size):
+    """
+    Runs every producer (a callable returning an iterable) on a pool of max_workers threads
+    and yields items as soon as any producer builds them, through a ResultStream.
+    """
+    producers = list(producers)
+
+    if not producers:
+        return
+
+    result_stream = ResultStream(queue_size)
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+
+    try:
+        for producer in producers:
+            executor.submit(result_stream.produce, producer)
+
+        yield from result_stream.consume(len(producers))
+    finally:
+        result_stream.stopped.set()
+        executor.shutdown(wait=True)
@@ -0,0 +1,71 @@
+import logging
+import threading
+
+from spaceone.inventory.conf.cloud_service_conf import *
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TagIndex:
+    """
+    {ResourceARN: tags} of one collection, read from the Resource Groups Tagging API.
+
+    Each (region, resource_type) is loaded once with a paginated GetResources filtered by resource_type,
+    and concurrent callers of the same key wait for that load instead of repeating it.
+    GetResources returns every resource which is or was tagged, so an ARN missing from a loaded index has no tags.
+    A failed load is kept as None, so every resource of that key falls back to its service API without retrying.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._indexes = {}
+        self._load_locks = {}
+
+    def get_tags(self, tagging_client, resource_type, arn):
+        """
+        Returns the tags of arn as {key: value},
+        or None when the index of the client region and resource_type could not be loaded.
+        """
+        index = self._load(tagging_client, resource_type)
+
+        if index is None:
+            return None
+
+        return dict(index.get(arn, {}))
+
+    def _load(self, tagging_client, resource_type):
+        key = (tagging_client.meta.region_name, resource_type)
+
+        with self._lock:
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+
+        with load_lock:
+            if key not in self._indexes:
+                _LOGGER.debug(f"[TagIndex] load {key}")
+                self._indexes[key] = self._get_resources(tagging_client, resource_type)
+
+        return self._indexes[key]
+
+    @staticmethod
+    def _get_resources(tagging_client, resource_type):
+        index = {}
+
+        try:
+            paginator = tagging_client.get_paginator("get_resources")
+
+            for data in paginator.paginate(
+                ResourceTypeFilters=[resource_type],
+                PaginationConfig={"PageSize": TAG_INDEX_PAGE_SIZE},
+            ):
+                for resource in data.get("ResourceTagMappingList", []):
+                    index[resource.get("ResourceARN")] = {
+                        tag.get("Key"): tag.get("Value")
+                        for tag in resource.get("Tags", [])
+                    }
+        except Exception as e:
+            _LOGGER.error(
+                f"[TagIndex] {tagging_client.meta.region_name} {resource_type}: {e}"
+            )
+            return None
+
+        return index
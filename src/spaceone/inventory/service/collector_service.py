@@ -1,10 +1,14 @@
-import concurrent.futures
 import logging
 import time
 import json
+from functools import partial
 from spaceone.core.service import *
 from spaceone.inventory.conf.cloud_service_conf import *
 from spaceone.inventory.libs.connector import *
+from spaceone.inventory.libs.ec2_snapshot import EC2Snapshot
+from spaceone.inventory.libs.scheduler import WorkScheduler
+from spaceone.inventory.libs.tag_index import TagIndex
+from spaceone.inventory.libs.stream import stream_concurrently
 from spaceone.inventory.libs.schema.resource import (
     RegionResource,
     RegionResponse,
@@ -88,56 +92,46 @@ class CollectorService(BaseService):
             params.get("options", {})
         )
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKER) as executor:
-            future_executors = []
-
-            for execute_manager in target_execute_managers:
-                _manager = self.locator.get_manager(execute_manager)
-                future_executors.append(
-                    executor.submit(_manager.collect_resources, **params)
-                )
-
-            for future in concurrent.futures.as_completed(future_executors):
-                for result in future.result():
-                    try:
-                        if getattr(result, "resource", None) and getattr(
-                            result.resource, "region_code", None
-                        ):
-                            collected_region = self.get_region_from_result(
-                                result.resource.region_code
-                            )
-
-                            if (
-                                collected_region
-                                and collected_region.resource.region_code
-                                not in collected_region_code
-                            ):
-                                resource_regions.append(collected_region)
-                                collected_region_code.append(
-                                    collected_region.resource.region_code
-                                )
-
-                    except Exception as e:
-                        _LOGGER.error(f"[collect] {e}")
-
-                        if type(e) is dict:
-                            error_resource_response = ErrorResourceResponse(
-                                {
-                                    "message": json.dumps(e),
-                                    "resource": {"resource_type": "inventory.Region"},
-                                }
-                            )
-                        else:
-                            error_resource_response = ErrorResourceResponse(
-                                {
-                                    "message": str(e),
-                                    "resource": {"resource_type": "inventory.Region"},
-                                }
-                            )
-
-                        yield error_resource_response
-
-                    yield result
+        for result in self._stream_resources(params, target_execute_managers):
+            try:
+                if getattr(result, "resource", None) and getattr(
+                    result.resource, "region_code", None
+                ):
+                    collected_region = self.get_region_from_result(
+                        result.resource.region_code
+                    )
+
+                    if (
+                        collected_region
+                        and collected_region.resource.region_code
+                        not in collected_region_code
+                    ):
+                        resource_regions.append(collected_region)
+                        collected_region_code.append(
+                            collected_region.resource.region_code
+                        )
+
+            except Exception as e:
+                _LOGGER.error(f"[collect] {e}")
+
+                if type(e) is dict:
+                    error_resource_response = ErrorResourceResponse(
+                        {
+                            "message": json.dumps(e),
+                            "resource": {"resource_type": "inventory.Region"},
+                        }
+                    )
+                else:
+                    error_resource_response = ErrorResourceResponse(
+                        {
+                            "message": str(e),
+                            "resource": {"resource_type": "inventory.Region"},
+                        }
+                    )
+
+                yield error_resource_response
+
+            yield result
 
         # ## This code for test without async job
         # for execute_manager in self.execute_managers:
@@ -151,6 +145,36 @@ class CollectorService(BaseService):
         for resource_region in resource_regions:
             yield resource_region
 
+    def _stream_resources(self, params, execute_managers):
+        """
+        Every manager consumes its connector on its own thread, while the actual requests run
+        as (service, region, request_method) tasks on one WorkScheduler of MAX_WORKER threads.
+        EC2 describe results needed by several connectors are loaded once into a shared EC2Snapshot,
+        and resource tags are looked up by ARN in a shared TagIndex.
+        """
+        scheduler = WorkScheduler(MAX_WORKER)
+        ec2_snapshot = EC2Snapshot()
+        tag_index = TagIndex()
+        producers = [
+            partial(
+                self.locator.get_manager(execute_manager).collect_resources,
+                scheduler=scheduler,
+                ec2_snapshot=ec2_snapshot,
+                tag_index=tag_index,
+                **params,
+            )
+            for execute_manager in execute_managers
+        ]
+
+        stream_queue_size = params.get("options", {}).get(
+            "stream_queue_size", STREAM_QUEUE_SIZE
+        )
+
+        try:
+            yield from stream_concurrently(producers, len(producers), stream_queue_size)
+        finally:
+            scheduler.shutdown()
+
     def get_region_from_result(self, region_code):
         region_resource = self.match_region_info(region_code)
 
@@ -169,14 +193,12 @@ class CollectorService(BaseService):
 
     @staticmethod
     def get_account_id(secret_data, region=DEFAULT_REGION):
-        _session = get_session(secret_data, region)
-        sts_client = _session.client("sts", verify=BOTO3_HTTPS_VERIFIED)
+        sts_client = get_client(secret_data, region, "sts")
         return sts_client.get_caller_identity()["Account"]
 
     @staticmethod
     def get_regions(secret_data):
-        _session = get_session(secret_data, DEFAULT_REGION)
-        ec2_client = _session.client("ec2", verify=BOTO3_HTTPS_VERIFIED)
+        ec2_client = get_client(secret_data, DEFAULT_REGION, "ec2")
 
         return list(
             map(